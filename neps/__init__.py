@@ -1,13 +1,53 @@
-from neps.api import run
-from neps.optimizers import algorithms
-from neps.optimizers.ask_and_tell import AskAndTell
-from neps.optimizers.optimizer import SampledConfig
-from neps.plot.plot import plot
-from neps.plot.tensorboard_eval import tblogger
-from neps.space import Categorical, Constant, Float, Integer, SearchSpace
-from neps.state import BudgetInfo, Trial
-from neps.status.status import status
-from neps.utils.files import load_and_merge_yamls as load_yamls
+"""Neural Pipeline Search.
+
+The public attributes are imported lazily on first access (PEP 562), such that
+importing `neps`, or any of its submodules, does not pay for the heavy dependencies of
+the parts which are not used, e.g. torch and botorch when only using random search.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from neps.api import run
+    from neps.optimizers import algorithms
+    from neps.optimizers.ask_and_tell import AskAndTell
+    from neps.optimizers.optimizer import SampledConfig
+    from neps.plot.plot import plot
+    from neps.plot.tensorboard_eval import tblogger
+    from neps.space import Categorical, Constant, Float, Integer, SearchSpace
+    from neps.state import BudgetInfo, Trial
+    from neps.status.status import status
+    from neps.utils.files import load_and_merge_yamls as load_yamls
+
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {
+    "AskAndTell": ("neps.optimizers.ask_and_tell", "AskAndTell"),
+    "BudgetInfo": ("neps.state", "BudgetInfo"),
+    "Categorical": ("neps.space", "Categorical"),
+    "Constant": ("neps.space", "Constant"),
+    "Float": ("neps.space", "Float"),
+    "Integer": ("neps.space", "Integer"),
+    "SampledConfig": ("neps.optimizers.optimizer", "SampledConfig"),
+    "SearchSpace": ("neps.space", "SearchSpace"),
+    "Trial": ("neps.state", "Trial"),
+    "algorithms": ("neps.optimizers.algorithms", None),
+    "load_yamls": ("neps.utils.files", "load_and_merge_yamls"),
+    "plot": ("neps.plot.plot", "plot"),
+    "run": ("neps.api", "run"),
+    "status": ("neps.status.status", "status"),
+    "tblogger": ("neps.plot.tensorboard_eval", "tblogger"),
+}
+"""The public attributes, mapped to the module they come from and their name there,
+or `None` if the attribute is the module itself."""
+
+# `plot` and `status` share their names with subpackages, which the import system sets
+# as attributes of `neps` when they are first imported, hiding the functions. The
+# subpackages are empty, so import them now and remove them again for `__getattr__`.
+import_module("neps.plot")
+import_module("neps.status")
+del globals()["plot"], globals()["status"]
 
 __all__ = [
     "AskAndTell",
@@ -26,3 +66,21 @@ __all__ = [
     "status",
     "tblogger",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    lazy = _LAZY_ATTRIBUTES.get(name)
+    if lazy is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute = lazy
+    module = import_module(module_name)
+    value = module if attribute is None else getattr(module, attribute)
+
+    # Cache it, such that `__getattr__` is not called again for it
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
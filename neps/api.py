@@ -4,14 +4,13 @@ from __future__ import annotations
 
 import logging
 import warnings
-from collections.abc import Callable, Mapping
+from collections.abc import Awaitable, Callable, Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Concatenate, Literal
 
 from neps.optimizers import AskFunction, OptimizerChoice, load_optimizer
 from neps.runtime import _launch_runtime
 from neps.space.parsing import convert_to_space
-from neps.status.status import post_run_csv
 from neps.utils.common import dynamic_load_object
 
 if TYPE_CHECKING:
@@ -25,7 +24,11 @@ logger = logging.getLogger(__name__)
 
 
 def run(  # noqa: PLR0913
-    evaluate_pipeline: Callable[..., EvaluatePipelineReturn] | str,
+    evaluate_pipeline: (
+        Callable[..., EvaluatePipelineReturn]
+        | Callable[..., Awaitable[EvaluatePipelineReturn]]
+        | str
+    ),
     pipeline_space: (
         Mapping[str, dict | str | int | float | Parameter]
         | SearchSpace
@@ -43,6 +46,9 @@ def run(  # noqa: PLR0913
     objective_value_on_error: float | None = None,
     cost_value_on_error: float | None = None,
     sample_batch_size: int | None = None,
+    prefetch_trials: int | None = None,
+    max_concurrent_evaluations: int = 1,
+    n_workers: int = 1,
     optimizer: (
         OptimizerChoice
         | Mapping[str, Any]
@@ -59,6 +65,8 @@ def run(  # noqa: PLR0913
         To run with multiple processes or machines, execute the script that
         calls `neps.run()` multiple times. They will keep in sync using
         the file-sytem, requiring that `root_directory` be shared between them.
+        To use several processes on a single machine, you can also simply set
+        `n_workers=`.
 
 
     ```python
@@ -123,6 +131,11 @@ def run(  # noqa: PLR0913
                 to specify the function to call. You may also directly provide
                 an mode to import, e.g., `"my.module.something:evaluate_pipeline"`.
 
+            ??? note "`async def` evaluation functions"
+
+                If it is an `#!python async def` function, several evaluations
+                can run at once, see `max_concurrent_evaluations=`.
+
         pipeline_space: The search space to minimize over.
 
             This most direct way to specify the search space is as follows:
@@ -243,6 +256,67 @@ def run(  # noqa: PLR0913
                 evaluations, even if they were to come in relatively
                 quickly.
 
+        prefetch_trials:
+            The number of pending configurations to keep ready for workers to
+            pick up, sampled in the background.
+
+            ??? tip "When to use this?"
+
+                Much like `sample_batch_size`, this is useful when the optimizer's
+                sample time prevents full worker utilization. Rather than having
+                a worker stop evaluating to sample a batch, one worker is elected
+                to sample configurations in a background thread, while it and
+                every other worker keep evaluating. Pending configurations are
+                taken into account by the optimizer when sampling the next one.
+
+                If the elected worker stops, another one takes over.
+
+            ??? warning "Downsides of prefetching"
+
+                As with batching, the prefetched configurations will not take
+                into account the results of evaluations which finish after they
+                were sampled. Keep this at roughly the number of workers.
+
+        max_concurrent_evaluations:
+            The number of evaluations to run at once in this process, if
+            `evaluate_pipeline` is an `#!python async def` function.
+
+            ??? tip "When to use this?"
+
+                This is meant for evaluations which spend most of their time
+                waiting, such as submitting a training job to a cluster and
+                polling for its result, or calling out to a remote simulator.
+                Rather than launching a process per evaluation, a single
+                process can then keep many of them in flight.
+
+                ```python
+                async def evaluate_pipeline(learning_rate: float) -> float:
+                    job = await submit_training_job(learning_rate)
+                    return await job.result()
+
+                neps.run(
+                    evaluate_pipeline,
+                    ...,
+                    max_concurrent_evaluations=32,
+                )
+                ```
+
+        n_workers:
+            The number of processes to evaluate in on this machine.
+
+            If more than one, this process starts and supervises that many child
+            processes. It samples the configurations and keeps the results, while
+            the children only evaluate them, which avoids every process having to
+            keep in sync through the `root_directory=`. If a child process dies,
+            the configuration it was evaluating is given to another one.
+
+            !!! note
+
+                On platforms where new processes are not forked, such as Windows
+                and macOS, `evaluate_pipeline` must be importable, i.e. not defined
+                in the script you run, and the call to `neps.run()` must be guarded
+                by `#!python if __name__ == "__main__":`.
+
         optimizer: Which optimizer to use.
 
             Not sure which to use? Leave this at `"auto"` and neps will
@@ -395,6 +469,14 @@ def run(  # noqa: PLR0913
                 runtime to run your optimizer.
 
     """  # noqa: E501
+    for name, value in (
+        ("prefetch_trials", prefetch_trials),
+        ("max_concurrent_evaluations", max_concurrent_evaluations),
+        ("n_workers", n_workers),
+    ):
+        if value is not None and value < 1:
+            raise ValueError(f"`{name}=` should be greater than 0, got {value}.")
+
     if (
         max_evaluations_total is None
         and max_evaluations_per_run is None
@@ -445,9 +527,15 @@ def run(  # noqa: PLR0913
         ignore_errors=ignore_errors,
         overwrite_optimization_dir=overwrite_working_directory,
         sample_batch_size=sample_batch_size,
+        prefetch_trials=prefetch_trials,
+        max_concurrent_evaluations=max_concurrent_evaluations,
+        n_workers=n_workers,
     )
 
     if post_run_summary:
+        # Imported here as it pulls in pandas, which workers do not need otherwise
+        from neps.status.status import post_run_csv
+
         full_frame_path, short_path = post_run_csv(root_directory)
         logger.info(
             "The post run summary has been created, which is a csv file with the "
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import os
 from collections.abc import Callable
-from typing import Any, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+if TYPE_CHECKING:
+    from neps.state.notify import NotifyMethod
 
 T = TypeVar("T")
 V = TypeVar("V")
@@ -28,6 +31,20 @@ def is_nullable(e: str) -> bool:
     return e.lower() in ("none", "n", "null")
 
 
+def storage_backend(e: str) -> Literal["filebased", "sqlite"]:
+    """Check if an environment variable is a known storage backend."""
+    if e.lower() in ("filebased", "sqlite"):
+        return e.lower()  # type: ignore
+    raise ValueError(f"Expected 'filebased' or 'sqlite', got '{e}'.")
+
+
+def notify_method(e: str) -> Literal["auto", "inotify", "poll"]:
+    """Check if an environment variable is a known way of waiting for changes."""
+    if e.lower() in ("auto", "inotify", "poll"):
+        return e.lower()  # type: ignore
+    raise ValueError(f"Expected 'auto', 'inotify' or 'poll', got '{e}'.")
+
+
 def yaml_or_json(e: str) -> Literal["yaml", "json"]:
     """Check if an environment variable is either yaml or json."""
     if e.lower() in ("yaml", "json"):
@@ -105,10 +122,55 @@ GLOBAL_ERR_FILELOCK_TIMEOUT = get_env(
     parse=lambda e: None if is_nullable(e) else float(e),
     default=120,
 )
-TRIAL_CACHE_MAX_UPDATES_BEFORE_CONSOLIDATION = get_env(
-    "NEPS_TRIAL_CACHE_MAX_UPDATES_BEFORE_CONSOLIDATION",
+STATE_NOTIFY_METHOD: NotifyMethod = get_env(
+    "NEPS_STATE_NOTIFY_METHOD",
+    parse=notify_method,
+    default="auto",
+)
+STATE_NOTIFY_MAX_WAIT = get_env(
+    "NEPS_STATE_NOTIFY_MAX_WAIT",
+    parse=float,
+    default=1.0,
+)
+LOCAL_WORKERS_START_METHOD = get_env(
+    "NEPS_LOCAL_WORKERS_START_METHOD",
+    parse=lambda e: None if is_nullable(e) else e,
+    default=None,
+)
+REPORT_BATCH_WINDOW = get_env(
+    "NEPS_REPORT_BATCH_WINDOW",
+    parse=float,
+    default=0.0,
+)
+PREFETCH_SAMPLER_POLL = get_env(
+    "NEPS_PREFETCH_SAMPLER_POLL",
+    parse=float,
+    default=0.5,
+)
+TRIAL_LEASE_DURATION = get_env(
+    "NEPS_TRIAL_LEASE_DURATION",
+    parse=lambda e: None if is_nullable(e) else float(e),
+    default=600,
+)
+TRIAL_LOG_SEGMENT_MAX_BYTES = get_env(
+    "NEPS_TRIAL_LOG_SEGMENT_MAX_BYTES",
     parse=int,
-    default=10,
+    default=2**20,  # 1MiB, roughly a thousand trial updates
+)
+TRIAL_LOG_COMPACT_AFTER_SEGMENTS = get_env(
+    "NEPS_TRIAL_LOG_COMPACT_AFTER_SEGMENTS",
+    parse=int,
+    default=4,
+)
+STATE_STORAGE_BACKEND: Literal["filebased", "sqlite"] = get_env(  # type: ignore
+    "NEPS_STATE_STORAGE_BACKEND",
+    parse=storage_backend,
+    default="filebased",
+)
+SQLITE_JOURNAL_MODE = get_env(
+    "NEPS_SQLITE_JOURNAL_MODE",
+    parse=str.upper,
+    default="WAL",
 )
 CONFIG_SERIALIZE_FORMAT: Literal["yaml", "json"] = get_env(  # type: ignore
     "NEPS_CONFIG_SERIALIZE_FORMAT",
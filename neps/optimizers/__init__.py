@@ -1,20 +1,34 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping
+from importlib import import_module
 from typing import TYPE_CHECKING, Any, Concatenate, Literal
 
-from neps.optimizers.algorithms import (
-    CustomOptimizer,
-    OptimizerChoice,
-    PredefinedOptimizers,
-    determine_optimizer_automatically,
-)
 from neps.optimizers.optimizer import AskFunction, OptimizerInfo
 from neps.utils.common import extract_keyword_defaults
 
 if TYPE_CHECKING:
+    from neps.optimizers.algorithms import CustomOptimizer, OptimizerChoice
     from neps.space import SearchSpace
 
+# `algorithms` is only imported once needed, as it pulls in torch. Its names used to
+# be imported here and are still available from here, lazily.
+_LAZY_ALGORITHMS_ATTRIBUTES = (
+    "CustomOptimizer",
+    "OptimizerChoice",
+    "PredefinedOptimizers",
+    "determine_optimizer_automatically",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ALGORITHMS_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module("neps.optimizers.algorithms"), name)
+    globals()[name] = value
+    return value
+
 
 def _load_optimizer_from_string(
     optimizer: OptimizerChoice | Literal["auto"],
@@ -22,6 +36,11 @@ def _load_optimizer_from_string(
     *,
     optimizer_kwargs: Mapping[str, Any] | None = None,
 ) -> tuple[AskFunction, OptimizerInfo]:
+    from neps.optimizers.algorithms import (
+        PredefinedOptimizers,
+        determine_optimizer_automatically,
+    )
+
     if optimizer == "auto":
         _optimizer = determine_optimizer_automatically(space)
     else:
@@ -53,6 +72,8 @@ def load_optimizer(
     ),
     space: SearchSpace,
 ) -> tuple[AskFunction, OptimizerInfo]:
+    from neps.optimizers.algorithms import CustomOptimizer
+
     match optimizer:
         # Predefined string (including "auto")
         case str():
@@ -27,27 +27,30 @@ from typing import TYPE_CHECKING, Any, Concatenate, Literal, TypeAlias
 import torch
 
 from neps.optimizers.ask_and_tell import AskAndTell  # noqa: F401
-from neps.optimizers.bayesian_optimization import BayesianOptimization
-from neps.optimizers.bracket_optimizer import BracketOptimizer, GPSampler
-from neps.optimizers.grid_search import GridSearch
-from neps.optimizers.ifbo import IFBO
-from neps.optimizers.models.ftpfn import FTPFNSurrogate
-from neps.optimizers.optimizer import AskFunction  # noqa: TC001
-from neps.optimizers.priorband import PriorBandSampler
-from neps.optimizers.random_search import RandomSearch
 from neps.sampling import Prior, Sampler, Uniform
 from neps.space.encoding import CategoricalToUnitNorm, ConfigEncoder
 
+# NOTE: The optimizers are imported in the functions creating them, such that only
+# the dependencies of the optimizer actually used get imported, e.g. random search
+# does not need to import botorch.
 if TYPE_CHECKING:
     import pandas as pd
 
+    from neps.optimizers.bayesian_optimization import BayesianOptimization
+    from neps.optimizers.bracket_optimizer import BracketOptimizer
+    from neps.optimizers.grid_search import GridSearch
+    from neps.optimizers.ifbo import IFBO
+    from neps.optimizers.models.gp import GPSurrogate
+    from neps.optimizers.optimizer import AskFunction
+    from neps.optimizers.priorband import PriorBandSampler
+    from neps.optimizers.random_search import RandomSearch
     from neps.optimizers.utils.brackets import Bracket
     from neps.space import SearchSpace
 
 logger = logging.getLogger(__name__)
 
 
-def _bo(
+def _bo(  # noqa: C901, PLR0912
     pipeline_space: SearchSpace,
     *,
     initial_design_size: int | Literal["ndim"] = "ndim",
@@ -57,6 +60,9 @@ def _bo(
     ignore_fidelity: bool = False,
     device: torch.device | str | None,
     reference_point: tuple[float, ...] | None = None,
+    refit_gp_every: int = 1,
+    surrogate: GPSurrogate = "exact",
+    acquisition_workers: int = 1,
 ) -> BayesianOptimization:
     """Initialise the BO loop.
 
@@ -80,11 +86,20 @@ def _bo(
             In this case, the max fidelity is always used.
         device: Device to use for the optimization.
         reference_point: The reference point to use for multi-objective optimization.
+        refit_gp_every: The number of new observations required before refitting
+            the GP's hyperparameters.
+        surrogate: The kind of GP to use.
+        acquisition_workers: The number of forked processes to optimize the
+            acquisition function in.
 
     Raises:
         ValueError: if initial_design_size < 1
+        ValueError: if refit_gp_every < 1
+        ValueError: if acquisition_workers < 1
         ValueError: if fidelity is not None and ignore_fidelity is False
     """
+    from neps.optimizers.bayesian_optimization import BayesianOptimization
+
     if not ignore_fidelity and pipeline_space.fidelity is not None:
         raise ValueError(
             "Fidelities are not supported for BayesianOptimization. Consider setting the"
@@ -120,6 +135,12 @@ def _bo(
         case _:
             raise ValueError("device should be a string, torch.device or None")
 
+    if refit_gp_every < 1:
+        raise ValueError("refit_gp_every should be greater than 0")
+
+    if acquisition_workers < 1:
+        raise ValueError("acquisition_workers should be greater than 0")
+
     return BayesianOptimization(
         space=pipeline_space,
         encoder=ConfigEncoder.from_parameters(parameters),
@@ -129,6 +150,9 @@ def _bo(
         sample_prior_first=sample_prior_first,
         device=device,
         reference_point=reference_point,
+        refit_gp_every=refit_gp_every,
+        surrogate=surrogate,
+        acquisition_workers=acquisition_workers,
     )
 
 
@@ -147,6 +171,8 @@ def _bracket_optimizer(  # noqa: C901, PLR0912, PLR0915
     device: torch.device | None,
     mo_selector: Literal["nsga2", "epsnet"] = "epsnet",
     multi_objective: bool = False,
+    surrogate: GPSurrogate = "exact",
+    acquisition_workers: int = 1,
 ) -> BracketOptimizer:
     """Initialise a bracket optimizer.
 
@@ -204,6 +230,9 @@ def _bracket_optimizer(  # noqa: C901, PLR0912, PLR0915
 
         multi_objective: Whether to use multi-objective promotion strategies.
             Only used in case of multi-objective multi-fidelity algorithms.
+        surrogate: If using Bayesian Optimization, the kind of GP to use.
+        acquisition_workers: If using Bayesian Optimization, the number of forked
+            processes to optimize the acquisition function in.
     """
     if pipeline_space.fidelity is not None:
         fidelity_name, fidelity = pipeline_space.fidelity
@@ -240,6 +269,8 @@ def _bracket_optimizer(  # noqa: C901, PLR0912, PLR0915
             f"\nGot fidelity: {pipeline_space.fidelities}"
         )
 
+    from neps.optimizers.bracket_optimizer import BracketOptimizer, GPSampler
+    from neps.optimizers.priorband import PriorBandSampler
     from neps.optimizers.utils import brackets
 
     # Determine the strategy for creating brackets for sampling
@@ -336,6 +367,8 @@ def _bracket_optimizer(  # noqa: C901, PLR0912, PLR0915
             raise ValueError(
                 "bayesian_optimization_kick_in_point should be greater than 0"
             )
+        if acquisition_workers < 1:
+            raise ValueError("acquisition_workers should be greater than 0")
 
         # TODO: Parametrize?
         # NOTE: Deviation from PriorBand paper, which used 10
@@ -354,6 +387,8 @@ def _bracket_optimizer(  # noqa: C901, PLR0912, PLR0915
             fidelity_max=fidelity.upper,
             two_stage_batch_sample_size=two_stage_batch_sample_size,
             device=device,
+            surrogate=surrogate,
+            acquisition_workers=acquisition_workers,
         )
     else:
         gp_sampler = None
@@ -409,6 +444,8 @@ def random_search(
         ignore_fidelity: Whether to ignore fidelity when sampling.
             In this case, the max fidelity is always used.
     """
+    from neps.optimizers.random_search import RandomSearch
+
     assert ignore_fidelity in (
         True,
         False,
@@ -475,6 +512,7 @@ def grid_search(
         ignore_fidelity: Whether to ignore fidelity when sampling.
             In this case, the max fidelity is always used.
     """
+    from neps.optimizers.grid_search import GridSearch
     from neps.optimizers.utils.grid import make_grid
 
     if any(
@@ -502,6 +540,9 @@ def ifbo(
     device: torch.device | str | None = None,
     surrogate_path: str | Path | None = None,
     surrogate_version: str = "0.0.1",
+    n_acquisition_samples: int = 1280,
+    n_local_search_samples: int = 256,
+    acquisition_batch_size: int | None = None,
 ) -> IFBO:
     """A transformer that has been trained to predict loss curves of deep-learing
     models, used to guide the optimization procedure and select configurations which
@@ -542,8 +583,17 @@ def ifbo(
         device: Device to use for the model
         surrogate_path: Path to the surrogate model to use
         surrogate_version: Version of the surrogate model to use
+        n_acquisition_samples: The number of random samples to score when maximizing
+            the acquisition, split between sobol, uniform and border samples
+            in the ratio 2:2:1.
+        n_local_search_samples: The number of samples to score around the best
+            sobol, uniform and border sample.
+        acquisition_batch_size: The maximum number of samples to score in a single
+            forward pass of the surrogate. If `None`, all samples of a round of
+            acquisition are scored at once, which is fastest but uses the most memory.
     """
-    from neps.optimizers.ifbo import _adjust_space_to_match_stepsize
+    from neps.optimizers.ifbo import IFBO, _adjust_space_to_match_stepsize
+    from neps.optimizers.models.ftpfn import FTPFNSurrogate
 
     if pipeline_space.fidelity is None:
         raise ValueError("Fidelity is required for IFBO.")
@@ -587,9 +637,21 @@ def ifbo(
         case _:
             raise ValueError("device should be a string, torch.device or None")
 
+    if acquisition_batch_size is not None and acquisition_batch_size < 1:
+        raise ValueError(
+            f"acquisition_batch_size must be at least 1, got {acquisition_batch_size}."
+        )
+
+    n_border_samples = n_acquisition_samples // 5
+    n_sobol_samples = (n_acquisition_samples - n_border_samples) // 2
     return IFBO(
         space=pipeline_space,
         n_fidelity_bins=fid_bins,
+        n_sobol_samples=n_sobol_samples,
+        n_uniform_samples=n_acquisition_samples - n_border_samples - n_sobol_samples,
+        n_border_samples=n_border_samples,
+        n_local_search_samples=n_local_search_samples,
+        acquisition_batch_size=acquisition_batch_size,
         device=device,
         sample_prior_first=sample_prior_first,
         n_initial_design=_initial_design_size,
@@ -938,6 +1000,8 @@ def priorband(
     sample_prior_first: bool | Literal["highest_fidelity"] = False,
     base: Literal["successive_halving", "hyperband", "asha", "async_hb"] = "hyperband",
     bayesian_optimization_kick_in_point: int | float | None = None,
+    surrogate: GPSurrogate = "exact",
+    acquisition_workers: int = 1,
 ) -> BracketOptimizer:
     """Priorband is also a bandit-based optimization algorithm that uses a _fidelity_,
     providing a general purpose sampling extension to other algorithms. It makes better
@@ -975,6 +1039,13 @@ def priorband(
         bayesian_optimization_kick_in_point: If a number `N`, after
             `N` * `maximum_fidelity` worth of fidelity has been evaluated,
             proceed with bayesian optimization when sampling a new configuration.
+        surrogate: The kind of GP to use once bayesian optimization kicked in, see
+            [`bayesian_optimization`][neps.optimizers.algorithms.bayesian_optimization].
+            As the GP is fit on the evaluations at all fidelities, consider using
+            `"variational"` for long runs.
+        acquisition_workers: The number of forked processes to optimize the
+            acquisition function in, see
+            [`bayesian_optimization`][neps.optimizers.algorithms.bayesian_optimization].
     """
     if all(parameter.prior is None for parameter in space.searchables.values()):
         logger.warning(
@@ -990,6 +1061,8 @@ def priorband(
         early_stopping_rate=0 if base in ("successive_halving", "asha") else None,
         bayesian_optimization_kick_in_point=bayesian_optimization_kick_in_point,
         device=None,
+        surrogate=surrogate,
+        acquisition_workers=acquisition_workers,
     )
 
 
@@ -1001,6 +1074,9 @@ def bayesian_optimization(
     ignore_fidelity: bool = False,
     device: torch.device | str | None = None,
     reference_point: tuple[float, ...] | None = None,
+    refit_gp_every: int = 1,
+    surrogate: GPSurrogate = "exact",
+    acquisition_workers: int = 1,
 ) -> BayesianOptimization:
     """Models the relation between hyperparameters in your `pipeline_space`
     and the results of `evaluate_pipeline` using bayesian optimization.
@@ -1051,6 +1127,22 @@ def bayesian_optimization(
         reference_point: The reference point to use got multi-objective bayesian
             optimization. If `None`, the reference point will be calculated
             automatically.
+        refit_gp_every: The number of new observations required before refitting
+            the GP's hyperparameters. Every fit is warm-started from the previous
+            one and in between, the previously fitted hyperparameters are reused.
+            Increase this to reduce the time spent sampling once many
+            configurations have been evaluated.
+        surrogate: The kind of GP to model the objective with. The default
+            `"exact"` GP becomes impractical beyond a few thousand evaluated
+            configurations, at which point `"variational"`, a sparse GP with a fixed
+            number of inducing points, keeps the time and memory to fit it linear
+            in the number of configurations.
+        acquisition_workers: The number of processes to optimize the acquisition
+            function in, spreading its restarts, or the categorical combinations of
+            mixed spaces, over the cores of the machine sampling. The processes are
+            forked from the worker, which can deadlock them if another of its threads
+            holds a lock at the time, so this is only worth it on a machine dedicated
+            to sampling, see [`optimize_acq()`][neps.optimizers.models.gp.optimize_acq].
     """
 
     if not ignore_fidelity and space.fidelity is not None:
@@ -1085,6 +1177,9 @@ def bayesian_optimization(
         sample_prior_first=False,
         ignore_fidelity=ignore_fidelity,
         reference_point=reference_point,
+        refit_gp_every=refit_gp_every,
+        surrogate=surrogate,
+        acquisition_workers=acquisition_workers,
     )
 
 
@@ -1096,6 +1191,9 @@ def pibo(
     device: torch.device | str | None = None,
     sample_prior_first: bool = False,
     ignore_fidelity: bool = False,
+    refit_gp_every: int = 1,
+    surrogate: GPSurrogate = "exact",
+    acquisition_workers: int = 1,
 ) -> BayesianOptimization:
     """A modification of
     [`bayesian_optimization`][neps.optimizers.algorithms.bayesian_optimization]
@@ -1126,6 +1224,13 @@ def pibo(
         sample_prior_first: Whether to sample the prior configuration first.
         ignore_fidelity: Whether to ignore the fidelity parameter when sampling.
             In this case, the max fidelity is always used.
+        refit_gp_every: The number of new observations required before refitting
+            the GP's hyperparameters.
+        surrogate: The kind of GP to model the objective with, see
+            [`bayesian_optimization`][neps.optimizers.algorithms.bayesian_optimization].
+        acquisition_workers: The number of forked processes to optimize the
+            acquisition function in, see
+            [`bayesian_optimization`][neps.optimizers.algorithms.bayesian_optimization].
     """
     if all(parameter.prior is None for parameter in space.searchables.values()):
         logger.warning(
@@ -1146,6 +1251,9 @@ def pibo(
         use_priors=True,
         sample_prior_first=sample_prior_first,
         ignore_fidelity=ignore_fidelity,
+        refit_gp_every=refit_gp_every,
+        surrogate=surrogate,
+        acquisition_workers=acquisition_workers,
     )
 
 
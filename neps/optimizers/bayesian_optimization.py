@@ -3,8 +3,8 @@ from __future__ import annotations
 import itertools
 import math
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Literal
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 import torch
@@ -13,17 +13,26 @@ from botorch.acquisition.logei import qLogNoisyExpectedImprovement
 from botorch.acquisition.multi_objective.logei import (
     qLogNoisyExpectedHypervolumeImprovement,
 )
+from botorch.models import SingleTaskGP
 from botorch.models.transforms.outcome import Standardize
 
 from neps.optimizers.models.gp import (
+    GPEncodedData,
+    GPSurrogate,
+    IncrementalGP,
+    acquisition_baseline,
     encode_trials_for_gp,
     fit_and_acquire_from_gp,
+    fit_gp,
     make_default_single_obj_gp,
 )
 from neps.optimizers.optimizer import SampledConfig
 from neps.optimizers.utils.initial_design import make_initial_design
+from neps.space.encoding import EncodedConfigCache
 
 if TYPE_CHECKING:
+    from botorch.models.approximate_gp import SingleTaskVariationalGP
+
     from neps.sampling import Prior
     from neps.space import ConfigEncoder, SearchSpace
     from neps.state import BudgetInfo, Trial
@@ -87,6 +96,29 @@ class BayesianOptimization:
     reference_point: tuple[float, ...] | None = None
     """The reference point to use for the multi-objective optimization."""
 
+    refit_gp_every: int = 1
+    """The number of new observations required before refitting the GP's
+    hyperparameters. In between, the last fitted hyperparameters are reused."""
+
+    surrogate: GPSurrogate = "exact"
+    """The kind of GP to use, see
+    [`GPSurrogate`][neps.optimizers.models.gp.GPSurrogate]."""
+
+    acquisition_workers: int = 1
+    """The number of forked processes to optimize the acquisition function in, see
+    [`optimize_acq()`][neps.optimizers.models.gp.optimize_acq]."""
+
+    shared_state: dict[str, Any] | None = field(default=None, init=False, repr=False)
+    """State shared between workers, holding the last fitted GP hyperparameters
+    to warm-start the next fit from. Managed by the runtime, see
+    [`SharesState`][neps.optimizers.optimizer.SharesState]."""
+
+    _incremental_gp: IncrementalGP | None = field(default=None, init=False, repr=False)
+    _encoded_configs: EncodedConfigCache = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._encoded_configs = EncodedConfigCache(self.encoder, device=self.device)
+
     def __call__(  # noqa: C901, PLR0912, PLR0915  # noqa: C901, PLR0912
         self,
         trials: Mapping[str, Trial],
@@ -157,6 +189,7 @@ class BayesianOptimization:
             parameters,
             device=self.device,
             encoder=self.encoder,
+            cache=self._encoded_configs,
         )
 
         cost_percent = None
@@ -222,6 +255,7 @@ class BayesianOptimization:
                 y=data.y,
                 encoder=encoder,
                 y_transform=Standardize(m=data.y.shape[-1]),
+                surrogate=self.surrogate,
             )
             if self.reference_point is not None:
                 assert len(self.reference_point) == num_objectives, (
@@ -239,18 +273,24 @@ class BayesianOptimization:
                     dtype=data.x.dtype,
                     device=data.x.device,
                 )
+            gp = self._fit_gp(gp, data)
             acquisition = qLogNoisyExpectedHypervolumeImprovement(
                 model=gp,
                 ref_point=ref_point,
-                X_baseline=data.x,
+                X_baseline=acquisition_baseline(data, self.surrogate),
                 X_pending=data.x_pending,
                 prune_baseline=True,
+                # Caching the root decomposition requires an exact posterior
+                cache_root=self.surrogate == "exact",
             )
         else:
-            gp = make_default_single_obj_gp(x=data.x, y=data.y, encoder=encoder)
+            gp = make_default_single_obj_gp(
+                x=data.x, y=data.y, encoder=encoder, surrogate=self.surrogate
+            )
+            gp = self._fit_gp(gp, data)
             acquisition = qLogNoisyExpectedImprovement(
                 model=gp,
-                X_baseline=data.x,
+                X_baseline=acquisition_baseline(data, self.surrogate),
                 # Unfortunatly, there's no option to indicate that we minimize
                 # the AcqFunction so we need to do some kind of transformation.
                 # https://github.com/pytorch/botorch/issues/2316#issuecomment-2085964607
@@ -270,6 +310,9 @@ class BayesianOptimization:
             cost_percentage_used=cost_percent,
             costs_on_log_scale=self.cost_aware == "log",
             hide_warnings=True,
+            fit=False,
+            surrogate=self.surrogate,
+            acquisition_workers=self.acquisition_workers,
         )
 
         configs = encoder.decode(candidates)
@@ -293,6 +336,30 @@ class BayesianOptimization:
         )
         return sampled_configs[0] if n is None else sampled_configs
 
+    def _fit_gp(
+        self,
+        gp: SingleTaskGP | SingleTaskVariationalGP,
+        data: GPEncodedData,
+    ) -> SingleTaskGP | SingleTaskVariationalGP:
+        shared_state = self.shared_state or {}
+        warm_start = shared_state.get("gp_fit_state")
+        fit_state = fit_gp(gp, warm_start=warm_start, refit_every=self.refit_gp_every)
+
+        # If the hyperparameters were reused, the GP we kept from the last ask can
+        # be updated with the new observations, instead of factorizing from scratch.
+        if fit_state is warm_start and self._incremental_gp is not None:
+            updated = self._incremental_gp.condition_on(data, fit_state=fit_state)
+            if updated is not None:
+                return updated
+
+        self.shared_state = {**shared_state, "gp_fit_state": fit_state}
+        self._incremental_gp = (
+            IncrementalGP(gp=gp, fit_state=fit_state, trial_ids=list(data.trial_ids))
+            if isinstance(gp, SingleTaskGP)
+            else None
+        )
+        return gp
+
 
 def _get_reference_point(loss_vals: np.ndarray) -> np.ndarray:
     """Get the reference point from the completed Trials."""
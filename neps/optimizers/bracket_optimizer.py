@@ -2,30 +2,23 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable, Mapping, Sequence
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Literal
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 import pandas as pd
 import torch
-from botorch.acquisition.multi_objective.parego import qLogNoisyExpectedImprovement
-from botorch.acquisition.objective import LinearMCObjective
-from gpytorch.utils.warnings import NumericalWarning
-
-from neps.optimizers.models.gp import (
-    encode_trials_for_gp,
-    fit_and_acquire_from_gp,
-    make_default_single_obj_gp,
-)
+
 from neps.optimizers.optimizer import SampledConfig
 from neps.optimizers.priorband import PriorBandSampler
+from neps.optimizers.utils.batch import sample_sequentially_with_pending
 from neps.optimizers.utils.brackets import PromoteAction, SampleAction
 from neps.sampling.samplers import Sampler
+from neps.space.encoding import EncodedConfigCache
 from neps.utils.common import disable_warnings
 
 if TYPE_CHECKING:
-    from gpytorch.models.approximate_gp import Any
-
+    from neps.optimizers.models.gp import GPSurrogate
     from neps.optimizers.utils.brackets import Bracket
     from neps.space import SearchSpace
     from neps.space.encoding import ConfigEncoder
@@ -37,34 +30,105 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def trials_to_table(trials: Mapping[str, Trial]) -> pd.DataFrame:
-    id_index = np.empty(len(trials), dtype=int)
-    rungs_index = np.empty(len(trials), dtype=int)
-    perfs = [np.nan] * len(trials)
-    configs = np.empty(len(trials), dtype=object)
+def _trial_row(trial_id: str, trial: Trial) -> tuple[int, int, Any, Mapping[str, Any]]:
+    config_id_str, rung_str = trial_id.split("_")
+    _id, _rung = int(config_id_str), int(rung_str)
+
+    if trial.report is None:
+        perf = np.nan  # Pending
+    elif trial.report.objective_to_minimize is None:
+        perf = np.inf  # Error? Either way, we wont promote it
+    elif isinstance(trial.report.objective_to_minimize, float):
+        perf = trial.report.objective_to_minimize
+    elif isinstance(trial.report.objective_to_minimize, Sequence):
+        perf = np.array(trial.report.objective_to_minimize, dtype=np.float64)
+    else:
+        raise ValueError("Unknown type of objective_to_minimize")
+
+    return _id, _rung, perf, trial.config
+
+
+@dataclass
+class TrialTableCache:
+    """The rows of finished trials in
+    [`trials_to_table()`][neps.optimizers.bracket_optimizer.trials_to_table], kept
+    between calls.
 
-    for i, (trial_id, trial) in enumerate(trials.items()):
-        config_id_str, rung_str = trial_id.split("_")
-        _id, _rung = int(config_id_str), int(rung_str)
+    Once a trial has a report it no longer changes, such that its row only has to be
+    created once. Only new and pending trials are looked at on each call.
+    """
 
+    trial_ids: set[str] = field(default_factory=set)
+    ids: list[int] = field(default_factory=list)
+    rungs: list[int] = field(default_factory=list)
+    perfs: list[Any] = field(default_factory=list)
+    configs: list[Mapping[str, Any]] = field(default_factory=list)
+
+    def add(self, trial_id: str, row: tuple[int, int, Any, Mapping[str, Any]]) -> None:
+        """Add the row of a finished trial."""
+        _id, _rung, perf, config = row
+        self.trial_ids.add(trial_id)
+        self.ids.append(_id)
+        self.rungs.append(_rung)
+        self.perfs.append(perf)
+        self.configs.append(config)
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.trial_ids.clear()
+        self.ids.clear()
+        self.rungs.clear()
+        self.perfs.clear()
+        self.configs.clear()
+
+
+def trials_to_table(
+    trials: Mapping[str, Trial],
+    *,
+    cache: TrialTableCache | None = None,
+) -> pd.DataFrame:
+    """Create a table of the trials, indexed by `(id, rung)`, with the config and
+    its performance, which is `nan` for pending trials.
+
+    Args:
+        trials: The trials to create a table of.
+        cache: The rows of previously seen finished trials, which is updated with
+            the newly finished ones.
+
+    Returns:
+        The table, sorted by its index.
+    """
+    if cache is None:
+        cache = TrialTableCache()
+    elif not cache.trial_ids <= trials.keys():
+        # Some trial we have seen is gone, these are not the same trials anymore
+        cache.clear()
+
+    pending: list[tuple[int, int, Any, Mapping[str, Any]]] = []
+    for trial_id in trials.keys() - cache.trial_ids:
+        trial = trials[trial_id]
+        row = _trial_row(trial_id, trial)
         if trial.report is None:
-            perf = np.nan  # Pending
-        elif trial.report.objective_to_minimize is None:
-            perf = np.inf  # Error? Either way, we wont promote it
-        elif isinstance(trial.report.objective_to_minimize, float):
-            perf = trial.report.objective_to_minimize
-        elif isinstance(trial.report.objective_to_minimize, Sequence):
-            perf = np.array(trial.report.objective_to_minimize, dtype=np.float64)
+            pending.append(row)
         else:
-            raise ValueError("Unknown type of objective_to_minimize")
-
+            cache.add(trial_id, row)
+
+    n = len(cache.ids) + len(pending)
+    id_index = np.empty(n, dtype=int)
+    rungs_index = np.empty(n, dtype=int)
+    configs = np.empty(n, dtype=object)
+    id_index[: len(cache.ids)] = cache.ids
+    rungs_index[: len(cache.ids)] = cache.rungs
+    configs[: len(cache.ids)] = cache.configs
+    perfs = [*cache.perfs]
+    for i, (_id, _rung, perf, config) in enumerate(pending, start=len(cache.ids)):
         id_index[i] = _id
         rungs_index[i] = _rung
-        perfs[i] = perf
-        configs[i] = trial.config
+        configs[i] = config
+        perfs.append(perf)
 
-    id_index = pd.MultiIndex.from_arrays([id_index, rungs_index], names=["id", "rung"])
-    df = pd.DataFrame(data={"config": configs, "perf": perfs}, index=id_index)
+    index = pd.MultiIndex.from_arrays([id_index, rungs_index], names=["id", "rung"])
+    df = pd.DataFrame(data={"config": configs, "perf": perfs}, index=index)
     return df.sort_index(ascending=True)
 
 
@@ -113,6 +177,19 @@ class GPSampler:
     device: torch.device | None
     """The device to use for the GP optimization."""
 
+    surrogate: GPSurrogate = "exact"
+    """The kind of GP to use, see
+    [`GPSurrogate`][neps.optimizers.models.gp.GPSurrogate]."""
+
+    acquisition_workers: int = 1
+    """The number of forked processes to optimize the acquisition function in, see
+    [`optimize_acq()`][neps.optimizers.models.gp.optimize_acq]."""
+
+    _encoded_configs: EncodedConfigCache = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._encoded_configs = EncodedConfigCache(self.encoder, device=self.device)
+
     def threshold_reached(self, trials: Mapping[str, Trial]) -> bool:
         used_fidelity = [
             t.config[self.fidelity_name] for t in trials.values() if t.report is not None
@@ -130,6 +207,20 @@ class GPSampler:
 
         Please see parameter descriptions in the class docstring for more.
         """
+        # Imported here, such that bracket optimizers without a GP don't need botorch
+        from botorch.acquisition.multi_objective.parego import (
+            qLogNoisyExpectedImprovement,
+        )
+        from botorch.acquisition.objective import LinearMCObjective
+        from gpytorch.utils.warnings import NumericalWarning
+
+        from neps.optimizers.models.gp import (
+            acquisition_baseline,
+            encode_trials_for_gp,
+            fit_and_acquire_from_gp,
+            make_default_single_obj_gp,
+        )
+
         assert budget_info is None, "cost-aware (using budget_info) not supported yet."
         # fit the GP model using all trials, using fidelity as a dimension.
         # Get to top 10 configurations for acquisition fixed at fidelity Z
@@ -140,13 +231,16 @@ class GPSampler:
             self.parameters,
             encoder=self.encoder,
             device=self.device,
+            cache=self._encoded_configs,
+        )
+        gp = make_default_single_obj_gp(
+            x=data.x, y=data.y, encoder=self.encoder, surrogate=self.surrogate
         )
-        gp = make_default_single_obj_gp(x=data.x, y=data.y, encoder=self.encoder)
 
         with disable_warnings(NumericalWarning):
             acqf = qLogNoisyExpectedImprovement(
                 model=gp,
-                X_baseline=data.x,
+                X_baseline=acquisition_baseline(data, self.surrogate),
                 # Unfortunatly, there's no option to indicate that we minimize
                 # the AcqFunction so we need to do some kind of transformation.
                 # https://github.com/pytorch/botorch/issues/2316#issuecomment-2085964607
@@ -179,6 +273,8 @@ class GPSampler:
             cost_percentage_used=None,
             costs_on_log_scale=False,
             hide_warnings=True,
+            surrogate=self.surrogate,
+            acquisition_workers=self.acquisition_workers,
         )
         assert len(candidates) == N
 
@@ -251,13 +347,25 @@ class BracketOptimizer:
     fid_name: str
     """The name of the fidelity in the space."""
 
-    def __call__(  # noqa: C901, PLR0912
+    _trial_table: TrialTableCache = field(
+        default_factory=TrialTableCache, init=False, repr=False
+    )
+
+    def __call__(
         self,
         trials: Mapping[str, Trial],
         budget_info: BudgetInfo | None,
         n: int | None = None,
     ) -> SampledConfig | list[SampledConfig]:
-        assert n is None, "TODO"
+        if n is not None:
+            return sample_sequentially_with_pending(self._sample_one, trials, n)
+
+        return self._sample_one(trials)
+
+    def _sample_one(  # noqa: C901, PLR0912
+        self,
+        trials: Mapping[str, Trial],
+    ) -> SampledConfig:
         space = self.space
         parameters = space.searchables
 
@@ -285,7 +393,7 @@ class BracketOptimizer:
                 case False:
                     pass
 
-        table = trials_to_table(trials=trials)
+        table = trials_to_table(trials=trials, cache=self._trial_table)
 
         if len(table) == 0:  # noqa: SIM108
             # Nothing there, this sample will be the first
@@ -23,7 +23,6 @@ class GridSearch:
         budget_info: BudgetInfo | None,
         n: int | None = None,
     ) -> SampledConfig | list[SampledConfig]:
-        assert n is None, "TODO"
         _num_previous_configs = len(trials)
         if _num_previous_configs > len(self.configs_list) - 1:
             raise ValueError("Grid search exhausted!")
@@ -31,6 +30,16 @@ class GridSearch:
         # TODO: Revisit this. Do we really need to shuffle the configs?
         configs = self.configs_list
 
-        config = configs[_num_previous_configs]
-        config_id = str(_num_previous_configs)
-        return SampledConfig(config=config, id=config_id, previous_config_id=None)
+        if n is None:
+            config = configs[_num_previous_configs]
+            config_id = str(_num_previous_configs)
+            return SampledConfig(config=config, id=config_id, previous_config_id=None)
+
+        # Return as many of the remaining configs as requested, possibly fewer
+        # if the grid runs out.
+        return [
+            SampledConfig(config=configs[i], id=str(i), previous_config_id=None)
+            for i in range(
+                _num_previous_configs, min(_num_previous_configs + n, len(configs))
+            )
+        ]
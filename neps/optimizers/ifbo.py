@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -14,9 +14,11 @@ from neps.optimizers.models.ftpfn import (
     encode_ftpfn,
 )
 from neps.optimizers.optimizer import SampledConfig
+from neps.optimizers.utils.batch import sample_sequentially_with_pending
 from neps.optimizers.utils.initial_design import make_initial_design
 from neps.sampling import Prior, Sampler
 from neps.space import ConfigEncoder, Domain, Float, Integer, SearchSpace
+from neps.space.encoding import EncodedConfigCache
 
 if TYPE_CHECKING:
     from neps.state import BudgetInfo, Trial
@@ -129,17 +131,48 @@ class IFBO:
     Each one will be treated as an individual fidelity level.
     """
 
+    n_sobol_samples: int = 512
+    """The number of sobol samples to score when maximizing the acquisition."""
+
+    n_uniform_samples: int = 512
+    """The number of uniform samples to score when maximizing the acquisition."""
+
+    n_border_samples: int = 256
+    """The number of samples on the borders of the space to score when maximizing
+    the acquisition."""
+
+    n_local_search_samples: int = 256
+    """The number of samples to score around the best sample of each of the above."""
+
+    acquisition_batch_size: int | None = None
+    """The maximum number of samples to score in a single forward pass of the FTPFN.
+
+    If `None`, all samples of a round of acquisition are scored in one pass.
+    """
+
+    _encoded_configs: EncodedConfigCache = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._encoded_configs = EncodedConfigCache(
+            self.encoder, device=self.device, dtype=FTPFN_DTYPE
+        )
+
     def __call__(
         self,
         trials: Mapping[str, Trial],
         budget_info: BudgetInfo | None = None,
         n: int | None = None,
     ) -> SampledConfig | list[SampledConfig]:
+        if n is not None:
+            return sample_sequentially_with_pending(self._sample_one, trials, n)
+
+        return self._sample_one(trials)
+
+    def _sample_one(self, trials: Mapping[str, Trial]) -> SampledConfig:
         assert self.space.fidelity is not None
         fidelity_name, fidelity = self.space.fidelity
         parameters = self.space.searchables
 
-        assert n is None, "TODO"
         ids = [int(config_id.split("_", maxsplit=1)[0]) for config_id in trials]
         new_id = max(ids) + 1 if len(ids) > 0 else 1
 
@@ -190,6 +223,7 @@ class IFBO:
             budget_domain=budget_domain,
             device=self.device,
             pending_value=torch.nan,
+            cache=self._encoded_configs,
         )
 
         # Fantasize if needed
@@ -202,8 +236,12 @@ class IFBO:
                 train_y=y[not_pending_mask],
                 test_x=X[pending_mask],
             )
+            # A config with a pending evaluation can not be continued yet, otherwise
+            # we would sample the same continuation twice.
+            is_pending_config = torch.isin(not_pending_X[:, 0], X[pending_mask, 0])
+            continuation_X = not_pending_X[~is_pending_config]
         else:
-            not_pending_X = X
+            continuation_X = X
 
         # NOTE: Can't really abstract this, requires knowledge that:
         # 1. The encoding is such that the objective_to_minimize is 1 -
@@ -241,17 +279,18 @@ class IFBO:
             # Acquisition function
             acq_function=_mfpi_random,
             # Which acquisition samples to consider for continuation
-            continuation_samples=not_pending_X,
+            continuation_samples=continuation_X,
             # How to generate some initial samples
             initial_samplers=[
-                (Sampler.sobol(ndim=sample_dims), 512),
-                (Sampler.uniform(ndim=sample_dims), 512),
-                (Sampler.borders(ndim=sample_dims), 256),
+                (Sampler.sobol(ndim=sample_dims), self.n_sobol_samples),
+                (Sampler.uniform(ndim=sample_dims), self.n_uniform_samples),
+                (Sampler.borders(ndim=sample_dims), self.n_border_samples),
             ],
             seed=None,  # TODO: Seeding
             # A next step local sampling around best point found by initial_samplers
-            local_search_sample_size=256,
+            local_search_sample_size=self.n_local_search_samples,
             local_search_confidence=0.95,
+            batch_size=self.acquisition_batch_size,
         )
 
         _id, fid, config = decode_ftpfn_data(
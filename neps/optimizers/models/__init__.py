@@ -1,4 +1,26 @@
-from neps.optimizers.models.ftpfn import FTPFNSurrogate
-from neps.optimizers.models.gp import make_default_single_obj_gp
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from neps.optimizers.models.ftpfn import FTPFNSurrogate
+    from neps.optimizers.models.gp import make_default_single_obj_gp
+
+# Imported lazily, such that using the GP does not import ifbo and vice versa
+_LAZY_ATTRIBUTES = {
+    "FTPFNSurrogate": "neps.optimizers.models.ftpfn",
+    "make_default_single_obj_gp": "neps.optimizers.models.gp",
+}
 
 __all__ = ["FTPFNSurrogate", "make_default_single_obj_gp"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import os
 from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import torch
-from ifbo import FTPFN
+from ifbo.download import WEIGHTS_FINAL_NAME
 
 from neps.sampling import Prior, Sampler
 
 if TYPE_CHECKING:
     from neps.space import ConfigEncoder, Domain, Float, Integer
+    from neps.space.encoding import EncodedConfigCache
     from neps.state.trial import Trial
 
 
@@ -114,6 +116,7 @@ def encode_ftpfn(
     dtype: torch.dtype = FTPFN_DTYPE,
     error_value: float = 0.0,
     pending_value: float = torch.nan,
+    cache: EncodedConfigCache | None = None,
 ) -> tuple[torch.Tensor, torch.Tensor]:
     """Encode the trials into a format that the FTPFN model can understand.
 
@@ -135,6 +138,9 @@ def encode_ftpfn(
         budget_domain: The domain to use for the budgets of the FTPFN
         device: The device to use
         dtype: The dtype to use
+        cache: A cache of encoded configurations to keep between calls, such that
+            only the configurations of new trials are encoded. It must use the same
+            `encoder`, `device` and `dtype`.
 
     Returns:
         The encoded trials and their corresponding **scores**
@@ -145,9 +151,14 @@ def encode_ftpfn(
     fidelity_name, fidelity = fid
 
     assert 0 <= error_value <= 1
-    train_configs = encoder.encode(
-        [t.config for t in selected.values()], device=device, dtype=dtype
-    )
+    if cache is not None:
+        if cache.encoder is not encoder or (cache.device, cache.dtype) != (device, dtype):
+            raise ValueError("The `cache` must use the same encoder, device and dtype.")
+        train_configs = cache.encode({_id: t.config for _id, t in selected.items()})
+    else:
+        train_configs = encoder.encode(
+            [t.config for t in selected.values()], device=device, dtype=dtype
+        )
     ids = torch.tensor(
         [int(config_id.split("_", maxsplit=1)[0]) for config_id in selected],
         device=device,
@@ -211,6 +222,17 @@ def decode_ftpfn_data(
     return list(zip(real_ids, fidelities, configs, strict=False))
 
 
+def _score_in_batches(
+    acq_function: Callable[[torch.Tensor], torch.Tensor],
+    X: torch.Tensor,
+    batch_size: int | None,
+) -> torch.Tensor:
+    if batch_size is None or len(X) <= batch_size:
+        return acq_function(X).reshape(-1)
+
+    return torch.cat([acq_function(chunk).reshape(-1) for chunk in X.split(batch_size)])
+
+
 def acquire_next_from_ftpfn(
     *,
     ftpfn: FTPFNSurrogate,
@@ -223,7 +245,21 @@ def acquire_next_from_ftpfn(
     acq_function: Callable[[torch.Tensor], torch.Tensor],
     seed: torch.Generator | None = None,
     dtype: torch.dtype | None = FTPFN_DTYPE,
+    batch_size: int | None = None,
 ) -> torch.Tensor:
+    """Find the best row to evaluate next according to the `acq_function`.
+
+    The acquisition is maximized in two rounds. The first scores the configurations
+    that could be continued together with the samples of every sampler in
+    `initial_samplers`. The second scores `local_search_sample_size` samples
+    around the best sample of each of these samplers. Each round is a single call to
+    the `acq_function`, such that the FTPFN processes the training data only once
+    per round, unless it is split up into calls with at most `batch_size` rows.
+
+    Returns:
+        The best row, either one of the `continuation_samples` or a new
+        configuration with an id of `0` at the lowest budget.
+    """
     # 1. Remove duplicate configurations from continuation_samples,
     # keeping only the most recent eval
     acq_existing = _keep_highest_budget_evaluation(
@@ -232,78 +268,129 @@ def acquire_next_from_ftpfn(
 
     # 2. Remove configs that have been fully evaluated
     acq_existing = acq_existing[acq_existing[:, 1] < budget_domain.upper]
-    if len(acq_existing) != 0:
-        # Get the best configuration for continuation
-        acq_scores = acq_function(acq_existing)
-        best_ix = acq_scores.argmax()
-
-        best_score = acq_scores[best_ix].item()
-        best_row = acq_existing[best_ix].clone().detach()
-        del acq_existing
-        del acq_scores
-    else:
-        best_score = -float("inf")
-        best_row = torch.tensor([])
-
-    # We'll be re-using 0 id and min budget alot, just create them once and re-use
-    _N = max(*(s[1] for s in initial_samplers), local_search_sample_size)
-    ids = torch.zeros((_N, 1), dtype=dtype, device=ftpfn.device)
-    min_budget = torch.full(
-        size=(_N, 1), fill_value=budget_domain.lower, dtype=dtype, device=ftpfn.device
-    )
 
-    # Acquisition maximization by sampling from samplers and performing an additional
-    # round of local sampling around the best point
-    local_sample_confidence = [local_search_confidence] * len(encoder.domains)
-    for sampler, size in initial_samplers:
-        # 1. Use provided sampler and eval samples with acq
-        samples = sampler.sample(
-            size, to=encoder.domains, seed=seed, device=ftpfn.device, dtype=dtype
+    def _new_configs(samples: torch.Tensor) -> torch.Tensor:
+        # New configurations get the `0` id and start at the minimum budget
+        ids = torch.zeros((len(samples), 1), dtype=dtype, device=ftpfn.device)
+        min_budget = torch.full(
+            size=(len(samples), 1),
+            fill_value=budget_domain.lower,
+            dtype=dtype,
+            device=ftpfn.device,
+        )
+        return torch.cat([ids, min_budget, samples], dim=1)
+
+    # Round 1: The existing configs and samples of all samplers in one go
+    initial_samples = [
+        _new_configs(
+            sampler.sample(
+                size, to=encoder.domains, seed=seed, device=ftpfn.device, dtype=dtype
+            )
         )
-        _N = len(samples)
-        X_test = torch.cat([ids[:_N], min_budget[:_N], samples], dim=1)
-        acq_scores = acq_function(X_test)
-
-        # ... update best if needed
-        sample_best_ix = acq_scores.argmax()
-        sample_best_score = acq_scores[sample_best_ix].item()
-        sample_best_row = X_test[sample_best_ix].clone().detach()
-        if sample_best_score > best_score:
-            best_score = sample_best_score
-            best_row = sample_best_row
-
-        # 2. Sample around best point from above samples and eval acq.
-        _mode = sample_best_row[2:]
+        for sampler, size in initial_samplers
+    ]
+    X_test = torch.cat([acq_existing, *initial_samples], dim=0)
+    acq_scores = _score_in_batches(acq_function, X_test, batch_size)
+
+    best_ix = acq_scores.argmax()
+    best_score = acq_scores[best_ix].item()
+    best_row = X_test[best_ix].clone().detach()
+
+    # Round 2: Local samples around the best sample of each sampler, in one go
+    sampler_scores = acq_scores[len(acq_existing) :].split(
+        [len(samples) for samples in initial_samples]
+    )
+    local_sample_confidence = [local_search_confidence] * len(encoder.domains)
+    local_samples = []
+    for samples, scores in zip(initial_samples, sampler_scores, strict=True):
+        _mode = samples[scores.argmax(), 2:]
         local_sampler = Prior.from_domains_and_centers(
             centers=list(zip(_mode.tolist(), local_sample_confidence, strict=False)),
             domains=encoder.domains,
         )
-        samples = local_sampler.sample(
-            local_search_sample_size,
-            to=encoder.domains,
-            seed=seed,
-            device=ftpfn.device,
-            dtype=dtype,
+        local_samples.append(
+            _new_configs(
+                local_sampler.sample(
+                    local_search_sample_size,
+                    to=encoder.domains,
+                    seed=seed,
+                    device=ftpfn.device,
+                    dtype=dtype,
+                )
+            )
         )
-        _N = len(samples)
-        X_test = torch.cat([ids[:_N], min_budget[:_N], samples], dim=1)
-        acq_scores = acq_function(X_test)
 
-        local_best_ix = acq_scores.argmax()
-        local_best_score = acq_scores[local_best_ix].clone().detach().item()
-        if local_best_score > best_score:
-            best_score = local_best_score
-            best_row = X_test[local_best_ix].clone().detach()
+    X_test = torch.cat(local_samples, dim=0)
+    acq_scores = _score_in_batches(acq_function, X_test, batch_size)
+
+    local_best_ix = acq_scores.argmax()
+    if acq_scores[local_best_ix].item() > best_score:
+        best_row = X_test[local_best_ix].clone().detach()
 
-    # Finally, if the best
     return best_row
 
 
-_CACHED_FTPFN_MODEL: dict[tuple[str, str], FTPFN] = {}
+def _resolve_model_dir(target_path: Path) -> Path:
+    # Same resolution as ifbo's `FTPFN`, the model lives in a `.model` directory
+    if target_path.name == ".model":
+        return target_path.absolute()
+    return target_path.absolute() / ".model"
+
+
+def _load_mmap_checkpoint(weights_path: Path) -> torch.nn.Module:
+    """Load the model of a checkpoint with its tensors memory-mapped from disk.
+
+    The tensors are then backed by the page cache of the file, which is shared by
+    all processes on the node that load the same checkpoint, rather than each one
+    holding a private copy.
+
+    Memory-mapping requires the zipfile format of `torch.save`, so the checkpoint is
+    stored once more in this format, next to the original one.
+    """
+    mmap_path = weights_path.with_suffix(".mmap.pt")
+    if not mmap_path.exists():
+        model = torch.load(weights_path, map_location="cpu", weights_only=False)
+        # Write to a temporary file first, such that other processes never see
+        # a partially written checkpoint.
+        tmp_path = mmap_path.with_suffix(f".{os.getpid()}.tmp")
+        torch.save(model, tmp_path)
+        tmp_path.replace(mmap_path)
+        del model
+
+    return torch.load(mmap_path, map_location="cpu", mmap=True, weights_only=False)
+
+
+def _load_ftpfn_model(
+    target_path: Path | None,
+    version: str,
+    device: torch.device | None,
+) -> torch.nn.Module:
+    # TODO: We also probably want to link this to the actual root directory
+    # or some shared directory between runs as relying on the path of the initial
+    # python invocation is likely to lead to issues somewhere.
+    # TODO: ifbo support for windows has issues with decompression
+    # We basically just do the same thing they do but manually
+    model_dir = _download_workaround_for_ifbo_issue_10(
+        _resolve_model_dir(target_path) if target_path is not None else None, version
+    )
+    model = _load_mmap_checkpoint(model_dir / WEIGHTS_FINAL_NAME(version))
+    if device is not None and device.type != "cpu":
+        model = model.to(device)
+
+    model.eval()
+    return model
+
+
+_CACHED_FTPFN_MODEL: dict[tuple[str | None, str, str | None], torch.nn.Module] = {}
 
 
 class FTPFNSurrogate:
-    """Wrapper around the IfBO model."""
+    """Wrapper around the IfBO model.
+
+    The model is only loaded once it is first used, and at most once per process.
+    Its weights are memory-mapped from disk, such that processes on the same node
+    share them.
+    """
 
     def __init__(
         self,
@@ -311,27 +398,29 @@ class FTPFNSurrogate:
         version: str = "0.0.1",
         device: torch.device | None = None,
     ):
-        if target_path is None:
-            # TODO: We also probably want to link this to the actual root directory
-            # or some shared directory between runs as relying on the path of the initial
-            # python invocation is likely to lead to issues somewhere.
-            # TODO: ifbo support for windows has issues with decompression
-            # We basically just do the same thing they do but manually
-            target_path = _download_workaround_for_ifbo_issue_10(target_path, version)
-
-        key = (str(target_path), version)
-        ftpfn = _CACHED_FTPFN_MODEL.get(key)
-        if ftpfn is None:
-            ftpfn = FTPFN(target_path=target_path, version=version, device=device)
-            _CACHED_FTPFN_MODEL[key] = ftpfn
-
-        self.ftpfn = ftpfn
-        self.device = self.ftpfn.device
+        self.target_path = target_path
+        self.version = version
+        self.device = device
+
+    @property
+    def model(self) -> torch.nn.Module:
+        """The underlying ifbo model, loaded on first access."""
+        key = (
+            str(self.target_path) if self.target_path is not None else None,
+            self.version,
+            str(self.device) if self.device is not None else None,
+        )
+        model = _CACHED_FTPFN_MODEL.get(key)
+        if model is None:
+            model = _load_ftpfn_model(self.target_path, self.version, self.device)
+            _CACHED_FTPFN_MODEL[key] = model
+
+        return model
 
     def _get_logits(
         self, train_x: torch.Tensor, train_y: torch.Tensor, test_x: torch.Tensor
     ) -> torch.Tensor:
-        return self.ftpfn.model(  # type: ignore
+        return self.model(  # type: ignore
             _cast_tensor_shapes(train_x),
             _cast_tensor_shapes(train_y),
             _cast_tensor_shapes(test_x),
@@ -345,7 +434,7 @@ class FTPFNSurrogate:
         test_x: torch.Tensor,
     ) -> torch.Tensor:
         logits = self._get_logits(train_x, train_y, test_x).squeeze()
-        return self.ftpfn.model.criterion.mean(logits)  # type: ignore
+        return self.model.criterion.mean(logits)  # type: ignore
 
     @torch.no_grad()  # type: ignore
     def get_pi(
@@ -356,7 +445,7 @@ class FTPFNSurrogate:
         y_best: torch.Tensor | float,
     ) -> torch.Tensor:
         logits = self._get_logits(train_x, train_y, test_x)
-        return self.ftpfn.model.criterion.pi(logits.squeeze(), best_f=y_best)  # type: ignore
+        return self.model.criterion.pi(logits.squeeze(), best_f=y_best)  # type: ignore
 
     @torch.no_grad()  # type: ignore
     def get_ei(
@@ -367,7 +456,7 @@ class FTPFNSurrogate:
         y_best: torch.Tensor | float,
     ) -> torch.Tensor:
         logits = self._get_logits(train_x, train_y, test_x)
-        return self.ftpfn.model.criterion.ei(logits.squeeze(), best_f=y_best)  # type: ignore
+        return self.model.criterion.ei(logits.squeeze(), best_f=y_best)  # type: ignore
 
     @torch.no_grad()  # type: ignore
     def get_lcb(
@@ -378,7 +467,7 @@ class FTPFNSurrogate:
         beta: float = (1 - 0.682) / 2,
     ) -> torch.Tensor:
         logits = self._get_logits(train_x, train_y, test_x)
-        return self.ftpfn.model.criterion.ucb(  # type: ignore
+        return self.model.criterion.ucb(  # type: ignore
             logits=logits,
             best_f=None,
             rest_prob=beta,
@@ -395,7 +484,7 @@ class FTPFNSurrogate:
         beta: float = (1 - 0.682) / 2,
     ) -> torch.Tensor:
         logits = self._get_logits(train_x, train_y, test_x)
-        return self.ftpfn.model.criterion.ucb(  # type: ignore
+        return self.model.criterion.ucb(  # type: ignore
             logits=logits,
             best_f=None,
             rest_prob=beta,
@@ -3,27 +3,42 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
+import pickle
+import threading
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import nullcontext
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import reduce
-from itertools import product
-from typing import TYPE_CHECKING, Any
+from itertools import count, product
+from typing import TYPE_CHECKING, Any, Literal
 
 import gpytorch.constraints
 import torch
+from botorch.exceptions.warnings import OptimizationWarning
 from botorch.fit import fit_gpytorch_mll
 from botorch.models import SingleTaskGP
+from botorch.models.approximate_gp import SingleTaskVariationalGP
 from botorch.models.gp_regression import Log, get_covar_module_with_dim_scaled_prior
 from botorch.models.gp_regression_mixed import CategoricalKernel, OutcomeTransform
 from botorch.models.transforms.outcome import ChainedOutcomeTransform, Standardize
 from botorch.optim import optimize_acqf, optimize_acqf_mixed
+from botorch.optim.fit import fit_gpytorch_mll_scipy
+from botorch.optim.initializers import gen_batch_initial_conditions
 from gpytorch import ExactMarginalLogLikelihood
-from gpytorch.kernels import ScaleKernel
+from gpytorch.kernels import Kernel, ScaleKernel
+from gpytorch.mlls import VariationalELBO
 from gpytorch.utils.warnings import NumericalWarning
 
 from neps.optimizers.acquisition import cost_cooled_acq, pibo_acquisition
-from neps.space.encoding import CategoricalToIntegerTransformer, ConfigEncoder
+from neps.space.encoding import (
+    CategoricalToIntegerTransformer,
+    ConfigEncoder,
+    EncodedConfigCache,
+)
 from neps.utils.common import disable_warnings
 
 if TYPE_CHECKING:
@@ -44,6 +59,8 @@ class GPEncodedData:
     y: torch.Tensor
     cost: torch.Tensor | None = None
     x_pending: torch.Tensor | None = None
+    trial_ids: list[str] = field(default_factory=list)
+    """The ids of the trials in `x`, in the same order."""
 
 
 def default_categorical_kernel(
@@ -61,20 +78,39 @@ def default_categorical_kernel(
     )
 
 
-def make_default_single_obj_gp(
-    x: torch.Tensor,
-    y: torch.Tensor,
-    encoder: ConfigEncoder,
-    *,
-    y_transform: OutcomeTransform | None = None,
-) -> SingleTaskGP:
-    """Default GP for single objective optimization."""
-    if y.ndim == 1:
-        y = y.unsqueeze(-1)
+GPSurrogate = Literal["exact", "variational"]
+"""The kind of GP to use as a surrogate.
 
-    if y_transform is None:
-        y_transform = Standardize(m=1)
+* `"exact"`: An exact GP, whose fit scales cubically in the number of observations.
+* `"variational"`: A variational GP with a fixed number of inducing points, whose fit
+    and memory scale linearly in the number of observations. Use this when there are
+    several thousand observations.
+"""
+
+DEFAULT_N_INDUCING_POINTS = 128
+"""The default number of inducing points of a `"variational"` GP."""
+
+VARIATIONAL_FIT_MAX_ITERATIONS = 200
+"""The maximum number of optimizer iterations when fitting a `"variational"` GP."""
 
+VARIATIONAL_MAX_BASELINE = 256
+"""The maximum number of observations used as the baseline of noisy acquisition
+functions with a `"variational"` GP."""
+
+LOCAL_SEARCH_MAX_STEPS = 50
+"""The maximum number of moves of each starting point of the local search, used for
+acquisition in mixed spaces with too many categorical combinations to enumerate."""
+
+LOCAL_SEARCH_NUMERICAL_NEIGHBORS = 16
+"""The number of gaussian perturbations of the numerical columns which are neighbours
+of a point in the local search."""
+
+LOCAL_SEARCH_NUMERICAL_STEP = 0.1
+"""The standard deviation of the perturbations of the numerical columns in the local
+search, relative to the width of their bounds."""
+
+
+def _default_covar_module(encoder: ConfigEncoder) -> Kernel | None:
     numerics: list[int] = []
     categoricals: list[int] = []
     for hp_name, transformer in encoder.transformers.items():
@@ -83,18 +119,13 @@ def make_default_single_obj_gp(
         else:
             numerics.append(encoder.index_of[hp_name])
 
-    # Purely vectorial
+    # Purely vectorial, use the default of the model
     if len(categoricals) == 0:
-        return SingleTaskGP(train_X=x, train_Y=y, outcome_transform=y_transform)
+        return None
 
     # Purely categorical
     if len(numerics) == 0:
-        return SingleTaskGP(
-            train_X=x,
-            train_Y=y,
-            covar_module=default_categorical_kernel(len(categoricals)),
-            outcome_transform=y_transform,
-        )
+        return default_categorical_kernel(len(categoricals))
 
     # Mixed
     numeric_kernel = get_covar_module_with_dim_scaled_prior(
@@ -116,14 +147,550 @@ def make_default_single_obj_gp(
     # to essentially be guess at random. This is a lot more stable but likely not as
     # good...
     # TODO: Figure out how to improve stability of this.
-    kernel = numeric_kernel + cat_kernel
+    return numeric_kernel + cat_kernel
+
+
+def make_default_single_obj_gp(
+    x: torch.Tensor,
+    y: torch.Tensor,
+    encoder: ConfigEncoder,
+    *,
+    y_transform: OutcomeTransform | None = None,
+    surrogate: GPSurrogate = "exact",
+    n_inducing_points: int = DEFAULT_N_INDUCING_POINTS,
+) -> SingleTaskGP | SingleTaskVariationalGP:
+    """Default GP for single objective optimization.
+
+    Args:
+        x: The encoded configurations.
+        y: The objective values of the configurations.
+        encoder: The encoder used for encoding the configurations.
+        y_transform: The outcome transform to use, defaults to standardization.
+        surrogate: The kind of GP to use, see
+            [`GPSurrogate`][neps.optimizers.models.gp.GPSurrogate].
+        n_inducing_points: The number of inducing points of a `"variational"` GP.
+
+    Returns:
+        The GP, which still has to be fitted, e.g. with
+        [`fit_gp()`][neps.optimizers.models.gp.fit_gp].
+    """
+    if y.ndim == 1:
+        y = y.unsqueeze(-1)
+
+    if y_transform is None:
+        y_transform = Standardize(m=1)
+
+    covar_module = _default_covar_module(encoder)
+    if surrogate == "variational":
+        return SingleTaskVariationalGP(
+            train_X=x,
+            train_Y=y,
+            num_outputs=y.shape[-1],
+            inducing_points=min(n_inducing_points, len(x)),
+            covar_module=covar_module,
+            outcome_transform=y_transform,
+        )
 
     return SingleTaskGP(
-        train_X=x, train_Y=y, covar_module=kernel, outcome_transform=y_transform
+        train_X=x, train_Y=y, covar_module=covar_module, outcome_transform=y_transform
+    )
+
+
+@dataclass
+class GPFitState:
+    """The fitted hyperparameters of a GP, used to warm-start the next fit."""
+
+    hyperparameters: dict[str, torch.Tensor]
+    """The fitted parameters of the GP's kernel, mean and likelihood."""
+
+    n_observations: int
+    """The number of observations the hyperparameters were fitted on."""
+
+    def matches(self, other: GPFitState) -> bool:
+        """Whether `other` holds the same fitted hyperparameters."""
+        return (
+            self.n_observations == other.n_observations
+            and self.hyperparameters.keys() == other.hyperparameters.keys()
+            and all(
+                torch.equal(value, other.hyperparameters[name])
+                for name, value in self.hyperparameters.items()
+            )
+        )
+
+
+def _load_hyperparameters(
+    gp: SingleTaskGP | SingleTaskVariationalGP, state: GPFitState
+) -> bool:
+    params = dict(gp.named_parameters())
+    if params.keys() != state.hyperparameters.keys() or any(
+        params[name].shape != value.shape for name, value in state.hyperparameters.items()
+    ):
+        return False
+
+    with torch.no_grad():
+        for name, value in state.hyperparameters.items():
+            params[name].copy_(value)
+
+    return True
+
+
+def _fit_hyperparameters(gp: SingleTaskGP | SingleTaskVariationalGP) -> None:
+    if isinstance(gp, SingleTaskGP):
+        fit_gpytorch_mll(ExactMarginalLogLikelihood(likelihood=gp.likelihood, model=gp))
+        return
+
+    # Full batch L-BFGS with a capped number of iterations. The variational fit
+    # is an approximation anyway, so not converging is not considered a failure.
+    fit_gpytorch_mll(
+        VariationalELBO(
+            likelihood=gp.likelihood,
+            model=gp.model,
+            num_data=gp.model.train_targets.shape[-1],
+        ),
+        optimizer=fit_gpytorch_mll_scipy,
+        optimizer_kwargs={"options": {"maxiter": VARIATIONAL_FIT_MAX_ITERATIONS}},
+        warning_handler=lambda w: issubclass(w.category, OptimizationWarning),
     )
 
 
-def optimize_acq(
+def fit_gp(
+    gp: SingleTaskGP | SingleTaskVariationalGP,
+    *,
+    warm_start: GPFitState | None = None,
+    refit_every: int = 1,
+) -> GPFitState:
+    """Fit the hyperparameters of a GP, optionally warm-started from a previous fit.
+
+    Args:
+        gp: The GP model to fit.
+        warm_start: The state of a previous fit. If its hyperparameters match those
+            of the `gp`, for example, the encoding did not change, they are used as
+            the starting point of the fit. Otherwise, they are ignored.
+        refit_every: Only refit the hyperparameters once this many new observations
+            arrived since the fit in `warm_start`. Until then, its hyperparameters are
+            reused as is.
+
+    Returns:
+        The state of the fit, to be passed as `warm_start` to the next call.
+    """
+    model = gp.model if isinstance(gp, SingleTaskVariationalGP) else gp
+    n_observations = model.train_inputs[0].shape[-2]
+    if (
+        warm_start is not None
+        and _load_hyperparameters(gp, warm_start)
+        and 0 <= n_observations - warm_start.n_observations < refit_every
+    ):
+        gp.eval()
+        return warm_start
+
+    _fit_hyperparameters(gp)
+    return GPFitState(
+        hyperparameters={
+            name: param.detach().clone() for name, param in gp.named_parameters()
+        },
+        n_observations=n_observations,
+    )
+
+
+@dataclass
+class IncrementalGP:
+    """A fitted GP kept between asks, whose posterior is updated with new
+    observations rather than being rebuilt from scratch.
+
+    Conditioning on `k` new observations reuses the cached factorization of the
+    training covariance, costing `O(n^2 k)` instead of the `O(n^3)` of a full
+    factorization. This is only valid while the hyperparameters stay the same, i.e.
+    until they are refit with [`fit_gp()`][neps.optimizers.models.gp.fit_gp].
+
+    !!! note
+
+        The outcome transform of the GP is not refit on new observations, so
+        they are standardized with the statistics of the observations the GP was
+        originally built with.
+    """
+
+    gp: SingleTaskGP
+    """The GP, conditioned on all of `trial_ids`."""
+
+    fit_state: GPFitState
+    """The fitted hyperparameters of the GP."""
+
+    trial_ids: list[str]
+    """The ids of the trials the GP is conditioned on."""
+
+    def condition_on(
+        self,
+        data: GPEncodedData,
+        *,
+        fit_state: GPFitState,
+    ) -> SingleTaskGP | None:
+        """Condition the GP on the observations in `data` it has not seen yet.
+
+        Args:
+            data: The encoded observations, identified by their `trial_ids`.
+            fit_state: The hyperparameters the GP should have.
+
+        Returns:
+            The updated GP, or `None` if it can not be updated incrementally,
+            for example, the hyperparameters differ or observations were removed.
+        """
+        if not self.fit_state.matches(fit_state):
+            return None
+
+        known = set(self.trial_ids)
+        if not known.issubset(data.trial_ids):
+            return None
+
+        new = [i for i, trial_id in enumerate(data.trial_ids) if trial_id not in known]
+        if len(new) == 0:
+            return self.gp
+
+        y = data.y.unsqueeze(-1) if data.y.ndim == 1 else data.y
+        with torch.no_grad():
+            # Makes sure the caches which get updated exist
+            self.gp.posterior(data.x[new])
+
+        self.gp = self.gp.condition_on_observations(X=data.x[new], Y=y[new])
+        self.trial_ids = [*self.trial_ids, *(data.trial_ids[i] for i in new)]
+        return self.gp
+
+
+# The pool of processes which optimize the acquisition, kept between calls such that
+# it is only forked once rather than on every call, along with the process which
+# forked it and its number of workers.
+_acq_pool: tuple[int, int, ProcessPoolExecutor] | None = None
+_acq_pool_lock = threading.Lock()
+
+# Numbers the calls sending an acquisition function to the pool workers
+_acq_calls = count()
+
+# The acquisition function last sent to this pool worker, with the call it is from
+_worker_acq_fn: tuple[int, AcquisitionFunction] | None = None
+
+
+def _init_acq_worker(num_threads: int) -> None:
+    torch.set_num_threads(num_threads)
+
+
+def _optimize_acqf_in_worker(
+    acq: tuple[int, bytes],
+    kwargs: Mapping[str, Any],
+    X_pending: torch.Tensor | None,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    global _worker_acq_fn  # noqa: PLW0603
+    call, pickled_acq_fn = acq
+    if _worker_acq_fn is None or _worker_acq_fn[0] != call:
+        _worker_acq_fn = (call, pickle.loads(pickled_acq_fn))  # noqa: S301
+
+    acq_fn = _worker_acq_fn[1]
+    acq_fn.set_X_pending(X_pending)
+    candidates, acq_value = optimize_acqf(acq_function=acq_fn, **kwargs)
+    return candidates.detach(), acq_value.detach()
+
+
+def _get_acq_pool(n_workers: int) -> ProcessPoolExecutor:
+    global _acq_pool  # noqa: PLW0603
+    with _acq_pool_lock:
+        if _acq_pool is not None:
+            pid, pool_n_workers, pool = _acq_pool
+            if pid == os.getpid() and pool_n_workers == n_workers:
+                return pool
+
+            # NOTE: A pool inherited from the parent process is not ours to shut down
+            if pid == os.getpid():
+                pool.shutdown(wait=False)
+
+        # Split up the threads torch may use over the workers
+        num_threads = max(torch.get_num_threads() // n_workers, 1)
+        pool = ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_acq_worker,
+            initargs=(num_threads,),
+        )
+        _acq_pool = (os.getpid(), n_workers, pool)
+        return pool
+
+
+def _discard_acq_pool(pool: ProcessPoolExecutor) -> None:
+    global _acq_pool  # noqa: PLW0603
+    with _acq_pool_lock:
+        if _acq_pool is not None and _acq_pool[2] is pool:
+            _acq_pool = None
+
+
+def _can_fork_acq_workers() -> bool:
+    return (
+        "fork" in multiprocessing.get_all_start_methods()
+        and not multiprocessing.current_process().daemon
+    )
+
+
+def _best_of_optimize_acqf(
+    runs: Sequence[Mapping[str, Any]],
+    *,
+    pool: ProcessPoolExecutor,
+    acq: tuple[int, bytes],
+    X_pending: torch.Tensor | None,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Run `optimize_acqf` once per set of keyword arguments, keeping the best."""
+    try:
+        futures = [
+            pool.submit(_optimize_acqf_in_worker, acq, run, X_pending) for run in runs
+        ]
+        results = [future.result() for future in futures]
+    except BrokenProcessPool:
+        # A worker died, the next call gets a new pool
+        _discard_acq_pool(pool)
+        raise
+
+    acq_values = torch.stack([acq_value for _, acq_value in results])
+    best = int(torch.argmax(acq_values))
+    return results[best][0], acq_values[best]
+
+
+def _optimize_acqf_parallel(
+    acq_fn: AcquisitionFunction,
+    bounds: torch.Tensor,
+    *,
+    q: int,
+    num_restarts: int,
+    raw_samples: int,
+    fixed_features: dict[int, float],
+    options: dict[str, Any] | None,
+    n_workers: int,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    # The initial conditions are generated once, from which the restarts are
+    # then split up evenly over the workers.
+    initial_conditions = gen_batch_initial_conditions(
+        acq_function=acq_fn,
+        bounds=bounds,
+        q=q,
+        num_restarts=num_restarts,
+        raw_samples=raw_samples,
+        fixed_features=fixed_features or None,
+        options=options,
+    )
+    chunks = initial_conditions.tensor_split(min(n_workers, len(initial_conditions)))
+    runs = [
+        {
+            "bounds": bounds,
+            "q": q,
+            "num_restarts": len(chunk),
+            "batch_initial_conditions": chunk,
+            "fixed_features": fixed_features,
+            "options": options,
+        }
+        for chunk in chunks
+    ]
+    return _best_of_optimize_acqf(
+        runs,
+        pool=_get_acq_pool(n_workers),
+        acq=(next(_acq_calls), pickle.dumps(acq_fn)),
+        X_pending=acq_fn.X_pending,
+    )
+
+
+def _optimize_acqf_mixed_parallel(
+    acq_fn: AcquisitionFunction,
+    bounds: torch.Tensor,
+    *,
+    q: int,
+    num_restarts: int,
+    raw_samples: int | None,
+    fixed_features_list: list[dict[int, float]],
+    options: dict[str, Any] | None,
+    n_workers: int,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    # Same as botorch's `optimize_acqf_mixed`, except that the sub-problem of each
+    # categorical combination is solved concurrently. For `q > 1` we use the same
+    # sequential greedy strategy, marking the chosen candidates as pending.
+    runs = [
+        {
+            "bounds": bounds,
+            "q": 1,
+            "num_restarts": num_restarts,
+            "raw_samples": raw_samples,
+            "fixed_features": fixed_features,
+            "options": options,
+        }
+        for fixed_features in fixed_features_list
+    ]
+    base_X_pending = acq_fn.X_pending
+    pool = _get_acq_pool(n_workers)
+    acq = (next(_acq_calls), pickle.dumps(acq_fn))
+    if q == 1:
+        return _best_of_optimize_acqf(runs, pool=pool, acq=acq, X_pending=base_X_pending)
+
+    candidates = torch.empty((0, bounds.shape[-1]), dtype=bounds.dtype)
+    for _ in range(q):
+        X_pending = (
+            candidates
+            if base_X_pending is None
+            else torch.cat([base_X_pending, candidates], dim=-2)
+        )
+        candidate, _ = _best_of_optimize_acqf(
+            runs, pool=pool, acq=acq, X_pending=X_pending if len(X_pending) else None
+        )
+        candidates = torch.cat([candidates, candidate], dim=-2)
+
+    return candidates, acq_fn(candidates)
+
+
+def _local_search_acq(
+    acq_fn: AcquisitionFunction,
+    bounds: torch.Tensor,
+    *,
+    cardinalities: Mapping[int, int],
+    fixed_features: Mapping[int, float],
+    raw_samples: int,
+    num_starts: int,
+    max_steps: int = LOCAL_SEARCH_MAX_STEPS,
+    n_numerical_neighbors: int = LOCAL_SEARCH_NUMERICAL_NEIGHBORS,
+    numerical_step: float = LOCAL_SEARCH_NUMERICAL_STEP,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Find a single candidate maximizing `acq_fn` by local search.
+
+    Starting from the best of `raw_samples` random points, each of the `num_starts`
+    points repeatedly moves to its best neighbour until none improves on it. The
+    neighbours of a point are every other choice of each categorical column, of
+    which there are `sum(cardinalities)` rather than their product, and
+    `n_numerical_neighbors` gaussian perturbations of its numerical columns. The
+    numerical columns of the best point are then refined with gradients.
+
+    Args:
+        acq_fn: The acquisition function to maximize.
+        bounds: The `(2, d)` bounds of the encoded space.
+        cardinalities: The number of choices of each categorical column.
+        fixed_features: The columns fixed to a given value.
+        raw_samples: The number of random points to pick the starting points from.
+        num_starts: The number of points to run the local search from.
+        max_steps: The maximum number of moves of the local search.
+        n_numerical_neighbors: The number of neighbours generated by perturbing
+            the numerical columns.
+        numerical_step: The standard deviation of these perturbations, relative
+            to the range of each column.
+
+    Returns:
+        The `(1, d)` candidate and its acquisition value.
+    """
+    lower, upper = bounds
+    d = bounds.shape[-1]
+    cat_cols = torch.tensor(list(cardinalities), dtype=torch.long)
+    numerical_cols = torch.tensor(
+        [i for i in range(d) if i not in cardinalities and i not in fixed_features],
+        dtype=torch.long,
+    )
+
+    def _fix(x: torch.Tensor) -> torch.Tensor:
+        for col, value in fixed_features.items():
+            x[..., col] = value
+        return x
+
+    def _evaluate(x: torch.Tensor) -> torch.Tensor:
+        return acq_fn(x.reshape(-1, 1, d)).reshape(x.shape[:-1])
+
+    # Every choice of every categorical column, i.e. one column index and value
+    # per neighbour of a point.
+    neighbour_cols = torch.cat(
+        [torch.full((n,), col, dtype=torch.long) for col, n in cardinalities.items()]
+    )
+    neighbour_choices = torch.cat(
+        [torch.arange(n, dtype=bounds.dtype) for n in cardinalities.values()]
+    )
+
+    with torch.no_grad():
+        x = lower + (upper - lower) * torch.rand(raw_samples, d, dtype=bounds.dtype)
+        x[:, cat_cols] = torch.floor(
+            torch.rand(raw_samples, len(cat_cols), dtype=bounds.dtype)
+            * torch.tensor(list(cardinalities.values()), dtype=bounds.dtype)
+        )
+        x = _fix(x)
+        values = _evaluate(x)
+        best = values.topk(min(num_starts, raw_samples)).indices
+        x, values = x[best], values[best]
+
+        # Only the points which moved in the previous step search further
+        active = torch.arange(len(x))
+        for _ in range(max_steps):
+            # Shaped as (n_active, n_neighbours, d)
+            cat_neighbours = x[active].unsqueeze(-2).repeat(1, len(neighbour_cols), 1)
+            cat_neighbours[:, torch.arange(len(neighbour_cols)), neighbour_cols] = (
+                neighbour_choices
+            )
+            numerical_neighbours = (
+                x[active].unsqueeze(-2).repeat(1, n_numerical_neighbors, 1)
+            )
+            if len(numerical_cols) > 0:
+                scale = numerical_step * (upper - lower)[numerical_cols]
+                noise = torch.randn_like(numerical_neighbours[..., numerical_cols])
+                numerical_neighbours[..., numerical_cols] = torch.clamp(
+                    numerical_neighbours[..., numerical_cols] + noise * scale,
+                    lower[numerical_cols],
+                    upper[numerical_cols],
+                )
+
+            neighbours = _fix(torch.cat([cat_neighbours, numerical_neighbours], dim=-2))
+            neighbour_values, ix = _evaluate(neighbours).max(dim=-1)
+            improved = neighbour_values > values[active]
+            if not improved.any():
+                break
+
+            active = active[improved]
+            x[active] = neighbours[improved, ix[improved]]
+            values[active] = neighbour_values[improved]
+
+    best_x, best_value = x[values.argmax()].unsqueeze(0), values.max()
+    if len(numerical_cols) == 0:
+        return best_x, best_value
+
+    # Refine the numerical columns of the best point, keeping its categoricals fixed
+    refined_x, refined_value = optimize_acqf(
+        acq_function=acq_fn,
+        bounds=bounds,
+        q=1,
+        num_restarts=1,
+        batch_initial_conditions=best_x.unsqueeze(0),
+        fixed_features={
+            **{int(col): best_x[0, col].item() for col in cat_cols},
+            **fixed_features,
+        },
+    )
+    if refined_value > best_value:
+        return refined_x, refined_value
+
+    return best_x, best_value
+
+
+def _optimize_acq_local_search(
+    acq_fn: AcquisitionFunction,
+    bounds: torch.Tensor,
+    *,
+    q: int,
+    **kwargs: Any,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    # For `q > 1`, we do the same sequential greedy optimization as botorch's
+    # `optimize_acqf_mixed`, marking the chosen candidates as pending.
+    if q == 1:
+        return _local_search_acq(acq_fn, bounds, **kwargs)
+
+    base_X_pending = acq_fn.X_pending
+    candidates = torch.empty((0, bounds.shape[-1]), dtype=bounds.dtype)
+    for _ in range(q):
+        candidate, _ = _local_search_acq(acq_fn, bounds, **kwargs)
+        candidates = torch.cat([candidates, candidate], dim=-2)
+        acq_fn.set_X_pending(
+            candidates
+            if base_X_pending is None
+            else torch.cat([base_X_pending, candidates], dim=-2)
+        )
+
+    acq_fn.set_X_pending(base_X_pending)
+    with torch.no_grad():
+        return candidates, acq_fn(candidates)
+
+
+def optimize_acq(  # noqa: C901
     acq_fn: AcquisitionFunction,
     encoder: ConfigEncoder,
     *,
@@ -134,12 +701,31 @@ def optimize_acq(
     fixed_features: dict[str, Any] | None = None,
     maximum_allowed_categorical_combinations: int = 30,
     hide_warnings: bool = False,
+    n_workers: int = 1,
 ) -> tuple[torch.Tensor, torch.Tensor]:
-    """Optimize the acquisition function."""
+    """Optimize the acquisition function.
+
+    With `n_workers > 1`, the restarts of the optimization, or the sub-problems of
+    each categorical combination for mixed spaces, are spread over a pool of
+    `n_workers` forked processes, which then share the threads torch may use. The
+    pool is forked once and reused by later calls. This only happens where forking is
+    available and `acq_options` contains nothing besides `"options"`, otherwise
+    botorch optimizes them one after the other.
+
+    !!! warning
+
+        Forking a process while other threads hold locks may deadlock the child, so
+        only opt in if nothing else runs in threads at the time of the first call.
+    """
     warning_context = (
         disable_warnings(NumericalWarning) if hide_warnings else nullcontext()
     )
     acq_options = acq_options or {}
+    parallel = (
+        n_workers > 1
+        and set(acq_options).issubset({"options"})
+        and _can_fork_acq_workers()
+    )
 
     _fixed_features: dict[int, float] = {}
     if fixed_features is not None:
@@ -171,6 +757,18 @@ def optimize_acq(
             n_intial_start_points = min(64 * len(bounds) ** 2, 4096)
 
         with warning_context:
+            if parallel:
+                return _optimize_acqf_parallel(
+                    acq_fn,
+                    bounds,
+                    q=n_candidates_required,
+                    num_restarts=num_restarts,
+                    raw_samples=n_intial_start_points,
+                    fixed_features=_fixed_features,
+                    options=acq_options.get("options"),
+                    n_workers=n_workers,
+                )
+
             return optimize_acqf(  # type: ignore
                 acq_function=acq_fn,
                 bounds=bounds,
@@ -189,13 +787,29 @@ def optimize_acq(
         1,
     )
     if n_combos > maximum_allowed_categorical_combinations:
-        raise ValueError(
-            "The number of fixed categorical dimensions is too high. "
-            "This will lead to an explosion in the number of possible "
-            f"combinations. Got: {n_combos} while the setting for the function"
-            f" is: {maximum_allowed_categorical_combinations=}. Consider reducing the "
-            "dimensions or consider encoding your categoricals in some other format."
+        # Too many combinations to optimize each of them, instead search over
+        # the categoricals locally.
+        logger.debug(
+            f"Optimizing the acquisition with local search as there are {n_combos}"
+            f" categorical combinations, more than the"
+            f" {maximum_allowed_categorical_combinations=}."
         )
+        if n_intial_start_points is None:
+            n_intial_start_points = min(64 * bounds.shape[-1] ** 2, 4096)
+
+        with warning_context:
+            return _optimize_acq_local_search(
+                acq_fn,
+                bounds,
+                q=n_candidates_required,
+                cardinalities={
+                    encoder.index_of[name]: t.domain.cardinality  # type: ignore
+                    for name, t in cat_transformers.items()
+                },
+                fixed_features=_fixed_features,
+                raw_samples=n_intial_start_points,
+                num_starts=num_restarts,
+            )
 
     # Right, now we generate all possible combinations
     # First, just collect the possible values per cat column
@@ -224,6 +838,18 @@ def optimize_acq(
         fixed_cats = [{**cat, **_fixed_features} for cat in fixed_cats]
 
     with warning_context:
+        if parallel:
+            return _optimize_acqf_mixed_parallel(
+                acq_fn,
+                bounds,
+                q=n_candidates_required,
+                num_restarts=min(num_restarts // n_combos, 2),
+                raw_samples=n_intial_start_points,
+                fixed_features_list=fixed_cats,
+                options=acq_options.get("options"),
+                n_workers=n_workers,
+            )
+
         # TODO: we should deterministically shuffle the fixed_categoricals
         # as the underlying function does not.
         return optimize_acqf_mixed(  # type: ignore
@@ -243,32 +869,50 @@ def encode_trials_for_gp(
     *,
     encoder: ConfigEncoder | None = None,
     device: torch.device | None = None,
+    cache: EncodedConfigCache | None = None,
 ) -> tuple[GPEncodedData, ConfigEncoder]:
     """Encode the trials for use in a GP.
 
     Args:
         trials: The trials to encode.
         space: The search space.
-        encoder: The encoder to use. If `None`, one will be created.
+        encoder: The encoder to use. If `None`, one will be created, or the one
+            of the `cache` is used.
         device: The device to use.
+        cache: A cache of encoded configurations to keep between calls, such that
+            only the configurations of new trials are encoded. It must use the same
+            `encoder` and `device`.
 
     Returns:
         The encoded data and the encoder
     """
-    train_configs: list[Mapping[str, Any]] = []
+    train_configs: dict[str, Mapping[str, Any]] = {}
     train_losses: list[float] | list[Sequence[float]] = []
     train_costs: list[float] = []
-    pending_configs: list[Mapping[str, Any]] = []
+    pending_configs: dict[str, Mapping[str, Any]] = {}
 
-    if encoder is None:
+    if cache is not None:
+        if encoder is not None and encoder is not cache.encoder:
+            raise ValueError("The `cache` must use the same `encoder`.")
+        if device != cache.device:
+            raise ValueError(
+                f"The `cache` is on device {cache.device}, but got {device=}."
+            )
+        encoder = cache.encoder
+    elif encoder is None:
         encoder = ConfigEncoder.from_parameters(parameters)
 
-    for trial in trials.values():
+    def _encode(configs: Mapping[str, Mapping[str, Any]]) -> torch.Tensor:
+        if cache is not None:
+            return cache.encode(configs)
+        return encoder.encode(list(configs.values()), device=device)
+
+    for trial_id, trial in trials.items():
         if trial.report is None:
-            pending_configs.append(trial.config)
+            pending_configs[trial_id] = trial.config
             continue
 
-        train_configs.append(trial.config)
+        train_configs[trial_id] = trial.config
 
         objective_to_minimize = trial.report.objective_to_minimize
         train_losses.append(
@@ -278,7 +922,7 @@ def encode_trials_for_gp(
         cost = trial.report.cost
         train_costs.append(torch.nan if cost is None else cost)
 
-    x_train = encoder.encode(train_configs, device=device)
+    x_train = _encode(train_configs)
     y_train = torch.tensor(train_losses, dtype=torch.float64, device=device)
 
     # OPTIM: The issue here is that the error could be a bug, in which case
@@ -293,24 +937,56 @@ def encode_trials_for_gp(
     y_train = torch.nan_to_num(y_train, nan=fill_value)
 
     cost_train = torch.tensor(train_costs, dtype=torch.float64, device=device)
-    if len(pending_configs) > 0:
-        x_pending = encoder.encode(pending_configs, device=device)
-    else:
-        x_pending = None
-
-    data = GPEncodedData(x=x_train, y=y_train, cost=cost_train, x_pending=x_pending)
+    x_pending = _encode(pending_configs) if len(pending_configs) > 0 else None
+
+    data = GPEncodedData(
+        x=x_train,
+        y=y_train,
+        cost=cost_train,
+        x_pending=x_pending,
+        trial_ids=list(train_configs),
+    )
     return data, encoder
 
 
+def acquisition_baseline(data: GPEncodedData, surrogate: GPSurrogate) -> torch.Tensor:
+    """The observed configurations to use as `X_baseline` for noisy acquisition
+    functions, such as `qLogNoisyExpectedImprovement`.
+
+    These functions sample the joint posterior over all baseline points, which is
+    cubic in their number. For a `"variational"` surrogate, only the best
+    [`VARIATIONAL_MAX_BASELINE`][neps.optimizers.models.gp.VARIATIONAL_MAX_BASELINE]
+    observations are kept, where for multiple objectives, the sum of the
+    standardized objectives is used.
+
+    Args:
+        data: The encoded observations.
+        surrogate: The kind of GP the acquisition function uses.
+
+    Returns:
+        The encoded configurations to use as baseline.
+    """
+    max_size = VARIATIONAL_MAX_BASELINE
+    if surrogate == "exact" or len(data.x) <= max_size:
+        return data.x
+
+    y = data.y
+    if y.ndim > 1:
+        y = ((y - y.mean(dim=0)) / y.std(dim=0).clamp_min(1e-9)).sum(dim=-1)
+
+    best = torch.topk(y, k=max_size, largest=False).indices
+    return data.x[best]
+
+
 def fit_and_acquire_from_gp(
     *,
-    gp: SingleTaskGP,
+    gp: SingleTaskGP | SingleTaskVariationalGP,
     x_train: torch.Tensor,
     encoder: ConfigEncoder,
     acquisition: AcquisitionFunction,
     prior: Prior | None = None,
     pibo_exp_term: float | None = None,
-    cost_gp: SingleTaskGP | None = None,
+    cost_gp: SingleTaskGP | SingleTaskVariationalGP | None = None,
     costs: torch.Tensor | None = None,
     cost_percentage_used: float | None = None,
     costs_on_log_scale: bool = True,
@@ -322,6 +998,9 @@ def fit_and_acquire_from_gp(
     fixed_acq_features: dict[str, Any] | None = None,
     acq_options: Mapping[str, Any] | None = None,
     hide_warnings: bool = False,
+    fit: bool = True,
+    surrogate: GPSurrogate = "exact",
+    acquisition_workers: int = 1,
 ) -> torch.Tensor:
     """Acquire the next configuration to evaluate using a GP.
 
@@ -363,10 +1042,18 @@ def fit_and_acquire_from_gp(
         n_initial_start_points: The number of initial start points to use during
             optimization.
         maximum_allowed_categorical_combinations: The maximum number of categorical
-            combinations to allow. If the number of combinations exceeds this, an error
-            will be raised.
+            combinations to optimize the acquisition function over one by one. If the
+            number of combinations exceeds this, a local search over the categoricals
+            is used instead.
         acq_options: Additional options to pass to the botorch `optimizer_acqf` function.
         hide_warnings: Whether to hide numerical warnings issued during GP routines.
+        fit: Whether to fit the hyperparameters of `gp`. Set this to `False` if
+            it was already fitted, for example with
+            [`fit_gp()`][neps.optimizers.models.gp.fit_gp].
+        surrogate: The kind of GP to use for the cost model, if `costs` are provided.
+        acquisition_workers: The number of forked processes to optimize the
+            acquisition function in, see
+            [`optimize_acq()`][neps.optimizers.models.gp.optimize_acq].
 
     Returns:
         The encoded next configuration(s) to evaluate. Use the encoder you provided
@@ -375,7 +1062,8 @@ def fit_and_acquire_from_gp(
     if seed is not None:
         raise NotImplementedError("Seed is not implemented yet for gps")
 
-    fit_gpytorch_mll(ExactMarginalLogLikelihood(likelihood=gp.likelihood, model=gp))
+    if fit:
+        _fit_hyperparameters(gp)
 
     if prior:
         if pibo_exp_term is None:
@@ -425,10 +1113,9 @@ def fit_and_acquire_from_gp(
             y_train_cost,
             encoder=encoder,
             y_transform=transform,
+            surrogate=surrogate,
         )
-        fit_gpytorch_mll(
-            ExactMarginalLogLikelihood(likelihood=cost_gp.likelihood, model=cost_gp)
-        )
+        _fit_hyperparameters(cost_gp)
         acquisition = cost_cooled_acq(
             acq_fn=acquisition,
             model=cost_gp,
@@ -447,5 +1134,6 @@ def fit_and_acquire_from_gp(
         acq_options=acq_options,
         maximum_allowed_categorical_combinations=maximum_allowed_categorical_combinations,
         hide_warnings=hide_warnings,
+        n_workers=acquisition_workers,
     )
     return candidates
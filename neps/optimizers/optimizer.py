@@ -27,7 +27,7 @@ from __future__ import annotations
 from abc import abstractmethod
 from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Protocol, TypedDict
+from typing import TYPE_CHECKING, Any, Protocol, TypedDict, runtime_checkable
 
 if TYPE_CHECKING:
     from neps.state.optimizer import BudgetInfo
@@ -77,3 +77,18 @@ class AskFunction(Protocol):
             The sampled configuration(s)
         """
         ...
+
+
+@runtime_checkable
+class SharesState(Protocol):
+    """An [`AskFunction`][neps.optimizers.optimizer.AskFunction] which keeps
+    state between calls that should be shared across workers.
+
+    Before the optimizer is asked for a new configuration, `shared_state` is set
+    to the state stored in the
+    [`OptimizationState`][neps.state.optimizer.OptimizationState] and afterwards,
+    whatever is in `shared_state` is written back. This happens while holding the
+    optimizer lock, so no two workers will see the same state at once.
+    """
+
+    shared_state: dict[str, Any] | None
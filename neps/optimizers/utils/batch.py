@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING
+
+from neps.state.trial import Trial
+
+if TYPE_CHECKING:
+    from neps.optimizers.optimizer import SampledConfig
+
+
+def sample_sequentially_with_pending(
+    sample: Callable[[Mapping[str, Trial]], SampledConfig],
+    trials: Mapping[str, Trial],
+    n: int,
+) -> list[SampledConfig]:
+    """Sample a batch of `n` configurations by sampling one at a time.
+
+    Each sampled configuration is added to the trials passed to the next call of
+    `sample` as a pending trial. This way, an optimizer which already accounts for
+    pending trials, for example by filling up brackets or by fantasizing their
+    outcome, naturally produces a batch of distinct configurations.
+
+    Args:
+        sample: Samples a single configuration given the current trials.
+        trials: The trials so far.
+        n: The number of configurations to sample.
+
+    Returns:
+        The sampled configurations, in the order they were sampled.
+    """
+    trials = dict(trials)
+    sampled: list[SampledConfig] = []
+    for _ in range(n):
+        config = sample(trials)
+        if config.id in trials:
+            raise RuntimeError(
+                f"Sampled configuration id '{config.id}' twice while sampling a batch"
+                f" of {n} configurations."
+            )
+
+        trials[config.id] = Trial.new(
+            trial_id=config.id,
+            config=config.config,
+            location="",
+            previous_trial=config.previous_config_id,
+            previous_trial_location=None,
+            time_sampled=time.time(),
+            worker_id="",
+        )
+        sampled.append(config)
+
+    return sampled
@@ -95,6 +95,64 @@ def async_hb_sample_bracket_to_run(max_rung: int, eta: int) -> int:
     return int(np.random.choice(range(max_rung + 1), p=bracket_probs))
 
 
+def _full_brackets(
+    table: pd.DataFrame,
+    *,
+    uniq_ids: Index,
+    bracket_of_id: np.ndarray,
+    n_brackets: int,
+    layouts: Sequence[dict[int, int]],
+) -> np.ndarray:
+    """Which brackets have all of their rungs filled up to capacity.
+
+    Such brackets are done and can never have another action, so they need not be
+    created. This is computed from the counts of configs per bracket and rung,
+    without going through the brackets one by one.
+
+    Args:
+        table: The table of configurations, indexed by (id, rung).
+        uniq_ids: The unique ids in the table.
+        bracket_of_id: The index of the bracket of each of the `uniq_ids`.
+        n_brackets: The number of brackets, a multiple of `len(layouts)`.
+        layouts: The rung capacities of each bracket `i`, repeating such that bracket
+            `i` has layout `layouts[i % len(layouts)]`.
+
+    Returns:
+        A boolean mask over the brackets.
+    """
+    rungs = table.index.get_level_values("rung").to_numpy()
+    max_rung = int(rungs.max()) if len(rungs) else -1
+    n_rungs = max(max_rung, *(max(layout) for layout in layouts)) + 1
+
+    counts = np.zeros((n_brackets, n_rungs), dtype=int)
+    row_brackets = bracket_of_id[uniq_ids.get_indexer(table.index.get_level_values("id"))]
+    np.add.at(counts, (row_brackets, rungs), 1)
+
+    full = np.empty(n_brackets, dtype=bool)
+    for i, layout in enumerate(layouts):
+        capacities = np.array(list(layout.values()))
+        layout_counts = counts[i :: len(layouts)][:, list(layout.keys())]
+        full[i :: len(layouts)] = (layout_counts >= capacities).all(axis=1)
+
+    return full
+
+
+def _mo_costs(contenders: pd.DataFrame) -> tuple[pd.DataFrame, np.ndarray]:
+    """The finished configs of a multi-objective table, along with their costs.
+
+    The `perf` of pending configs is a `nan` and that of failed configs an `inf`,
+    instead of an array of costs. Pending configs are left out and failed configs
+    get an `inf` for every objective.
+    """
+    perfs = contenders["perf"].to_numpy()
+    finished = np.array([np.ndim(p) > 0 or not np.isnan(p) for p in perfs], dtype=bool)
+    n_objectives = next((len(p) for p in perfs if np.ndim(p) > 0), 1)
+    costs = np.empty((int(finished.sum()), n_objectives), dtype=np.float64)
+    for i, perf in enumerate(perfs[finished]):
+        costs[i] = perf
+    return contenders.iloc[finished], costs
+
+
 @dataclass
 class Rung(Sized):
     """A rung in a bracket"""
@@ -165,7 +223,10 @@ class Rung(Sized):
         return _idx, config, perf
 
     def top_k(self, k: int) -> pd.DataFrame:
-        return self.table.nsmallest(k, "perf")
+        # Same as `nsmallest(k, "perf")`, which excludes pending configs, but faster
+        perf = self.table["perf"].to_numpy()
+        order = np.argsort(perf, kind="stable")[:k]
+        return self.table.iloc[order[~np.isnan(perf[order])]]
 
     def mo_selector(
         self,
@@ -184,8 +245,9 @@ class Rung(Sized):
             contenders = self.table
         match selector:
             case "nsga2":
-                raise NotImplementedError(
-                    "NSGA2 selector is not implemented yet. Please use epsnet."
+                return self.nsga2_selector(
+                    k=k,
+                    contenders=contenders,
                 )
             case "epsnet":
                 return self.epsnet_selector(
@@ -199,11 +261,21 @@ class Rung(Sized):
 
     def nsga2_selector(
         self,
+        *,
         k: int,
+        contenders: pd.DataFrame,
     ) -> pd.DataFrame:
         """Selects the best configurations based on NSGA2 algorithm.
-        Uses Non-dominated sorting and Crowding distance from Pymoo.
+        Uses Non-dominated sorting and Crowding distance.
         """
+        from neps.optimizers.utils.multiobjective.nsga2 import nondominated_sort
+
+        contenders, mo_costs = _mo_costs(contenders)
+        indices = nondominated_sort(
+            X=mo_costs,
+            max_items=k,
+        )
+        return contenders.iloc[indices]
 
     def epsnet_selector(
         self,
@@ -216,7 +288,7 @@ class Rung(Sized):
         """
         from neps.optimizers.utils.multiobjective.epsnet import nondominated_sort
 
-        mo_costs = np.vstack(contenders["perf"].values)
+        contenders, mo_costs = _mo_costs(contenders)
         indices = nondominated_sort(
             X=mo_costs,
             max_items=k,
@@ -357,8 +429,21 @@ class Sync:
         #   * If we have `1` unique id, then 1 // K == 0 while (K + 1) // K == 1
         N = (len(uniq_ids) + K) // K
 
+        # Brackets which are full are done, they would never give an action and so
+        # we only create those which are still active. There is always at least one,
+        # the last one, which has at least one empty slot.
+        full = _full_brackets(
+            table,
+            uniq_ids=uniq_ids,
+            bracket_of_id=np.arange(len(uniq_ids)) // K,
+            n_brackets=N,
+            layouts=[rung_sizes],
+        )
+
         # Now we take the unique ids and split them into batches of size K
-        bracket_id_slices: list[Index] = [uniq_ids[i * K : (i + 1) * K] for i in range(N)]
+        bracket_id_slices: list[Index] = [
+            uniq_ids[i * K : (i + 1) * K] for i in range(N) if not full[i]
+        ]
 
         # And now select the data for each of the unique_ids in the bracket
         bracket_datas = [
@@ -557,15 +642,33 @@ class Hyperband:
         K = sum(bottom_rung_sizes)
         N = max(len(all_ids) // K + 1, 1)
 
-        hb_id_slices: list[Index] = [all_ids[i * K : (i + 1) * K] for i in range(N)]
+        # As with `Sync`, we only create the hyperband brackets which still have
+        # an SH bracket which is not full. Each SH bracket gets its own index, going
+        # through the SH brackets of each hyperband bracket in turn.
+        offsets = np.cumsum([0, *bottom_rung_sizes])
+        positions = np.arange(len(all_ids))
+        sh_full: np.ndarray = _full_brackets(
+            table,
+            uniq_ids=all_ids,
+            bracket_of_id=(positions // K) * len(bracket_layouts)
+            + np.searchsorted(offsets, positions % K, side="right")
+            - 1,
+            n_brackets=N * len(bracket_layouts),
+            layouts=bracket_layouts,
+        )
+        hb_full: np.ndarray = np.asarray(
+            sh_full.reshape(-1, len(bracket_layouts)).all(axis=1), dtype=bool
+        )
+
+        hb_id_slices: list[Index] = [
+            all_ids[i * K : (i + 1) * K] for i in range(N) if not hb_full[i]
+        ]
 
         # Used if there is nothing for one of the rungs
         empty_slice = table.loc[[]]
 
         # Now for each of our HB brackets, we need to split them into the SH brackets
         hb_brackets: list[list[Sync]] = []
-
-        offsets = np.cumsum([0, *bottom_rung_sizes])
         for hb_ids in hb_id_slices:
             # Split the ids into each of the respective brackets, e.g. [81, 27, 9, ...]
             ids_for_each_bracket = [hb_ids[s:e] for s, e in pairwise(offsets)]
@@ -7,40 +7,12 @@ from __future__ import annotations
 
 import numpy as np
 
+from neps.optimizers.utils.multiobjective.pareto import (
+    nondominated_fronts,
+    pareto_efficient,
+)
 
-def pareto_efficient(X: np.ndarray) -> np.ndarray:
-    """
-    Evaluates for each allocation in the provided array whether it is Pareto efficient.
-    The costs are assumed to be improved by lowering them (eg lower is better).
-
-    Parameters
-    ----------
-    X: np.ndarray [N, D]
-        The allocations to check where N is the number of allocations and D the number of
-        costs per allocation.
-
-    Returns
-    -------
-    np.ndarray [N]
-        A boolean array, indicating for each allocation whether it is Pareto efficient.
-    """
-    # First, we assume that all allocations are Pareto efficient, i.e. not dominated
-    mask = np.ones(X.shape[0], dtype=bool)
-    # Then, we iterate over all allocations A and check which are dominated by then
-    # current allocation A. If it is, we don't need to check it against another
-    # allocation.
-    for i, allocation in enumerate(X):
-        # Only consider allocation if it hasn't been dominated yet
-        if mask[i]:
-            # An allocation is dominated by A if all costs are equal or lower
-            # and at least one cost is strictly lower. Using that definition,
-            # A cannot be dominated by itself.
-            dominated = np.all(allocation <= X[mask], axis=1) * np.any(
-                allocation < X[mask], axis=1
-            )
-            mask[mask] = ~dominated
-
-    return mask
+__all__ = ["compute_epsilon_net", "nondominated_sort", "pareto_efficient"]
 
 
 def compute_epsilon_net(X: np.ndarray, dim: int | None = None) -> np.ndarray:
@@ -48,7 +20,8 @@ def compute_epsilon_net(X: np.ndarray, dim: int | None = None) -> np.ndarray:
     Outputs an order of the items in the provided array such that the items are
     spaced well. This means that after choosing a seed item, the next item is
     chosen to be the farthest from the seed item. The third item is then chosen
-    to maximize the distance to the existing points and so on.
+    to maximize the distance to the existing points and so on. Items with non-finite
+    values are ordered last.
 
     This algorithm is taken from "Nearest-Neighbor Searching and Metric Space Dimensions"
     (Clarkson, 2005, p.17).
@@ -67,7 +40,20 @@ def compute_epsilon_net(X: np.ndarray, dim: int | None = None) -> np.ndarray:
     np.ndarray [N]
         A list of item indices, defining a sparsified order of the items.
     """
-    indices = set(range(X.shape[0]))
+    n = X.shape[0]
+
+    # Items with non-finite costs, such as failed configs, give no sensible distance,
+    # so only order the others and put them last, in the order they come
+    finite = np.isfinite(X).all(axis=-1)
+    if not finite.all():
+        finite_order = np.flatnonzero(finite)
+        if len(finite_order) > 0:
+            finite_order = finite_order[
+                np.argsort(compute_epsilon_net(X[finite], dim=dim))
+            ]
+        ranks = np.empty(n, dtype=int)
+        ranks[np.concatenate([finite_order, np.flatnonzero(~finite)])] = np.arange(n)
+        return ranks
 
     # Choose the seed item according to dim
     if dim is None:
@@ -75,27 +61,25 @@ def compute_epsilon_net(X: np.ndarray, dim: int | None = None) -> np.ndarray:
     else:
         initial_index = np.argmin(X, axis=0)[dim]
 
-    # Initialize the order
+    # Initialize the order, keeping track of the distance of every item to its
+    # closest chosen item, which only changes by the item chosen last.
     order = [initial_index]
-    indices.remove(initial_index)
+    chosen = np.zeros(n, dtype=bool)
+    chosen[initial_index] = True
+    min_distances = np.linalg.norm(X - X[initial_index], axis=-1)
 
     # Iterate until all models have been chosen
-    while indices:
-        # Get the distance to all items that have already been chosen
-        ordered_indices = list(indices)
-        diff = X[ordered_indices][:, None, :].repeat(len(order), axis=1) - X[order]
-        min_distances = np.linalg.norm(diff, axis=-1).min(-1)
-
-        # Then, choose the one with the maximum distance to all points
-        choice = ordered_indices[min_distances.argmax()]
+    for _ in range(n - 1):
+        # Choose the one with the maximum distance to all points
+        choice = int(np.where(chosen, -np.inf, min_distances).argmax())
         order.append(choice)
-        indices.remove(choice)
+        chosen[choice] = True
+        min_distances = np.minimum(min_distances, np.linalg.norm(X - X[choice], axis=-1))
 
     # convert argsort indices to rank
     ranks = np.empty(len(order), dtype=int)
-    for rank, i in enumerate(order):
-        ranks[i] = rank
-    return np.array(ranks)
+    ranks[order] = np.arange(len(order))
+    return ranks
 
 
 def nondominated_sort(
@@ -129,26 +113,17 @@ def nondominated_sort(
         The indices of the sorted items, either globally or within each of the
         Pareto front depending on the value of ``flatten``.
     """
-    remaining = np.arange(X.shape[0])
     indices = []
-    num_items = 0
 
-    # Iterate until max_items are reached or there are no items left
-    while remaining.size > 0 and (max_items is None or num_items < max_items):
-        # Compute the Pareto front and sort the items within
-        pareto_mask = pareto_efficient(X[remaining])
-        pareto_front = remaining[pareto_mask]
+    # Sort the items within each Pareto front, until max_items are reached
+    for pareto_front in nondominated_fronts(X, max_items=max_items):
         pareto_order = compute_epsilon_net(X[pareto_front], dim=dim)
-
-        # Add order to the indices
         indices.append(pareto_front[pareto_order].tolist())
-        num_items += len(pareto_front)
-
-        # Remove items in the Pareto front from the remaining items
-        remaining = remaining[~pareto_mask]
+        if max_items is not None and sum(len(x) for x in indices) >= max_items:
+            break
 
     # Restrict the number of items returned and optionally flatten
-    if max_items is not None:
+    if max_items is not None and indices:
         limit = max_items - sum(len(x) for x in indices[:-1])
         indices[-1] = indices[-1][:limit]
         if not indices[-1]:
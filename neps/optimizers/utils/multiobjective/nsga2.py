@@ -0,0 +1,84 @@
+"""Implements the NSGA-II multi-objective sort, ranking by non-dominated fronts and
+then by crowding distance within each front.
+Proposed in the paper: https://ieeexplore.ieee.org/document/996017
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from neps.optimizers.utils.multiobjective.pareto import nondominated_fronts
+
+
+def crowding_distance(X: np.ndarray) -> np.ndarray:
+    """Computes the crowding distance of each item, how far apart its neighbours are.
+
+    For each objective, the items are sorted and an item gets the distance between
+    the items before and after it, normalized by the range of that objective. The
+    crowding distance is the sum of these over the objectives, where the items at
+    the boundaries of any objective get an infinite distance.
+
+    Args:
+        X: The costs of the items, of shape `(N, D)`.
+
+    Returns:
+        The crowding distance of each item, of shape `(N,)`.
+    """
+    n, d = X.shape
+    if n <= 2:
+        return np.full(n, np.inf)
+
+    order = np.argsort(X, axis=0, kind="stable")
+    sorted_X = np.take_along_axis(X, order, axis=0)
+
+    span = sorted_X[-1] - sorted_X[0]
+    span[span == 0] = 1
+
+    gaps = np.empty((n, d), dtype=np.float64)
+    gaps[[0, -1]] = np.inf
+    with np.errstate(invalid="ignore"):
+        gaps[1:-1] = (sorted_X[2:] - sorted_X[:-2]) / span
+
+    # Infinite costs, such as those of failed configs, give no sensible distance
+    gaps[np.isnan(gaps)] = 0
+
+    distances = np.empty((n, d), dtype=np.float64)
+    np.put_along_axis(distances, order, gaps, axis=0)
+    return distances.sum(axis=1)
+
+
+def nondominated_sort(
+    X: np.ndarray,
+    max_items: int | None = None,
+    *,
+    flatten: bool = True,
+) -> list[int] | list[list[int]]:
+    """Performs the NSGA-II sort, ordering the items by their non-dominated front
+    and then by decreasing crowding distance within each front.
+
+    Args:
+        X: The multi-dimensional items to sort, of shape `(N, D)`.
+        max_items: The maximum number of items that should be returned.
+            When this is `None`, all items are sorted.
+        flatten: Whether to flatten the resulting array.
+
+    Returns:
+        The indices of the sorted items, either globally or within each of the
+        Pareto front depending on the value of `flatten`.
+    """
+    indices: list[list[int]] = []
+    n_items = 0
+    for front in nondominated_fronts(X, max_items=max_items):
+        if max_items is not None and n_items >= max_items:
+            break
+
+        order = np.argsort(-crowding_distance(X[front]), kind="stable")
+        if max_items is not None:
+            order = order[: max_items - n_items]
+
+        indices.append(front[order].tolist())
+        n_items += len(order)
+
+    if flatten:
+        return [i for ix in indices for i in ix]
+    return indices
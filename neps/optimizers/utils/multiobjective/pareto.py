@@ -0,0 +1,242 @@
+"""Pareto fronts and non-dominated sorting of multi-objective costs.
+
+All costs are minimized. A point dominates another if it is at least as good in every
+objective and strictly better in at least one, such that identical points do not
+dominate each other.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+
+import numpy as np
+
+_MAX_BLOCK_ELEMENTS = 2**20
+"""The maximum number of elements in one block of pairwise dominance checks."""
+
+_SWEEP_BLOCK_SIZE = 128
+"""The number of sorted points checked together against the front found so far."""
+
+
+def dominated_by(X: np.ndarray, by: np.ndarray) -> np.ndarray:
+    """Evaluates for each point in `X` whether it is dominated by any point in `by`.
+
+    Args:
+        X: The points to check, of shape `(N, D)`.
+        by: The points which may dominate them, of shape `(M, D)`.
+
+    Returns:
+        A boolean array of shape `(N,)`.
+    """
+    mask = np.zeros(len(X), dtype=bool)
+    if len(X) == 0 or len(by) == 0:
+        return mask
+
+    # Comparing one objective at a time is much faster than reducing over a small
+    # trailing axis of objectives.
+    step = max(_MAX_BLOCK_ELEMENTS // len(by), 1)
+    for start in range(0, len(X), step):
+        x = X[start : start + step]
+        weakly_better = np.ones((len(x), len(by)), dtype=bool)
+        strictly_better = np.zeros((len(x), len(by)), dtype=bool)
+        for j in range(X.shape[1]):
+            weakly_better &= by[None, :, j] <= x[:, j, None]
+            strictly_better |= by[None, :, j] < x[:, j, None]
+        mask[start : start + step] = (weakly_better & strictly_better).any(axis=-1)
+
+    return mask
+
+
+def pareto_efficient(X: np.ndarray) -> np.ndarray:
+    """Evaluates for each point whether it is Pareto efficient, i.e. not dominated.
+
+    Once sorted lexicographically, a point can only be dominated by the points before
+    it. For two objectives, this gives a single sweep keeping the lowest second cost
+    so far. Otherwise, the sorted points are checked in blocks against the front
+    found so far and each other, which only grows as the sweep goes on. This takes
+    `O(N * F)` comparisons for a front of size `F`.
+
+    Args:
+        X: The costs, of shape `(N, D)`.
+
+    Returns:
+        A boolean array of shape `(N,)`.
+    """
+    n, d = X.shape
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+
+    if d == 1:
+        return X[:, 0] == X[:, 0].min()
+
+    if d == 2:
+        # Sorted by the first and then second cost, a unique point is dominated iff
+        # any point before it has a second cost at least as low.
+        unique, inverse = np.unique(X, axis=0, return_inverse=True)
+        best_before = np.minimum.accumulate(np.concatenate([[np.inf], unique[:-1, 1]]))
+        return (unique[:, 1] < best_before)[inverse.reshape(-1)]
+
+    order = np.lexsort(X.T[::-1])
+    mask = np.zeros(n, dtype=bool)
+    mask[order[_sorted_pareto_efficient(X[order])]] = True
+    return mask
+
+
+def _sorted_pareto_efficient(S: np.ndarray) -> np.ndarray:
+    # The same as `pareto_efficient()` for lexicographically sorted points
+    fronts: list[np.ndarray] = []
+    front = S[:0]
+    mask = np.zeros(len(S), dtype=bool)
+    for start in range(0, len(S), _SWEEP_BLOCK_SIZE):
+        block = S[start : start + _SWEEP_BLOCK_SIZE]
+        keep = ~dominated_by(block, front)
+        keep[keep] = ~dominated_by(block[keep], block[keep])
+        mask[start : start + _SWEEP_BLOCK_SIZE] = keep
+        if keep.any():
+            fronts.append(block[keep])
+            front = np.concatenate(fronts)
+
+    return mask
+
+
+def nondominated_fronts(X: np.ndarray, max_items: int | None = None) -> list[np.ndarray]:
+    """Split the points into their successive non-dominated fronts.
+
+    The first front are the Pareto efficient points, the second front those which
+    are efficient once the first front is removed, and so on.
+
+    Args:
+        X: The costs, of shape `(N, D)`.
+        max_items: The fronts after the one which brings the total to at least this
+            many points are not needed, and may be left out. If `None`, all fronts
+            are returned.
+
+    Returns:
+        The indices of the points in each front, in order of the fronts and
+        ascending within each front.
+    """
+    n, d = X.shape
+    if n == 0:
+        return []
+
+    if d == 2:
+        return _nondominated_fronts_2d(X)
+
+    # Sorting once, the remaining points stay sorted as each front is removed
+    fronts: list[np.ndarray] = []
+    remaining = np.lexsort(X.T[::-1])
+    while remaining.size > 0 and (max_items is None or n - remaining.size < max_items):
+        mask = _sorted_pareto_efficient(X[remaining])
+        fronts.append(np.sort(remaining[mask]))
+        remaining = remaining[~mask]
+
+    return fronts
+
+
+def _nondominated_fronts_2d(X: np.ndarray) -> list[np.ndarray]:
+    # Going through the unique points sorted by the first and then second cost, the
+    # point goes in the first front which holds no point with a second cost at least
+    # as low. The lowest second cost of each front is increasing over the fronts.
+    unique, inverse = np.unique(X, axis=0, return_inverse=True)
+    lowest: list[float] = []
+    unique_ranks = np.empty(len(unique), dtype=int)
+    for i, cost in enumerate(unique[:, 1].tolist()):
+        rank = bisect_right(lowest, cost)
+        if rank == len(lowest):
+            lowest.append(cost)
+        else:
+            lowest[rank] = cost
+        unique_ranks[i] = rank
+
+    ranks = unique_ranks[inverse.reshape(-1)]
+    order = np.argsort(ranks, kind="stable")
+    splits = np.searchsorted(ranks[order], np.arange(1, len(lowest)))
+    return np.split(order, splits)
+
+
+@dataclass
+class ParetoArchive:
+    """The Pareto front of all the points added so far.
+
+    Each point is compared only against the current front when it is added, instead
+    of recomputing the front over all points.
+    """
+
+    n_objectives: int
+    """The number of objectives of each point."""
+
+    keys: list[Hashable] = field(default_factory=list, init=False)
+    """The keys of the points on the front."""
+
+    costs: np.ndarray = field(init=False)
+    """The costs of the points on the front, of shape `(len(keys), n_objectives)`."""
+
+    def __post_init__(self) -> None:
+        self.costs = np.empty((0, self.n_objectives), dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: Hashable, cost: np.ndarray) -> bool:
+        """Add a point to the archive.
+
+        Args:
+            key: The key of the point.
+            cost: The costs of the point, of shape `(n_objectives,)`.
+
+        Returns:
+            Whether the point is on the front, i.e. no point on it dominates it.
+        """
+        cost = np.asarray(cost, dtype=np.float64).reshape(1, self.n_objectives)
+        if dominated_by(cost, self.costs)[0]:
+            return False
+
+        keep = ~dominated_by(self.costs, cost)
+        self.keys = [k for k, kept in zip(self.keys, keep, strict=True) if kept]
+        self.costs = np.concatenate([self.costs[keep], cost])
+        self.keys.append(key)
+        return True
+
+
+def hypervolume(X: np.ndarray, reference_point: np.ndarray) -> float:
+    """Computes the hypervolume dominated by the points, bounded by a reference point.
+
+    Only points which are strictly better than the reference point in every
+    objective contribute. For two objectives, this is a sum over the sorted Pareto
+    front. With more objectives, the volume is sliced along the last objective and
+    the hypervolume of each slice is computed over the remaining objectives. This is
+    cheap for the sizes of fronts of typical runs, which is all that needs passing.
+
+    Args:
+        X: The costs, of shape `(N, D)`.
+        reference_point: The reference point, of shape `(D,)`.
+
+    Returns:
+        The hypervolume.
+    """
+    reference_point = np.asarray(reference_point, dtype=np.float64)
+    X = X[(reference_point > X).all(axis=1)]
+    if len(X) == 0:
+        return 0.0
+
+    X = X[pareto_efficient(X)]
+    if X.shape[1] == 1:
+        return float(reference_point[0] - X[:, 0].min())
+
+    if X.shape[1] == 2:
+        # On the front, the second cost decreases as the first one increases
+        X = np.unique(X, axis=0)
+        widths = np.diff(np.append(X[:, 0], reference_point[0]))
+        return float((widths * (reference_point[1] - X[:, 1])).sum())
+
+    X = X[np.argsort(X[:, -1], kind="stable")]
+    depths = np.diff(np.append(X[:, -1], reference_point[-1]))
+    return float(
+        sum(
+            depth * hypervolume(X[: i + 1, :-1], reference_point[:-1])
+            for i, depth in enumerate(depths)
+            if depth > 0
+        )
+    )
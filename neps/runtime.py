@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import datetime
+import inspect
 import logging
+import multiprocessing
+import multiprocessing.connection
 import os
+import pickle
 import shutil
+import threading
 import time
-from collections.abc import Callable, Iterator, Mapping
+from collections.abc import Awaitable, Callable, Iterator, Mapping
 from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
+from multiprocessing.connection import Connection
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, cast
 
 from portalocker import portalocker
 
@@ -19,9 +28,13 @@ from neps.env import (
     FS_SYNC_GRACE_BASE,
     FS_SYNC_GRACE_INC,
     LINUX_FILELOCK_FUNCTION,
+    LOCAL_WORKERS_START_METHOD,
     MAX_RETRIES_CREATE_LOAD_STATE,
     MAX_RETRIES_GET_NEXT_TRIAL,
     MAX_RETRIES_WORKER_CHECK_SHOULD_STOP,
+    PREFETCH_SAMPLER_POLL,
+    REPORT_BATCH_WINDOW,
+    TRIAL_FILELOCK_POLL,
 )
 from neps.exceptions import (
     NePSError,
@@ -40,12 +53,19 @@ from neps.state import (
     Trial,
     WorkerSettings,
     evaluate_trial,
+    evaluate_trial_async,
 )
+from neps.state.filebased import FileLocker
 from neps.utils.common import gc_disabled
 
 if TYPE_CHECKING:
+    from multiprocessing.context import SpawnContext
+    from multiprocessing.process import BaseProcess
+
     from neps.optimizers import OptimizerInfo
     from neps.optimizers.optimizer import AskFunction
+    from neps.state.trial import Report
+    from neps.state.trial_index import TrialIndex
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +111,12 @@ def _set_ddp_env_var(trial_id: str) -> None:
 _CURRENTLY_RUNNING_TRIAL_IN_PROCESS: Trial | None = None
 _WORKER_NEPS_STATE: NePSState | None = None
 
+# NOTE: The `AsyncWorker` evaluates many trials at once in a single process, each in
+# its own task, so it sets the trial per task instead.
+_CURRENTLY_RUNNING_TRIAL_IN_TASK: ContextVar[Trial | None] = ContextVar(
+    "_CURRENTLY_RUNNING_TRIAL_IN_TASK", default=None
+)
+
 
 # TODO: This only works with a filebased nepsstate
 def get_workers_neps_state() -> NePSState:
@@ -112,6 +138,10 @@ def _set_workers_neps_state(state: NePSState) -> None:
 
 def get_in_progress_trial() -> Trial:
     """Get the currently running trial in this process."""
+    trial = _CURRENTLY_RUNNING_TRIAL_IN_TASK.get()
+    if trial is not None:
+        return trial
+
     if _CURRENTLY_RUNNING_TRIAL_IN_PROCESS is None:
         raise RuntimeError(
             "The worker's NePS state has not been set! This should only be called"
@@ -195,7 +225,7 @@ class DefaultWorker:
         worker_id: str | None = None,
     ) -> DefaultWorker:
         """Create a new worker."""
-        return DefaultWorker(
+        return cls(
             state=state,
             optimizer=optimizer,
             settings=settings,
@@ -317,19 +347,15 @@ class DefaultWorker:
 
     def _check_global_stopping_criterion(
         self,
-        trials: Mapping[str, Trial],
+        index: TrialIndex,
     ) -> str | Literal[False]:
+        aggregates = index.aggregates
         if self.settings.max_evaluations_total is not None:
             if self.settings.include_in_progress_evaluations_towards_maximum:
-                count = sum(
-                    1
-                    for _, trial in trials.items()
-                    if trial.metadata.state
-                    not in (Trial.State.PENDING, Trial.State.SUBMITTED)
-                )
+                count = aggregates.n_started
             else:
                 # This indicates they have completed.
-                count = sum(1 for _, trial in trials.items() if trial.report is not None)
+                count = aggregates.n_reported
 
             if count >= self.settings.max_evaluations_total:
                 return (
@@ -340,11 +366,7 @@ class DefaultWorker:
                 )
 
         if self.settings.max_cost_total is not None:
-            cost = sum(
-                trial.report.cost
-                for _, trial in trials.items()
-                if trial.report is not None and trial.report.cost is not None
-            )
+            cost = aggregates.cost_total
             if cost >= self.settings.max_cost_total:
                 return (
                     f"The maximum cost `{self.settings.max_cost_total=}` has been"
@@ -353,12 +375,7 @@ class DefaultWorker:
                 )
 
         if self.settings.max_evaluation_time_total_seconds is not None:
-            time_spent = sum(
-                trial.report.evaluation_duration
-                for _, trial in trials.items()
-                if trial.report is not None
-                if trial.report.evaluation_duration is not None
-            )
+            time_spent = aggregates.evaluation_duration_total
             if time_spent >= self.settings.max_evaluation_time_total_seconds:
                 return (
                     "The maximum evaluation time of"
@@ -377,57 +394,77 @@ class DefaultWorker:
             or self.settings.max_evaluation_time_total_seconds is not None
         )
 
+    def _check_stopping_or_claim_pending(
+        self,
+        *,
+        grace: bool = True,
+    ) -> Trial | Literal["break"] | None:
+        """Check the global stopping criterion and otherwise try to claim a pending
+        trial for evaluation.
+
+        !!! warning
+
+            Requires the trial lock to be held.
+
+        Args:
+            grace: Whether to first wait for the file-system to sync, if this
+                worker encountered out-of-order issues before. Only needed once
+                per attempt at getting the next trial.
+        """
+        # Give the file-system some time to sync if we encountered out-of-order
+        # issues with this worker.
+        if grace and self._GRACE > 0:
+            time.sleep(self._GRACE)
+
+        index = self.state._latest_trial_index()
+        self.state._reclaim_expired_trials(index)
+
+        if self._requires_global_stopping_criterion:
+            should_stop = self._check_global_stopping_criterion(index)
+            if should_stop is not False:
+                logger.info(should_stop)
+                return "break"
+
+        pending = self.state._claim_next_pending_trial(index, worker_id=self.worker_id)
+        if pending is not None:
+            logger.info(
+                "Worker '%s' picked up pending trial: %s.",
+                self.worker_id,
+                pending.id,
+            )
+
+        return pending
+
     def _get_next_trial(self) -> Trial | Literal["break"]:
-        # If there are no global stopping criterion, we can no just return early.
+        # OPTIM: Picking up an already sampled trial does not need the optimizer,
+        # so we first try that without waiting on whoever is currently sampling.
+        # We try to prevent garbage collection from happening in here to
+        # minimize time spent holding on to the lock.
+        with self.state._trial_lock.lock(worker_id=self.worker_id), gc_disabled():
+            claimed = self._check_stopping_or_claim_pending()
+            if claimed is not None:
+                return claimed
+
         with self.state._optimizer_lock.lock(worker_id=self.worker_id):
             # NOTE: It's important to release the trial lock before sampling
             # as otherwise, any other service, such as reporting the result
             # of a trial. Hence we do not lock these together with the above.
-            # OPTIM: We try to prevent garbage collection from happening in here to
-            # minimize time spent holding on to the lock.
             with self.state._trial_lock.lock(worker_id=self.worker_id), gc_disabled():
-                # Give the file-system some time to sync if we encountered out-of-order
-                # issues with this worker.
-                if self._GRACE > 0:
-                    time.sleep(self._GRACE)
-
-                trials = self.state._trial_repo.latest()
-
-                if self._requires_global_stopping_criterion:
-                    should_stop = self._check_global_stopping_criterion(trials)
-                    if should_stop is not False:
-                        logger.info(should_stop)
-                        return "break"
-
-                pending_trials = [
-                    trial
-                    for trial in trials.values()
-                    if trial.metadata.state == Trial.State.PENDING
-                ]
-
-                if len(pending_trials) > 0:
-                    earliest_pending = sorted(
-                        pending_trials,
-                        key=lambda t: t.metadata.time_sampled,
-                    )[0]
-                    earliest_pending.set_evaluating(
-                        time_started=time.time(),
-                        worker_id=self.worker_id,
-                    )
-                    self.state._trial_repo.update_trial(
-                        earliest_pending, hints="metadata"
-                    )
-                    logger.info(
-                        "Worker '%s' picked up pending trial: %s.",
-                        self.worker_id,
-                        earliest_pending.id,
-                    )
-                    return earliest_pending
+                # Another worker may have sampled while we waited on the optimizer.
+                # We already waited for the file-system to sync above.
+                claimed = self._check_stopping_or_claim_pending(grace=False)
+                if claimed is not None:
+                    return claimed
+
+                index = self.state._latest_trial_index()
+                trials = dict(index.trials)
+                used_cost_budget = index.aggregates.cost_total
 
             sampled_trials = self.state._sample_trial(
                 optimizer=self.optimizer,
                 worker_id=self.worker_id,
                 trials=trials,
+                used_cost_budget=used_cost_budget,
                 n=self.settings.batch_size,
             )
             if isinstance(sampled_trials, Trial):
@@ -443,6 +480,9 @@ class DefaultWorker:
                 )
                 try:
                     self.state._trial_repo.store_new_trial(sampled_trials)
+                    self.state._trial_leases.claim(
+                        this_workers_trial.id, worker_id=self.worker_id, force=True
+                    )
                     if isinstance(sampled_trials, Trial):
                         logger.info(
                             "Worker '%s' sampled new trial: %s.",
@@ -483,14 +523,114 @@ class DefaultWorker:
                     DefaultWorker._GRACE = _grace + FS_SYNC_GRACE_INC
                     raise e
 
+    def _top_up_pending_trials(self) -> bool:
+        """Sample a new pending trial if there are fewer than
+        [`prefetch_trials`][neps.state.settings.WorkerSettings.prefetch_trials].
+
+        Returns:
+            Whether a trial was sampled.
+        """
+        assert self.settings.prefetch_trials is not None
+        with self.state._optimizer_lock.lock(worker_id=self.worker_id):
+            with self.state._trial_lock.lock(worker_id=self.worker_id), gc_disabled():
+                index = self.state._latest_trial_index()
+                if self.settings.max_evaluations_total is not None and (
+                    len(index.trials) >= self.settings.max_evaluations_total
+                ):
+                    return False
+
+                if self._requires_global_stopping_criterion and (
+                    self._check_global_stopping_criterion(index) is not False
+                ):
+                    return False
+
+                if index.count(Trial.State.PENDING) >= self.settings.prefetch_trials:
+                    return False
+
+                # The main thread keeps updating the index while we sample
+                trials = dict(index.trials)
+                used_cost_budget = index.aggregates.cost_total
+
+            sampled_trial = self.state._sample_trial(
+                optimizer=self.optimizer,
+                worker_id=self.worker_id,
+                trials=trials,
+                used_cost_budget=used_cost_budget,
+                n=None,
+                seed_global_rng=False,
+            )
+            with self.state._trial_lock.lock(worker_id=self.worker_id), gc_disabled():
+                self.state._trial_repo.store_new_trial(sampled_trial)
+
+        logger.debug(
+            "Worker '%s' prefetched trial: %s.", self.worker_id, sampled_trial.id
+        )
+        return True
+
+    def _prefetch_trials(self, stop: threading.Event) -> None:
+        """Keep pending trials topped up until `stop` is set, if elected to."""
+        election = FileLocker(
+            lock_path=self.state.path / ".sampler.lock",
+            poll=PREFETCH_SAMPLER_POLL,
+            timeout=0,
+        )
+        while not stop.is_set():
+            try:
+                with election.lock(worker_id=self.worker_id):
+                    logger.info("Worker '%s' is now prefetching trials.", self.worker_id)
+                    while not stop.is_set():
+                        try:
+                            sampled = self._top_up_pending_trials()
+                        except Exception:
+                            logger.exception(
+                                "Worker '%s' failed to prefetch a trial.",
+                                self.worker_id,
+                            )
+                            sampled = False
+
+                        if not sampled:
+                            # Woken up early once a pending trial gets picked up
+                            self._wait_for_trial_changes(timeout=PREFETCH_SAMPLER_POLL)
+            except portalocker.exceptions.LockException:
+                # Some other worker is prefetching, we take over if it goes away
+                stop.wait(PREFETCH_SAMPLER_POLL)
+
+    def _wait_for_trial_changes(self, timeout: float) -> None:
+        with self.state._trial_repo.changes.watch(poll=timeout) as changes:
+            changes.wait(timeout)
+
+    @contextmanager
+    def _prefetching(self) -> Iterator[None]:
+        if self.settings.prefetch_trials is None:
+            yield
+            return
+
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self._prefetch_trials,
+            args=(stop,),
+            name=f"neps-prefetch-{self.worker_id}",
+            daemon=True,
+        )
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
     # Forgive me lord, for I have sinned, this function is atrocious but complicated
     # due to locking.
-    def run(self) -> None:  # noqa: C901, PLR0912, PLR0915
+    def run(self) -> None:
         """Run the worker.
 
         Will keep running until one of the criterion defined by the `WorkerSettings`
         is met.
         """
+        with self._prefetching():
+            self._run()
+
+    def _run(self) -> None:
         _set_workers_neps_state(self.state)
 
         logger.info("Launching NePS")
@@ -498,24 +638,60 @@ class DefaultWorker:
         _time_monotonic_start = time.monotonic()
         _error_from_evaluation: Exception | None = None
 
+        while True:
+            trial_to_eval = self._next_trial_or_stop(
+                time_monotonic_start=_time_monotonic_start,
+                error_from_this_worker=_error_from_evaluation,
+            )
+            if trial_to_eval is None:
+                break
+
+            # We (this worker) has managed to set it to evaluating, now we can evaluate it
+            with (
+                _set_global_trial(trial_to_eval),
+                self.state._trial_leases.heartbeat(trial_to_eval.id),
+            ):
+                evaluated_trial, report = evaluate_trial(
+                    trial=trial_to_eval,
+                    evaluation_fn=self.evaluation_fn,
+                    default_report_values=self.settings.default_report_values,
+                )
+
+            if (err := self._record_evaluation(evaluated_trial, report)) is not None:
+                _error_from_evaluation = err
+
+            self._report_evaluations([(evaluated_trial, report)])
+
+    def _next_trial_or_stop(  # noqa: C901
+        self,
+        *,
+        time_monotonic_start: float,
+        error_from_this_worker: Exception | None,
+    ) -> Trial | None:
+        """Get the next trial to evaluate, retrying on failures.
+
+        Returns:
+            The trial, set to evaluating by this worker, or `None` if the worker
+            should stop.
+        """
         _repeated_fail_get_next_trial_count = 0
         n_repeated_failed_check_should_stop = 0
         while True:
             try:
                 # First check local worker settings
                 should_stop = self._check_worker_local_settings(
-                    time_monotonic_start=_time_monotonic_start,
-                    error_from_this_worker=_error_from_evaluation,
+                    time_monotonic_start=time_monotonic_start,
+                    error_from_this_worker=error_from_this_worker,
                 )
                 if should_stop is not False:
                     logger.info(should_stop)
-                    break
+                    return None
 
                 # Next check global errs having occured
                 should_stop = self._check_shared_error_stopping_criterion()
                 if should_stop is not False:
                     logger.info(should_stop)
-                    break
+                    return None
 
             except WorkerRaiseError as e:
                 # If we raise a specific error, we should stop the worker
@@ -537,7 +713,7 @@ class DefaultWorker:
                     self.worker_id,
                     exc_info=True,
                 )
-                time.sleep(1)  # Help stagger retries
+                self._wait_for_trial_changes(timeout=1)  # Help stagger retries
                 continue
 
             # From here, we now begin sampling or getting the next pending trial.
@@ -547,8 +723,8 @@ class DefaultWorker:
             try:
                 trial_to_eval = self._get_next_trial()
                 if trial_to_eval == "break":
-                    break
-                _repeated_fail_get_next_trial_count = 0
+                    return None
+                return trial_to_eval
             except Exception as e:
                 _repeated_fail_get_next_trial_count += 1
                 if isinstance(e, portalocker.exceptions.LockException):
@@ -568,7 +744,7 @@ class DefaultWorker:
                         self.worker_id,
                         exc_info=True,
                     )
-                    time.sleep(1)  # Help stagger retries
+                    self._wait_for_trial_changes(timeout=1)  # Help stagger retries
                 # NOTE: This is to prevent any infinite loops if we can't get a trial
                 if _repeated_fail_get_next_trial_count >= MAX_RETRIES_GET_NEXT_TRIAL:
                     raise WorkerFailedToGetPendingTrialsError(
@@ -577,52 +753,46 @@ class DefaultWorker:
                         " a row. Bailing!"
                     ) from e
 
-                continue
+    def _record_evaluation(self, trial: Trial, report: Report) -> Exception | None:
+        """Account for an evaluation done by this worker.
 
-            # We (this worker) has managed to set it to evaluating, now we can evaluate it
-            with _set_global_trial(trial_to_eval):
-                evaluated_trial, report = evaluate_trial(
-                    trial=trial_to_eval,
-                    evaluation_fn=self.evaluation_fn,
-                    default_report_values=self.settings.default_report_values,
-                )
-                evaluation_duration = evaluated_trial.metadata.evaluation_duration
-                assert evaluation_duration is not None
-                self.worker_cumulative_evaluation_time_seconds += evaluation_duration
+        Returns:
+            The error raised by the evaluation, if any.
+        """
+        evaluation_duration = trial.metadata.evaluation_duration
+        assert evaluation_duration is not None
+        self.worker_cumulative_evaluation_time_seconds += evaluation_duration
+        self.worker_cumulative_eval_count += 1
 
-            self.worker_cumulative_eval_count += 1
+        logger.info(
+            "Worker '%s' evaluated trial: %s as %s.",
+            self.worker_id,
+            trial.id,
+            trial.metadata.state,
+        )
 
-            logger.info(
-                "Worker '%s' evaluated trial: %s as %s.",
-                self.worker_id,
-                evaluated_trial.id,
-                evaluated_trial.metadata.state,
-            )
+        if report.cost is not None:
+            self.worker_cumulative_eval_cost += report.cost
 
-            if report.cost is not None:
-                self.worker_cumulative_eval_cost += report.cost
+        if report.err is not None:
+            logger.error(f"Error during evaluation of '{trial.id}' : {trial.config}.")
+            logger.exception(report.err)
 
-            if report.err is not None:
-                logger.error(
-                    f"Error during evaluation of '{evaluated_trial.id}'"
-                    f" : {evaluated_trial.config}."
-                )
-                logger.exception(report.err)
-                _error_from_evaluation = report.err
-
-            # We do not retry this, as if some other worker has
-            # managed to manipulate this trial in the meantime,
-            # then something has gone wrong
-            with self.state._trial_lock.lock(worker_id=self.worker_id):
-                self.state._report_trial_evaluation(
-                    trial=evaluated_trial,
-                    report=report,
-                    worker_id=self.worker_id,
-                )
-                # This is mostly for `tblogger`
+        return report.err
+
+    def _report_evaluations(self, evaluated: list[tuple[Trial, Report]]) -> None:
+        """Report evaluated trials to the state, committing them all at once."""
+        # We do not retry this, as if some other worker has
+        # managed to manipulate this trial in the meantime,
+        # then something has gone wrong
+        with self.state._trial_lock.lock(worker_id=self.worker_id):
+            self.state._report_trial_evaluations(evaluated, worker_id=self.worker_id)
+            # This is mostly for `tblogger`
+            for evaluated_trial, _ in evaluated:
                 for _key, callback in _TRIAL_END_CALLBACKS.items():
-                    callback(trial_to_eval)
+                    callback(evaluated_trial)
 
+        for evaluated_trial, report in evaluated:
             logger.debug("Config %s: %s", evaluated_trial.id, evaluated_trial.config)
             logger.debug("Loss %s: %s", evaluated_trial.id, report.objective_to_minimize)
             logger.debug("Cost %s: %s", evaluated_trial.id, report.objective_to_minimize)
@@ -630,6 +800,365 @@ class DefaultWorker:
                 "Learning Curve %s: %s", evaluated_trial.id, report.learning_curve
             )
 
+    def _can_start_evaluation(self, n_in_flight: int) -> bool:
+        if n_in_flight >= self.settings.max_concurrent_evaluations:
+            return False
+
+        # Evaluations in flight will count towards this worker's maximum once done
+        max_evaluations = self.settings.max_evaluations_for_worker
+        return (
+            max_evaluations is None
+            or self.worker_cumulative_eval_count + n_in_flight < max_evaluations
+        )
+
+
+@dataclass
+class AsyncWorker(DefaultWorker):
+    """A worker for an `async def` evaluation function.
+
+    Rather than evaluating one trial at a time, it keeps up to
+    [`max_concurrent_evaluations`][neps.state.settings.WorkerSettings.max_concurrent_evaluations]
+    evaluations in flight on an event loop, which lets a single process drive many
+    I/O bound evaluations, such as submitting jobs to a cluster or calling out to
+    a simulator.
+
+    Getting the next trial, which may require sampling from the optimizer, is done
+    in a thread such that it does not block the evaluations in flight. Evaluations
+    which finish together, or within `NEPS_REPORT_BATCH_WINDOW` seconds of each other,
+    are reported in a single commit to the state.
+    """
+
+    def run(self) -> None:
+        """Run the worker.
+
+        Will keep running until one of the criterion defined by the `WorkerSettings`
+        is met and all evaluations in flight have finished.
+        """
+        with self._prefetching():
+            asyncio.run(self._run_async())
+
+    async def _run_async(self) -> None:
+        _set_workers_neps_state(self.state)
+
+        logger.info("Launching NePS")
+
+        _time_monotonic_start = time.monotonic()
+        _error_from_evaluation: Exception | None = None
+
+        in_flight: dict[asyncio.Task[tuple[Trial, Report]], Trial] = {}
+        heartbeat = asyncio.create_task(self._renew_leases(in_flight))
+        stopping = False
+        try:
+            while True:
+                while not stopping and self._can_start_evaluation(len(in_flight)):
+                    trial_to_eval = await asyncio.to_thread(
+                        self._next_trial_or_stop,
+                        time_monotonic_start=_time_monotonic_start,
+                        error_from_this_worker=_error_from_evaluation,
+                    )
+                    if trial_to_eval is None:
+                        stopping = True
+                        break
+
+                    task = asyncio.create_task(self._evaluate(trial_to_eval))
+                    in_flight[task] = trial_to_eval
+
+                if not in_flight:
+                    break
+
+                done, pending = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                if REPORT_BATCH_WINDOW > 0 and pending:
+                    # Give evaluations finishing right after a chance to be
+                    # reported together with these
+                    more, _ = await asyncio.wait(pending, timeout=REPORT_BATCH_WINDOW)
+                    done |= more
+                evaluated = []
+                for task in done:
+                    del in_flight[task]
+                    evaluated_trial, report = task.result()
+                    if (
+                        err := self._record_evaluation(evaluated_trial, report)
+                    ) is not None:
+                        _error_from_evaluation = err
+                    evaluated.append((evaluated_trial, report))
+
+                await asyncio.to_thread(self._report_evaluations, evaluated)
+
+                # Errors may require us to stop, or raise, even if we already stopped
+                # starting new evaluations
+                if stopping:
+                    self._check_worker_local_settings(
+                        time_monotonic_start=_time_monotonic_start,
+                        error_from_this_worker=_error_from_evaluation,
+                    )
+        finally:
+            heartbeat.cancel()
+            for task in in_flight:
+                task.cancel()
+
+    async def _evaluate(self, trial: Trial) -> tuple[Trial, Report]:
+        token = _CURRENTLY_RUNNING_TRIAL_IN_TASK.set(trial)
+        try:
+            return await evaluate_trial_async(
+                trial=trial,
+                # Only chosen for `async def` evaluation functions, see `_worker_cls()`
+                evaluation_fn=cast(
+                    "Callable[..., Awaitable[EvaluatePipelineReturn]]",
+                    self.evaluation_fn,
+                ),
+                default_report_values=self.settings.default_report_values,
+            )
+        finally:
+            _CURRENTLY_RUNNING_TRIAL_IN_TASK.reset(token)
+
+    async def _renew_leases(self, in_flight: Mapping[Any, Trial]) -> None:
+        # NOTE: One task renewing every lease, rather than a heartbeat thread for each
+        # of the possibly hundreds of evaluations in flight.
+        leases = self.state._trial_leases
+        if leases.duration is None:
+            return
+
+        while True:
+            await asyncio.sleep(leases.duration / 4)
+            for trial in list(in_flight.values()):
+                if not leases.renew(trial.id):
+                    logger.warning(
+                        "Lost the lease on trial '%s' while evaluating it.", trial.id
+                    )
+
+
+def _evaluate_in_child_process(
+    connection: Connection,
+    *,
+    path: Path,
+    evaluation_fn: Callable[..., EvaluatePipelineReturn],
+    default_report_values: DefaultReportValues,
+) -> None:
+    """Evaluate the trials sent by a [`ProcessPoolWorker`][neps.runtime.ProcessPoolWorker]
+    until it sends `None` or goes away.
+    """
+    # Some of our utilities, such as loading checkpoints, need to read the state
+    _set_workers_neps_state(NePSState.create_or_load(path=path, load_only=True))
+
+    while True:
+        try:
+            trial = connection.recv()
+        except EOFError:
+            return
+
+        if trial is None:
+            return
+
+        with _set_global_trial(trial):
+            evaluated_trial, report = evaluate_trial(
+                trial=trial,
+                evaluation_fn=evaluation_fn,
+                default_report_values=default_report_values,
+            )
+
+        # This is mostly for `tblogger`, which registers these in the evaluation
+        for _key, callback in _TRIAL_END_CALLBACKS.items():
+            callback(evaluated_trial)
+
+        try:
+            connection.send((evaluated_trial, report))
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # The user's exception may not survive being sent back
+            report.err = NePSError(f"{type(report.err).__name__}: {report.err}")
+            connection.send((evaluated_trial, report))
+
+
+@dataclass
+class _ChildProcess:
+    process: BaseProcess
+    connection: Connection
+
+
+@dataclass
+class ProcessPoolWorker(DefaultWorker):
+    """A worker which evaluates trials in a pool of child processes on this machine.
+
+    Rather than each process being a worker of its own, which all have to keep in
+    sync through the state on disk, only this worker reads and writes the state.
+    It hands trials out to
+    [`max_concurrent_evaluations`][neps.state.settings.WorkerSettings.max_concurrent_evaluations]
+    child processes over pipes and they send back the
+    [`Report`][neps.state.trial.Report] of each evaluation, such that the locks on
+    the state are never contended by the children. As with the
+    [`AsyncWorker`][neps.runtime.AsyncWorker], evaluations which finish together are
+    reported in a single commit.
+
+    If a child process dies, the trial it was evaluating is set back to pending
+    and the child is replaced.
+
+    !!! note
+
+        The child processes are started with the start method given by
+        `NEPS_LOCAL_WORKERS_START_METHOD`, by default the platform's default. When
+        prefetching trials, the default is `#!python "forkserver"` instead, or
+        `#!python "spawn"` where that is not available, as forking while the
+        prefetch thread samples could deadlock the child on a lock that thread held.
+        If the start method is not `#!python "fork"`, the evaluation function must
+        be picklable, i.e. importable from a module.
+    """
+
+    def run(self) -> None:
+        """Run the worker.
+
+        Will keep running until one of the criterion defined by the `WorkerSettings`
+        is met and all evaluations in the child processes have finished.
+        """
+        with self._prefetching():
+            self._run_pool()
+
+    def _start_method(self) -> str | None:
+        if (
+            LOCAL_WORKERS_START_METHOD is not None
+            or self.settings.prefetch_trials is None
+        ):
+            return LOCAL_WORKERS_START_METHOD
+
+        # Children are started, and replaced, while the prefetch thread may be in the
+        # middle of sampling, so they must not be forked
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            return "forkserver"
+        return "spawn"
+
+    def _start_child(self) -> _ChildProcess:
+        # NOTE: Typed as the context of one start method, as `BaseContext` is not
+        # known to have `Process`, even though every concrete context does.
+        context = cast("SpawnContext", multiprocessing.get_context(self._start_method()))
+        ours, theirs = context.Pipe()
+        process = context.Process(
+            target=_evaluate_in_child_process,
+            args=(theirs,),
+            kwargs={
+                "path": self.state.path,
+                "evaluation_fn": self.evaluation_fn,
+                "default_report_values": self.settings.default_report_values,
+            },
+            name=f"neps-worker-{self.worker_id}",
+        )
+        process.start()
+        theirs.close()
+        return _ChildProcess(process=process, connection=ours)
+
+    def _run_pool(self) -> None:  # noqa: C901, PLR0912, PLR0915
+        _set_workers_neps_state(self.state)
+
+        logger.info("Launching NePS")
+
+        _time_monotonic_start = time.monotonic()
+        _error_from_evaluation: Exception | None = None
+
+        leases = self.state._trial_leases
+        renew_every = leases.duration / 4 if leases.duration is not None else None
+        next_renewal = time.monotonic() + (renew_every or 0)
+
+        idle = [
+            self._start_child() for _ in range(self.settings.max_concurrent_evaluations)
+        ]
+        busy: dict[Connection, tuple[_ChildProcess, Trial]] = {}
+        stopping = False
+        try:
+            while True:
+                while not stopping and idle and self._can_start_evaluation(len(busy)):
+                    trial_to_eval = self._next_trial_or_stop(
+                        time_monotonic_start=_time_monotonic_start,
+                        error_from_this_worker=_error_from_evaluation,
+                    )
+                    if trial_to_eval is None:
+                        stopping = True
+                        break
+
+                    child = idle.pop()
+                    try:
+                        child.connection.send(trial_to_eval)
+                    except OSError:
+                        # It died while idle, its replacement takes the trial instead
+                        child.process.join()
+                        child = self._start_child()
+                        child.connection.send(trial_to_eval)
+                    busy[child.connection] = (child, trial_to_eval)
+
+                if not busy:
+                    break
+
+                timeout = (
+                    max(0, next_renewal - time.monotonic())
+                    if renew_every is not None
+                    else None
+                )
+                ready = multiprocessing.connection.wait(list(busy), timeout=timeout)
+                if ready and REPORT_BATCH_WINDOW > 0 and len(ready) < len(busy):
+                    # Give evaluations finishing right after a chance to be
+                    # reported together with these
+                    time.sleep(REPORT_BATCH_WINDOW)
+                    ready = multiprocessing.connection.wait(list(busy), timeout=0)
+                if renew_every is not None and time.monotonic() >= next_renewal:
+                    for _, trial in busy.values():
+                        leases.renew(trial.id)
+                    next_renewal = time.monotonic() + renew_every
+
+                evaluated: list[tuple[Trial, Report]] = []
+                died: list[Trial] = []
+                for connection in ready:
+                    assert isinstance(connection, Connection)
+                    child, trial = busy.pop(connection)
+                    try:
+                        evaluated_trial, report = connection.recv()
+                    except (EOFError, OSError):
+                        logger.error(
+                            "The process evaluating trial '%s' died, setting it back"
+                            " to pending.",
+                            trial.id,
+                        )
+                        child.process.join()
+                        died.append(trial)
+                        idle.append(self._start_child())
+                        continue
+
+                    idle.append(child)
+                    if (
+                        err := self._record_evaluation(evaluated_trial, report)
+                    ) is not None:
+                        _error_from_evaluation = err
+                    evaluated.append((evaluated_trial, report))
+
+                if died:
+                    with self.state._trial_lock.lock(worker_id=self.worker_id):
+                        for trial in died:
+                            self.state._return_trial_to_pending(trial)
+
+                    # The stopping criterion may have counted what is now pending,
+                    # though not if an evaluation error is what stopped us
+                    if _error_from_evaluation is None:
+                        stopping = False
+
+                if evaluated:
+                    self._report_evaluations(evaluated)
+
+                # Errors may require us to stop, or raise, even if we already stopped
+                # starting new evaluations
+                if stopping:
+                    self._check_worker_local_settings(
+                        time_monotonic_start=_time_monotonic_start,
+                        error_from_this_worker=_error_from_evaluation,
+                    )
+        finally:
+            children = idle + [child for child, _ in busy.values()]
+            for child in children:
+                with contextlib.suppress(OSError):
+                    child.connection.send(None)
+                child.connection.close()
+
+            for child in children:
+                child.process.join(timeout=5)
+                if child.process.is_alive():
+                    child.process.terminate()
+
 
 def _launch_ddp_runtime(
     *,
@@ -644,43 +1173,135 @@ def _launch_ddp_runtime(
     # TODO: This could accidentally spin lock if the break is never hit.
     # This is quite dangerous as it could look like the worker is running but
     # it's not actually doing anything.
-    while True:
-        current_eval_trials = neps_state.lock_and_get_current_evaluating_trials()
-
-        # If the worker id on previous trial is the same as the current one,
-        # only then evaluate it.
-        if len(current_eval_trials) == 0:
-            continue
-
-        current_trial: Trial | None = None
-        if prev_trial is None:
-            # In the beginning, we simply read the current trial from the env variable
-            current_id = os.getenv(_DDP_ENV_VAR_NAME, "").strip()
-            if current_id == "":
-                raise RuntimeError(
-                    "In a pytorch-lightning DDP setup, the environment variable"
-                    f" '{_DDP_ENV_VAR_NAME}' was not set. This is probably a bug"
-                    " in NePS and should be reported."
+    with neps_state._trial_repo.changes.watch(poll=TRIAL_FILELOCK_POLL) as changes:
+        while True:
+            current_eval_trials = neps_state.lock_and_get_current_evaluating_trials()
+
+            # If the worker id on previous trial is the same as the current one,
+            # only then evaluate it.
+            if len(current_eval_trials) == 0:
+                changes.wait()
+                continue
+
+            current_trial: Trial | None = None
+            if prev_trial is None:
+                # In the beginning, we simply read the current trial from the env variable
+                current_id = os.getenv(_DDP_ENV_VAR_NAME, "").strip()
+                if current_id == "":
+                    raise RuntimeError(
+                        "In a pytorch-lightning DDP setup, the environment variable"
+                        f" '{_DDP_ENV_VAR_NAME}' was not set. This is probably a bug"
+                        " in NePS and should be reported."
+                    )
+
+                current_trial = neps_state.lock_and_get_trial_by_id(current_id)
+
+            else:
+                for trial in current_eval_trials:
+                    if (
+                        trial.metadata.evaluating_worker_id
+                        == prev_trial.metadata.evaluating_worker_id
+                    ) and (trial.id != prev_trial.id):
+                        current_trial = trial
+                        break
+
+            if current_trial is not None:
+                evaluate_trial(
+                    current_trial,
+                    evaluation_fn=evaluation_fn,
+                    default_report_values=default_report_values,
                 )
+                prev_trial = current_trial
+            else:
+                changes.wait()
 
-            current_trial = neps_state.lock_and_get_trial_by_id(current_id)
 
-        else:
-            for trial in current_eval_trials:
-                if (
-                    trial.metadata.evaluating_worker_id
-                    == prev_trial.metadata.evaluating_worker_id
-                ) and (trial.id != prev_trial.id):
-                    current_trial = trial
-                    break
+def _worker_cls(
+    evaluation_fn: Callable[..., Any],
+    *,
+    n_workers: int,
+) -> type[DefaultWorker]:
+    if inspect.iscoroutinefunction(evaluation_fn):
+        if n_workers > 1:
+            raise ValueError(
+                "`n_workers=` can not be used with an `async def` evaluation function,"
+                " use `max_concurrent_evaluations=` to run several evaluations at once."
+            )
+        return AsyncWorker
 
-        if current_trial is not None:
-            evaluate_trial(
-                current_trial,
-                evaluation_fn=evaluation_fn,
-                default_report_values=default_report_values,
+    if n_workers > 1:
+        return ProcessPoolWorker
+
+    return DefaultWorker
+
+
+def _create_or_load_state(
+    optimization_dir: Path,
+    *,
+    optimizer_info: OptimizerInfo,
+    max_cost_total: float | None,
+    max_evaluations_total: int | None,
+) -> NePSState:
+    """Create the NePS state in `optimization_dir` or load the one already there,
+    retrying as other workers may be creating it at the same time.
+    """
+    for _retry_count in range(MAX_RETRIES_CREATE_LOAD_STATE):
+        try:
+            return NePSState.create_or_load(
+                path=optimization_dir,
+                load_only=False,
+                optimizer_info=optimizer_info,
+                optimizer_state=OptimizationState(
+                    seed_snapshot=SeedSnapshot.new_capture(),
+                    budget=(
+                        BudgetInfo(
+                            max_cost_total=max_cost_total,
+                            used_cost_budget=0,
+                            max_evaluations=max_evaluations_total,
+                            used_evaluations=0,
+                        )
+                    ),
+                    shared_state=None,  # TODO: Unused for the time being...
+                ),
+            )
+        except Exception:  # noqa: BLE001
+            time.sleep(0.5)
+            logger.debug(
+                "Error while trying to create or load the NePS state. Retrying...",
+                exc_info=True,
             )
-            prev_trial = current_trial
+
+    raise RuntimeError(
+        "Failed to create or load the NePS state after"
+        f" {MAX_RETRIES_CREATE_LOAD_STATE} attempts. Bailing!"
+        " Please enable debug logging to see the errors that occured."
+    )
+
+
+def _set_portalocker_locker() -> None:
+    """Set the function `portalocker` locks files with, according to
+    `NEPS_LINUX_FILELOCK_FUNCTION`.
+    """
+    # HACK: Due to nfs file-systems, locking with the default `flock()` is not reliable.
+    # Hence, we overwrite `portalockers` lock call to use `lockf()` instead.
+    # This is commeneted in their source code that this is an option to use, however
+    # it's not directly advertised as a parameter/env variable or otherwise.
+    import portalocker.portalocker as portalocker_lock_module
+
+    try:
+        import fcntl
+
+        if LINUX_FILELOCK_FUNCTION.lower() == "flock":
+            setattr(portalocker_lock_module, "LOCKER", fcntl.flock)  # type: ignore[attr-defined]
+        elif LINUX_FILELOCK_FUNCTION.lower() == "lockf":
+            setattr(portalocker_lock_module, "LOCKER", fcntl.lockf)  # type: ignore[attr-defined]
+        else:
+            raise ValueError(
+                f"Unknown file-locking function '{LINUX_FILELOCK_FUNCTION}'."
+                " Must be one of 'flock' or 'lockf'."
+            )
+    except ImportError:
+        pass
 
 
 # TODO: This should be done directly in `api.run` at some point to make it clearer at an
@@ -700,7 +1321,12 @@ def _launch_runtime(  # noqa: PLR0913
     max_evaluations_total: int | None,
     max_evaluations_for_worker: int | None,
     sample_batch_size: int | None,
+    prefetch_trials: int | None,
+    max_concurrent_evaluations: int,
+    n_workers: int,
 ) -> None:
+    worker_cls = _worker_cls(evaluation_fn, n_workers=n_workers)
+
     default_report_values = DefaultReportValues(
         objective_value_on_error=objective_value_on_error,
         cost_value_on_error=cost_value_on_error,
@@ -726,38 +1352,12 @@ def _launch_runtime(  # noqa: PLR0913
         )
         shutil.rmtree(optimization_dir)
 
-    for _retry_count in range(MAX_RETRIES_CREATE_LOAD_STATE):
-        try:
-            neps_state = NePSState.create_or_load(
-                path=optimization_dir,
-                load_only=False,
-                optimizer_info=optimizer_info,
-                optimizer_state=OptimizationState(
-                    seed_snapshot=SeedSnapshot.new_capture(),
-                    budget=(
-                        BudgetInfo(
-                            max_cost_total=max_cost_total,
-                            used_cost_budget=0,
-                            max_evaluations=max_evaluations_total,
-                            used_evaluations=0,
-                        )
-                    ),
-                    shared_state=None,  # TODO: Unused for the time being...
-                ),
-            )
-            break
-        except Exception:  # noqa: BLE001
-            time.sleep(0.5)
-            logger.debug(
-                "Error while trying to create or load the NePS state. Retrying...",
-                exc_info=True,
-            )
-    else:
-        raise RuntimeError(
-            "Failed to create or load the NePS state after"
-            f" {MAX_RETRIES_CREATE_LOAD_STATE} attempts. Bailing!"
-            " Please enable debug logging to see the errors that occured."
-        )
+    neps_state = _create_or_load_state(
+        optimization_dir,
+        optimizer_info=optimizer_info,
+        max_cost_total=max_cost_total,
+        max_evaluations_total=max_evaluations_total,
+    )
 
     settings = WorkerSettings(
         on_error=(
@@ -766,6 +1366,10 @@ def _launch_runtime(  # noqa: PLR0913
             else OnErrorPossibilities.RAISE_ANY_ERROR
         ),
         batch_size=sample_batch_size,
+        prefetch_trials=prefetch_trials,
+        max_concurrent_evaluations=(
+            n_workers if worker_cls is ProcessPoolWorker else max_concurrent_evaluations
+        ),
         default_report_values=default_report_values,
         max_evaluations_total=max_evaluations_total,
         include_in_progress_evaluations_towards_maximum=(
@@ -779,28 +1383,9 @@ def _launch_runtime(  # noqa: PLR0913
         max_cost_for_worker=None,  # TODO: User can't specify yet
     )
 
-    # HACK: Due to nfs file-systems, locking with the default `flock()` is not reliable.
-    # Hence, we overwrite `portalockers` lock call to use `lockf()` instead.
-    # This is commeneted in their source code that this is an option to use, however
-    # it's not directly advertised as a parameter/env variable or otherwise.
-    import portalocker.portalocker as portalocker_lock_module
-
-    try:
-        import fcntl
-
-        if LINUX_FILELOCK_FUNCTION.lower() == "flock":
-            setattr(portalocker_lock_module, "LOCKER", fcntl.flock)  # type: ignore[attr-defined]
-        elif LINUX_FILELOCK_FUNCTION.lower() == "lockf":
-            setattr(portalocker_lock_module, "LOCKER", fcntl.lockf)  # type: ignore[attr-defined]
-        else:
-            raise ValueError(
-                f"Unknown file-locking function '{LINUX_FILELOCK_FUNCTION}'."
-                " Must be one of 'flock' or 'lockf'."
-            )
-    except ImportError:
-        pass
+    _set_portalocker_locker()
 
-    worker = DefaultWorker.new(
+    worker = worker_cls.new(
         state=neps_state,
         optimizer=optimizer,
         evaluation_fn=evaluation_fn,
@@ -494,3 +494,69 @@ class ConfigEncoder:
                     raise ValueError(f"Unsupported parameter type: {type(hp)}.")
 
         return cls(transformers)
+
+
+@dataclass
+class EncodedConfigCache:
+    """A cache of encoded configurations, keyed by an id such as the trial id.
+
+    Configurations of trials never change, so when encoding the trials on every
+    call to an optimizer, only those with an id not seen before need to be encoded.
+    The encoded rows are kept in an append-only buffer which grows geometrically.
+
+    ```python
+    cache = EncodedConfigCache(encoder)
+    x = cache.encode({trial_id: trial.config for trial_id, trial in trials.items()})
+    ```
+    """
+
+    encoder: ConfigEncoder
+    """The encoder to encode configurations with."""
+
+    device: torch.device | None = None
+    """The device of the encoded tensors."""
+
+    dtype: torch.dtype = torch.float64
+    """The dtype of the encoded tensors."""
+
+    _buffer: torch.Tensor = field(init=False, repr=False)
+    _index: dict[str, int] = field(init=False, default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self._buffer = torch.empty(
+            (0, self.encoder.ndim), dtype=self.dtype, device=self.device
+        )
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def encode(self, configs: Mapping[str, Mapping[str, Any]]) -> torch.Tensor:
+        """Encode the configurations, in order, encoding only those with a new id.
+
+        Args:
+            configs: The configurations to encode, keyed by their id.
+
+        Returns:
+            A tensor of shape `(len(configs), encoder.ndim)`.
+        """
+        new_ids = [_id for _id in configs if _id not in self._index]
+        if len(new_ids) > 0:
+            encoded = self.encoder.encode(
+                [configs[_id] for _id in new_ids], device=self.device, dtype=self.dtype
+            )
+            n = len(self._index)
+            if n + len(new_ids) > len(self._buffer):
+                capacity = max(n + len(new_ids), 2 * len(self._buffer))
+                buffer = torch.empty(
+                    (capacity, self.encoder.ndim), dtype=self.dtype, device=self.device
+                )
+                buffer[:n] = self._buffer[:n]
+                self._buffer = buffer
+
+            self._buffer[n : n + len(new_ids)] = encoded
+            self._index.update((_id, n + i) for i, _id in enumerate(new_ids))
+
+        rows = torch.tensor(
+            [self._index[_id] for _id in configs], dtype=torch.long, device=self.device
+        )
+        return self._buffer[rows]
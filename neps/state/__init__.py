@@ -1,6 +1,11 @@
 from neps.state.neps_state import NePSState
 from neps.state.optimizer import BudgetInfo, OptimizationState
-from neps.state.pipeline_eval import EvaluatePipelineReturn, UserResult, evaluate_trial
+from neps.state.pipeline_eval import (
+    EvaluatePipelineReturn,
+    UserResult,
+    evaluate_trial,
+    evaluate_trial_async,
+)
 from neps.state.seed_snapshot import SeedSnapshot
 from neps.state.settings import DefaultReportValues, OnErrorPossibilities, WorkerSettings
 from neps.state.trial import Trial
@@ -17,4 +22,5 @@ __all__ = [
     "UserResult",
     "WorkerSettings",
     "evaluate_trial",
+    "evaluate_trial_async",
 ]
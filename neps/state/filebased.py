@@ -5,7 +5,9 @@ from __future__ import annotations
 import contextlib
 import json
 import logging
+import os
 import pprint
+import threading
 import time
 from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
@@ -16,7 +18,8 @@ from typing import Literal, TypeAlias, TypeVar
 import portalocker as pl
 
 from neps.env import CONFIG_SERIALIZE_FORMAT, ENV_VARS_USED
-from neps.state.err_dump import ErrDump
+from neps.state.err_dump import ErrDump, SerializableTrialError
+from neps.state.notify import Notifier
 from neps.state.trial import Trial
 from neps.utils.files import deserialize, serialize
 
@@ -145,16 +148,32 @@ class ReaderWriterErrDump:
             return ErrDump([])
 
         with path.open("r") as f:
-            data = [json.loads(line) for line in f]
+            data = [json.loads(line) for line in f if line.strip()]
 
-        return ErrDump([ErrDump.SerializableTrialError(**d) for d in data])
+        return ErrDump([SerializableTrialError(**d) for d in data])
 
     @classmethod
     def write(cls, err_dump: ErrDump, path: Path) -> None:
         """Write an error dump to a file."""
         with path.open("w") as f:
-            lines = [json.dumps(asdict(trial_err)) for trial_err in err_dump.errs]
-            f.write("\n".join(lines))
+            f.writelines(
+                json.dumps(asdict(trial_err)) + "\n" for trial_err in err_dump.errs
+            )
+
+    @classmethod
+    def append(cls, errs: Iterable[SerializableTrialError], path: Path) -> None:
+        """Append errors to the file, without rewriting what is already there."""
+        with path.open("a+b") as f:
+            # Files written by older versions do not end with a newline
+            size = f.seek(0, os.SEEK_END)
+            if size > 0:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+
+            f.writelines(
+                (json.dumps(asdict(trial_err)) + "\n").encode() for trial_err in errs
+            )
 
 
 FILELOCK_EXCLUSIVE_NONE_BLOCKING = pl.LOCK_EX | pl.LOCK_NB
@@ -162,7 +181,12 @@ FILELOCK_EXCLUSIVE_NONE_BLOCKING = pl.LOCK_EX | pl.LOCK_NB
 
 @dataclass
 class FileLocker:
-    """File-based locker using `portalocker`."""
+    """File-based locker using `portalocker`.
+
+    Releasing the lock touches a sibling `<lock>.released` file, such that workers
+    waiting on the lock are woken up by it, see [`neps.state.notify`][neps.state.notify],
+    rather than having to keep trying the lock every `poll` seconds.
+    """
 
     lock_path: Path
     poll: float
@@ -175,7 +199,63 @@ class FileLocker:
             check_interval=self.poll,
             timeout=self.timeout,
             flags=FILELOCK_EXCLUSIVE_NONE_BLOCKING,
+            fail_when_locked=True,
         )
+        self._released = Notifier(
+            self.lock_path.with_name(f"{self.lock_path.name}.released")
+        )
+        # NOTE: File locks are held by a process, not a thread, so threads of the
+        # same process have to be kept apart separately. The thread holding the lock
+        # may take it again, which only counts how deep it is in.
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+
+    @contextmanager
+    def _locked_by_thread(self) -> Iterator[None]:
+        timeout = -1 if self.timeout is None else self.timeout
+        if not self._thread_lock.acquire(timeout=timeout):
+            raise pl.exceptions.LockException("Held by another thread.")
+        try:
+            yield
+        finally:
+            self._thread_lock.release()
+
+    def _try_acquire(self) -> bool:
+        try:
+            self._lock.acquire(timeout=0)
+        except pl.exceptions.AlreadyLocked:
+            return False
+        return True
+
+    @contextmanager
+    def _locked_by_process(self) -> Iterator[None]:
+        # Only the outermost level of a thread taking the lock again locks the file
+        if self._depth > 0:
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+            return
+
+        if not self._try_acquire():
+            deadline = None if self.timeout is None else time.monotonic() + self.timeout
+            with self._released.watch(poll=self.poll) as released:
+                # NOTE: We only started watching after our first attempt, so we have
+                # to try again before waiting or we could miss the release.
+                while not self._try_acquire():
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise pl.exceptions.LockException("Timed out waiting for lock.")
+                    released.wait(remaining)
+
+        self._depth = 1
+        try:
+            yield
+        finally:
+            self._depth = 0
+            self._lock.release()
+            self._released.notify()
 
     @contextmanager
     def lock(self, *, worker_id: str | None = None) -> Iterator[None]:
@@ -187,7 +267,7 @@ class FileLocker:
                 Used for debug messaging purposes.
         """
         try:
-            with self._lock:
+            with self._locked_by_thread(), self._locked_by_process():
                 if worker_id is not None:
                     logger.debug(
                         "Worker %s acquired lock on %s at %s",
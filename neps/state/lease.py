@@ -0,0 +1,139 @@
+"""Leases on trials that are being evaluated.
+
+A worker which picks up a trial for evaluation claims it by exclusively creating
+a lease file for it, `.leases/<trial_id>.lease`, which it keeps alive by touching
+it while the evaluation runs. If a worker crashes, or is killed, its lease stops
+being renewed and expires, at which point the trial can be returned to the pending
+state to be picked up by another worker, instead of being stranded as evaluating.
+
+```
+root_directory
+├── .leases
+│   ├── 3.lease             # Held by whichever worker is evaluating trial 3
+│   └── 4.lease
+└── ...
+```
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TrialLeases:
+    """Leases on trials, stored as files in a directory."""
+
+    directory: Path
+
+    duration: float | None
+    """How long a lease lasts without being renewed, in seconds.
+
+    If `None`, leases never expire.
+    """
+
+    def __post_init__(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path(self, trial_id: str) -> Path:
+        """The path to the lease file of a trial."""
+        return self.directory / f"{trial_id}.lease"
+
+    def claim(self, trial_id: str, *, worker_id: str, force: bool = False) -> bool:
+        """Claim the lease on a trial.
+
+        Args:
+            trial_id: The trial to claim.
+            worker_id: The worker claiming it, written into the lease for inspection.
+            force: Take the lease even if someone else holds it.
+
+        Returns:
+            Whether the lease was claimed.
+        """
+        flags = os.O_CREAT | os.O_WRONLY | (os.O_TRUNC if force else os.O_EXCL)
+        try:
+            fd = os.open(self.path(trial_id), flags, 0o644)
+        except FileExistsError:
+            return False
+
+        with os.fdopen(fd, "w") as f:
+            f.write(worker_id)
+
+        return True
+
+    def renew(self, trial_id: str) -> bool:
+        """Renew the lease on a trial.
+
+        Returns:
+            Whether the lease was still held, i.e. it was not released or broken.
+        """
+        try:
+            os.utime(self.path(trial_id))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def release(self, trial_id: str) -> None:
+        """Release the lease on a trial, if it is held."""
+        self.path(trial_id).unlink(missing_ok=True)
+
+    def is_expired(self, trial_id: str) -> bool:
+        """Whether the lease on a trial has not been renewed within its duration.
+
+        A lease that does not exist has not expired, as there is no telling whether
+        whoever set the trial to be evaluated is still alive, for example if they
+        did so by hand.
+        """
+        if self.duration is None:
+            return False
+
+        try:
+            last_renewed = self.path(trial_id).stat().st_mtime
+        except FileNotFoundError:
+            return False
+
+        return time.time() - last_renewed > self.duration
+
+    @contextmanager
+    def heartbeat(self, trial_id: str) -> Iterator[None]:
+        """Keep renewing the lease on a trial in a background thread while in
+        the context.
+        """
+        if self.duration is None:
+            yield
+            return
+
+        stop = threading.Event()
+        interval = self.duration / 4
+
+        def _beat() -> None:
+            while not stop.wait(interval):
+                if not self.renew(trial_id):
+                    logger.warning(
+                        "Lost the lease on trial '%s' while evaluating it. It may have"
+                        " been given to another worker, consider increasing"
+                        " NEPS_TRIAL_LEASE_DURATION if evaluations block for long.",
+                        trial_id,
+                    )
+                    return
+
+        thread = threading.Thread(
+            target=_beat,
+            name=f"neps-lease-heartbeat-{trial_id}",
+            daemon=True,
+        )
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
@@ -10,39 +10,57 @@ For an actual instantiation of this object, see
 
 from __future__ import annotations
 
-import io
 import logging
 import pickle
 import time
 from collections.abc import Iterable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, TypeAlias, TypeVar, overload
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias, TypeVar, overload
 
 from neps.env import (
     GLOBAL_ERR_FILELOCK_POLL,
     GLOBAL_ERR_FILELOCK_TIMEOUT,
     STATE_FILELOCK_POLL,
     STATE_FILELOCK_TIMEOUT,
-    TRIAL_CACHE_MAX_UPDATES_BEFORE_CONSOLIDATION,
+    STATE_STORAGE_BACKEND,
     TRIAL_FILELOCK_POLL,
     TRIAL_FILELOCK_TIMEOUT,
+    TRIAL_LEASE_DURATION,
 )
 from neps.exceptions import NePSError, TrialAlreadyExistsError, TrialNotFoundError
-from neps.state.err_dump import ErrDump
+from neps.state.err_dump import ErrDump, SerializableTrialError
 from neps.state.filebased import (
     FileLocker,
     ReaderWriterErrDump,
     ReaderWriterTrial,
     TrialWriteHint,
 )
+from neps.state.lease import TrialLeases
+from neps.state.notify import Notifier
 from neps.state.optimizer import OptimizationState
+from neps.state.sqlite import (
+    SQLiteDatabase,
+    SQLiteErrRepo,
+    SQLiteLocker,
+    SQLiteOptimizerRepo,
+    SQLiteTrialRepo,
+)
 from neps.state.trial import Report, Trial
-from neps.utils.files import atomic_write, deserialize, serialize
+from neps.state.trial_index import TrialIndex
+from neps.state.trial_log import TrialLog, TrialLogPosition
+from neps.utils.files import deserialize, serialize
 
 if TYPE_CHECKING:
     from neps.optimizers import OptimizerInfo
     from neps.optimizers.optimizer import AskFunction
+    from neps.state.storage import (
+        ErrStore,
+        Locker,
+        OptimizerStore,
+        StorageBackend,
+        TrialStore,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -68,21 +86,27 @@ CONFIG_PREFIX_LEN = len("config_")
 class TrialRepo:
     """A repository for trials that are stored on disk.
 
+    Each trial is stored in its own `config_<id>` directory for users to inspect, while
+    workers share trials through an append-only
+    [`TrialLog`][neps.state.trial_log.TrialLog].
+
     !!! warning
 
         This class does not implement locking and it is up to the caller to ensure
         there are no race conflicts.
     """
 
-    CACHE_FILE_NAME = ".trial_cache.pkl"
-    UPDATE_CONSOLIDATION_LIMIT = TRIAL_CACHE_MAX_UPDATES_BEFORE_CONSOLIDATION
+    LOG_DIRECTORY_NAME = ".trial_log"
+    CHANGES_FILENAME = ".changed"
 
     directory: Path
-    cache_path: Path = field(init=False)
+    log: TrialLog = field(init=False)
+    changes: Notifier = field(init=False)
 
     def __post_init__(self) -> None:
         self.directory.mkdir(parents=True, exist_ok=True)
-        self.cache_path = self.directory / self.CACHE_FILE_NAME
+        self.log = TrialLog(self.directory / self.LOG_DIRECTORY_NAME)
+        self.changes = Notifier(self.directory / self.CHANGES_FILENAME)
 
     def list_trial_ids(self) -> list[str]:
         """List all the trial ids on disk."""
@@ -92,69 +116,36 @@ class TrialRepo:
             if config_path.name.startswith("config_") and config_path.is_dir()
         ]
 
-    def _read_pkl_and_maybe_consolidate(
-        self,
-        *,
-        consolidate: bool | None = None,
-    ) -> dict[str, Trial]:
-        with self.cache_path.open("rb") as f:
-            _bytes = f.read()
-
-        buffer = io.BytesIO(_bytes)
-        trials: dict[str, Trial] = {}
-        updates: list[Trial] = []
-        while True:
-            try:
-                datum = pickle.load(buffer)  # noqa: S301
-
-                # If it's a `dict`, this is the whol trials cache
-                if isinstance(datum, dict):
-                    assert len(trials) == 0, "Multiple caches present."
-                    trials = datum
+    def _ensure_log(self) -> None:
+        if self.log.exists():
+            return
 
-                # If it's a `list`, these are multiple updates
-                elif isinstance(datum, list):
-                    updates.extend(datum)
+        # If we end up with no log but there are trials on disk, we need to read them in.
+        trial_ids = self.list_trial_ids()
+        if any(trial_ids):
+            logger.debug("Rebuilding the trial log from %d trials.", len(trial_ids))
 
-                # Otherwise it's a single update
-                else:
-                    assert isinstance(datum, Trial), "Not a trial."
-                    updates.append(datum)
-            except EOFError:
-                break
+        trials = {trial_id: self.load_trial_from_disk(trial_id) for trial_id in trial_ids}
+        self.log.initialize(trials)
 
-        trials.update({trial.id: trial for trial in updates})
-        if consolidate is True or (
-            len(updates) > self.UPDATE_CONSOLIDATION_LIMIT and consolidate is None
-        ):
-            logger.debug(
-                "Consolidating trial cache with %d trials and %d updates.",
-                len(trials),
-                len(updates),
-            )
-            pickle_bytes = pickle.dumps(trials, protocol=pickle.HIGHEST_PROTOCOL)
-            with atomic_write(self.cache_path, "wb") as f:
-                f.write(pickle_bytes)
+    def read_since(
+        self,
+        position: TrialLogPosition | None,
+    ) -> tuple[dict[str, Trial] | None, list[Trial], TrialLogPosition]:
+        """Read the trial updates since `position`.
 
-        return trials
+        See [`TrialLog.read_since()`][neps.state.trial_log.TrialLog.read_since].
+        """
+        self._ensure_log()
+        self.log.install_compaction()
+        return self.log.read_since(position)
 
     def latest(self) -> dict[str, Trial]:
-        """Get the latest trials from the cache."""
-        if not self.cache_path.exists():
-            # If we end up with no cache but there are trials on disk, we need to read in.
-            if any(path.name.startswith("config_") for path in self.directory.iterdir()):
-                trial_ids = self.list_trial_ids()
-                trials = {
-                    trial_id: self.load_trial_from_disk(trial_id)
-                    for trial_id in trial_ids
-                }
-                pickle_bytes = pickle.dumps(trials, protocol=pickle.HIGHEST_PROTOCOL)
-                with atomic_write(self.cache_path, "wb") as f:
-                    f.write(pickle_bytes)
-
-            return {}
-
-        return self._read_pkl_and_maybe_consolidate()
+        """Get the latest trials from the log."""
+        snapshot, updates, _ = self.read_since(None)
+        trials = snapshot if snapshot is not None else {}
+        trials.update({trial.id: trial for trial in updates})
+        return trials
 
     def store_new_trial(self, trial: Trial | list[Trial]) -> None:
         """Write a new trial to disk.
@@ -162,14 +153,13 @@ class TrialRepo:
         Raises:
             TrialAlreadyExistsError: If the trial already exists on disk.
         """
+        self._ensure_log()
         if isinstance(trial, Trial):
             config_path = self.directory / f"config_{trial.id}"
             if config_path.exists():
                 raise TrialAlreadyExistsError(trial.id, config_path)
 
-            bytes_ = pickle.dumps(trial, protocol=pickle.HIGHEST_PROTOCOL)
-            with atomic_write(self.cache_path, "ab") as f:
-                f.write(bytes_)
+            self.log.append(trial)
 
             config_path.mkdir(parents=True, exist_ok=True)
             ReaderWriterTrial.write(
@@ -184,9 +174,7 @@ class TrialRepo:
                     raise TrialAlreadyExistsError(child_trial.id, config_path)
                 config_path.mkdir(parents=True, exist_ok=True)
 
-            bytes_ = pickle.dumps(trial, protocol=pickle.HIGHEST_PROTOCOL)
-            with atomic_write(self.cache_path, "ab") as f:
-                f.write(bytes_)
+            self.log.append(trial)
 
             for child_trial in trial:
                 ReaderWriterTrial.write(
@@ -195,6 +183,8 @@ class TrialRepo:
                     hints=["config", "metadata"],
                 )
 
+        self.changes.notify()
+
     def update_trial(
         self,
         trial: Trial,
@@ -209,11 +199,33 @@ class TrialRepo:
                 to be updated.
                 If you don't know, leave `None`, this is a micro-optimization.
         """
-        bytes_ = pickle.dumps(trial, protocol=pickle.HIGHEST_PROTOCOL)
-        with atomic_write(self.cache_path, "ab") as f:
-            f.write(bytes_)
+        self.update_trials([trial], hints=hints)
+
+    def update_trials(
+        self,
+        trials: list[Trial],
+        *,
+        hints: Iterable[TrialWriteHint] | TrialWriteHint | None = ("report", "metadata"),
+    ) -> None:
+        """Update several trials on disk at once.
 
-        ReaderWriterTrial.write(trial, self.directory / f"config_{trial.id}", hints=hints)
+        The updates are appended to the log in a single write, such that they are
+        synced to disk together rather than one after the other.
+
+        Args:
+            trials: The trials to update.
+            hints: The hints to use when updating the trials, see
+                [`update_trial()`][neps.state.neps_state.TrialRepo.update_trial].
+        """
+        self._ensure_log()
+        self.log.append(trials)
+
+        for trial in trials:
+            ReaderWriterTrial.write(
+                trial, self.directory / f"config_{trial.id}", hints=hints
+            )
+
+        self.changes.notify()
 
     def load_trial_from_disk(self, trial_id: str) -> Trial:
         """Load a trial from disk.
@@ -230,31 +242,224 @@ class TrialRepo:
         return ReaderWriterTrial.read(config_path)
 
 
+@dataclass
+class OptimizerRepo:
+    """The optimizer info and state, stored as files.
+
+    !!! warning
+
+        This class does not implement locking and it is up to the caller to ensure
+        there are no race conflicts.
+    """
+
+    info_path: Path
+    state_path: Path
+
+    def read_info(self) -> OptimizerInfo:
+        """Read the optimizer info."""
+        return _deserialize_optimizer_info(self.info_path)
+
+    def write_info(self, info: OptimizerInfo) -> None:
+        """Write the optimizer info."""
+        serialize(info, path=self.info_path)
+
+    def read_state(self) -> OptimizationState:
+        """Read the optimizer state."""
+        with self.state_path.open("rb") as f:
+            obj = pickle.load(f)  # noqa: S301
+            assert isinstance(obj, OptimizationState)
+            return obj
+
+    def write_state(self, state: OptimizationState) -> None:
+        """Write the optimizer state."""
+        with self.state_path.open("wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@dataclass
+class ErrRepo:
+    """The errors shared between workers, stored as a jsonl file.
+
+    !!! warning
+
+        This class does not implement locking and it is up to the caller to ensure
+        there are no race conflicts.
+    """
+
+    path: Path
+
+    def read(self) -> ErrDump:
+        """Read all the errors."""
+        return ReaderWriterErrDump.read(self.path)
+
+    def append(self, err: SerializableTrialError) -> None:
+        """Add an error."""
+        ReaderWriterErrDump.append([err], self.path)
+
+
 @dataclass
 class NePSState:
     """The main state object that holds all the shared state objects."""
 
     path: Path
 
-    _trial_lock: FileLocker = field(repr=False)
-    _trial_repo: TrialRepo = field(repr=False)
-
-    _optimizer_lock: FileLocker = field(repr=False)
+    _trial_lock: Locker = field(repr=False)
+    _trial_repo: TrialStore = field(repr=False)
 
-    _optimizer_info_path: Path = field(repr=False)
+    _optimizer_lock: Locker = field(repr=False)
+    _optimizer_repo: OptimizerStore = field(repr=False)
     _optimizer_info: OptimizerInfo = field(repr=False)
-
-    _optimizer_state_path: Path = field(repr=False)
     _optimizer_state: OptimizationState = field(repr=False)
 
-    _err_lock: FileLocker = field(repr=False)
-    _shared_errors_path: Path = field(repr=False)
+    _err_lock: Locker = field(repr=False)
+    _err_repo: ErrStore = field(repr=False)
     _shared_errors: ErrDump = field(repr=False)
 
+    _trial_leases: TrialLeases = field(repr=False)
+    _next_lease_check: float = field(default=0.0, repr=False, compare=False)
+
+    # The trials as this worker last saw them and where in the trial store it stopped
+    _trial_index: TrialIndex = field(
+        default_factory=TrialIndex, repr=False, compare=False
+    )
+    _trials_position: Any = field(default=None, repr=False, compare=False)
+
+    def _latest_trial_index(self) -> TrialIndex:
+        """Bring the in-memory trials and their index up to date with the trial store.
+
+        Only the updates written since the last call are read from disk.
+
+        !!! warning
+
+            Responsibility of locking is on caller. The returned index is the
+            worker-local view of the trials and should not be modified.
+        """
+        snapshot, updates, self._trials_position = self._trial_repo.read_since(
+            self._trials_position
+        )
+        if snapshot is not None:
+            self._trial_index = TrialIndex.from_trials(snapshot)
+
+        self._trial_index.put_many(updates)
+        return self._trial_index
+
+    def _latest_trials(self) -> dict[str, Trial]:
+        """Same as `_latest_trial_index()` but only returns the trials.
+
+        This is a new dict, such that it can be handed to the optimizer after
+        releasing the lock, while the index keeps being updated.
+        """
+        return dict(self._latest_trial_index().trials)
+
+    def _claim_next_pending_trial(
+        self,
+        index: TrialIndex,
+        *,
+        worker_id: str,
+    ) -> Trial | None:
+        """Claim the oldest pending trial that has no lease on it yet, and set it
+        to be evaluated by the worker.
+
+        !!! warning
+
+            Responsibility of locking is on caller.
+        """
+        trial = index.oldest_pending()
+        if trial is None:
+            return None
+
+        if not self._trial_leases.claim(trial.id, worker_id=worker_id):
+            # Someone holds a lease on the oldest one, most likely a worker which
+            # claimed it right before crashing, so go through the rest in order.
+            # Ties on the time sampled leave the order of the two lookups open, so
+            # skip the oldest one by its id rather than its position.
+            oldest_id = trial.id
+            pendings = index.oldest_pendings(index.count(Trial.State.PENDING))
+            claimable = (
+                t
+                for t in pendings
+                if t.id != oldest_id
+                and self._trial_leases.claim(t.id, worker_id=worker_id)
+            )
+            trial = next(claimable, None)
+            if trial is None:
+                return None
+
+        trial = _copy_for_update(trial)
+        try:
+            trial.set_evaluating(time_started=time.time(), worker_id=worker_id)
+            self._trial_repo.update_trial(trial, hints="metadata")
+        except BaseException:
+            # Otherwise the lease would keep anyone from picking up the trial
+            self._trial_leases.release(trial.id)
+            raise
+
+        # The worker goes on to modify the trial it evaluates, so the index gets its
+        # own copy
+        index.put(_copy_for_update(trial))
+        return trial
+
+    def _reclaim_expired_trials(self, index: TrialIndex) -> list[Trial]:
+        """Set trials back to pending if the lease of the worker evaluating them
+        has expired.
+
+        Expired leases on pending trials are released as well. These are left by
+        a worker which crashed after claiming a trial but before setting it to be
+        evaluated, and would otherwise keep anyone from picking up the trial.
+
+        As this has to check the lease of every evaluating and pending trial, it
+        only does so once every so often.
+
+        !!! warning
+
+            Responsibility of locking is on caller.
+        """
+        duration = self._trial_leases.duration
+        if duration is None or time.time() < self._next_lease_check:
+            return []
+
+        self._next_lease_check = time.time() + duration / 4
+        reclaimed = [
+            _copy_for_update(trial)
+            for trial in index.with_state(Trial.State.EVALUATING)
+            if self._trial_leases.is_expired(trial.id)
+        ]
+        for trial in reclaimed:
+            logger.warning(
+                "The lease of worker '%s' on trial '%s' expired, setting it back to"
+                " pending.",
+                trial.metadata.evaluating_worker_id,
+                trial.id,
+            )
+            self._return_trial_to_pending(trial)
+            index.put(trial)
+
+        for trial in index.with_state(Trial.State.PENDING):
+            if self._trial_leases.is_expired(trial.id):
+                logger.warning(
+                    "The lease on pending trial '%s' expired before it was set to be"
+                    " evaluated, releasing it.",
+                    trial.id,
+                )
+                self._trial_leases.release(trial.id)
+
+        return reclaimed
+
+    def _return_trial_to_pending(self, trial: Trial) -> None:
+        """Set a trial being evaluated back to pending, for any worker to pick up.
+
+        !!! warning
+
+            Responsibility of locking is on caller.
+        """
+        trial.set_pending()
+        self._trial_repo.update_trial(trial, hints="metadata")
+        self._trial_leases.release(trial.id)
+
     def lock_and_read_trials(self) -> dict[str, Trial]:
         """Acquire the state lock and read the trials."""
         with self._trial_lock.lock():
-            return self._trial_repo.latest()
+            return self._latest_trials()
 
     @overload
     def lock_and_sample_trial(
@@ -271,11 +476,14 @@ class NePSState:
         """Acquire the state lock and sample a trial."""
         with self._optimizer_lock.lock():
             with self._trial_lock.lock():
-                trials_ = self._trial_repo.latest()
+                index = self._latest_trial_index()
+                trials_ = dict(index.trials)
+                used_cost_budget = index.aggregates.cost_total
 
             trials = self._sample_trial(
                 optimizer,
                 trials=trials_,
+                used_cost_budget=used_cost_budget,
                 worker_id=worker_id,
                 n=n,
             )
@@ -303,7 +511,9 @@ class NePSState:
         *,
         worker_id: str,
         trials: dict[str, Trial],
+        used_cost_budget: float,
         n: int,
+        seed_global_rng: bool = ...,
     ) -> list[Trial]: ...
 
     @overload
@@ -313,7 +523,9 @@ class NePSState:
         *,
         worker_id: str,
         trials: dict[str, Trial],
+        used_cost_budget: float,
         n: None,
+        seed_global_rng: bool = ...,
     ) -> Trial: ...
 
     def _sample_trial(
@@ -322,7 +534,9 @@ class NePSState:
         *,
         worker_id: str,
         trials: dict[str, Trial],
+        used_cost_budget: float,
         n: int | None,
+        seed_global_rng: bool = True,
     ) -> Trial | list[Trial]:
         """Sample a new trial from the optimizer.
 
@@ -335,27 +549,34 @@ class NePSState:
             worker_id: The worker that is sampling the trial.
             n: The number of trials to sample.
             trials: The current trials.
+            used_cost_budget: The total cost reported by the current trials, as
+                kept by the [`TrialIndex`][neps.state.trial_index.TrialIndex].
+            seed_global_rng: Whether to set the global random number generators
+                from the seed snapshot before sampling. Sampling in the background
+                must not, as that would reset them under the evaluation running on
+                the main thread. Either way, the snapshot is read back from them
+                afterwards, such that the next sample does not repeat this one.
 
         Returns:
             The new trial.
         """
-        with self._optimizer_state_path.open("rb") as f:
-            opt_state: OptimizationState = pickle.load(f)  # noqa: S301
+        from neps.optimizers.optimizer import SharesState  # Fighting circular import
 
-        opt_state.seed_snapshot.set_as_global_seed_state()
+        opt_state = self._optimizer_repo.read_state()
+        if seed_global_rng:
+            opt_state.seed_snapshot.set_as_global_seed_state()
 
         assert callable(optimizer)
         if opt_state.budget is not None:
             # NOTE: All other values of budget are ones that should remain
             # constant, there are currently only these two which are dynamic as
             # optimization unfold
-            opt_state.budget.used_cost_budget = sum(
-                trial.report.cost
-                for trial in trials.values()
-                if trial.report is not None and trial.report.cost is not None
-            )
+            opt_state.budget.used_cost_budget = used_cost_budget
             opt_state.budget.used_evaluations = len(trials)
 
+        if isinstance(optimizer, SharesState):
+            optimizer.shared_state = opt_state.shared_state
+
         sampled_configs = optimizer(
             trials=trials,
             budget_info=(
@@ -367,8 +588,10 @@ class NePSState:
         if not isinstance(sampled_configs, list):
             sampled_configs = [sampled_configs]
 
-        # TODO: Not implemented yet.
-        shared_state = opt_state.shared_state
+        if isinstance(optimizer, SharesState):
+            shared_state = optimizer.shared_state
+        else:
+            shared_state = opt_state.shared_state
 
         sampled_trials: list[Trial] = []
         for sampled_config in sampled_configs:
@@ -395,8 +618,7 @@ class NePSState:
 
         opt_state.shared_state = shared_state
         opt_state.seed_snapshot.recapture()
-        with self._optimizer_state_path.open("wb") as f:
-            pickle.dump(opt_state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._optimizer_repo.write_state(opt_state)
 
         if n is None:
             assert len(sampled_trials) == 1
@@ -420,23 +642,48 @@ class NePSState:
             optimizer: The optimizer to update and get the state from
             worker_id: The worker that evaluated the trial.
         """
+        self._report_trial_evaluations([(trial, report)], worker_id=worker_id)
+
+    def _report_trial_evaluations(
+        self,
+        evaluated: list[tuple[Trial, Report]],
+        *,
+        worker_id: str,
+    ) -> None:
+        """Update several trials with their evaluation reports at once.
+
+        This writes all of the trials in a single update to the trial store, and
+        all of the errors under a single acquisition of the error lock.
+
+        Args:
+            evaluated: The trials that were evaluated, with their reports.
+            worker_id: The worker that evaluated the trials.
+        """
         # IMPORTANT: We need to attach the report to the trial before updating the things.
-        trial.report = report
-        self._trial_repo.update_trial(trial, hints=["report", "metadata"])
+        for trial, report in evaluated:
+            trial.report = report
 
-        if report.err is not None:
+        self._trial_repo.update_trials(
+            [trial for trial, _ in evaluated], hints=["report", "metadata"]
+        )
+        for trial, _ in evaluated:
+            self._trial_leases.release(trial.id)
+
+        errs = [
+            SerializableTrialError(
+                trial_id=trial.id,
+                worker_id=worker_id,
+                err_type=type(report.err).__name__,
+                err=str(report.err),
+                tb=report.tb,
+            )
+            for trial, report in evaluated
+            if report.err is not None
+        ]
+        if errs:
             with self._err_lock.lock():
-                err_dump = ReaderWriterErrDump.read(self._shared_errors_path)
-                err_dump.errs.append(
-                    ErrDump.SerializableTrialError(
-                        trial_id=trial.id,
-                        worker_id=worker_id,
-                        err_type=type(report.err).__name__,
-                        err=str(report.err),
-                        tb=report.tb,
-                    )
-                )
-                ReaderWriterErrDump.write(err_dump, self._shared_errors_path)
+                for err in errs:
+                    self._err_repo.append(err)
 
     def all_trial_ids(self) -> list[str]:
         """Get all the trial ids."""
@@ -445,20 +692,17 @@ class NePSState:
     def lock_and_get_errors(self) -> ErrDump:
         """Get all the errors that have occurred during the optimization."""
         with self._err_lock.lock():
-            return ReaderWriterErrDump.read(self._shared_errors_path)
+            return self._err_repo.read()
 
     def lock_and_get_optimizer_info(self) -> OptimizerInfo:
         """Get the optimizer information."""
         with self._optimizer_lock.lock():
-            return _deserialize_optimizer_info(self._optimizer_info_path)
+            return self._optimizer_repo.read_info()
 
     def lock_and_get_optimizer_state(self) -> OptimizationState:
         """Get the optimizer state."""
-        with self._optimizer_lock.lock():  # noqa: SIM117
-            with self._optimizer_state_path.open("rb") as f:
-                obj = pickle.load(f)  # noqa: S301
-                assert isinstance(obj, OptimizationState)
-                return obj
+        with self._optimizer_lock.lock():
+            return self._optimizer_repo.read_state()
 
     def lock_and_get_trial_by_id(self, trial_id: str) -> Trial:
         """Get a trial by its id."""
@@ -512,37 +756,25 @@ class NePSState:
     ) -> Trial | list[Trial] | None:
         """Get the next pending trial."""
         with self._trial_lock.lock():
-            trials = self._trial_repo.latest()
-            pendings = sorted(
-                [
-                    trial
-                    for trial in trials.values()
-                    if trial.metadata.state == Trial.State.PENDING
-                ],
-                key=lambda t: t.metadata.time_sampled,
-            )
+            index = self._latest_trial_index()
             if n is None:
-                return pendings[0] if pendings else None
-            return pendings[:n]
+                return index.oldest_pending()
+            return index.oldest_pendings(n)
 
     def lock_and_get_current_evaluating_trials(self) -> list[Trial]:
         """Get the current evaluating trials."""
         with self._trial_lock.lock():
-            trials = self._trial_repo.latest()
-            return [
-                trial
-                for trial in trials.values()
-                if trial.metadata.state == Trial.State.EVALUATING
-            ]
+            return self._latest_trial_index().with_state(Trial.State.EVALUATING)
 
     @classmethod
-    def create_or_load(
+    def create_or_load(  # noqa: PLR0912, PLR0915
         cls,
         path: Path,
         *,
         load_only: bool = False,
         optimizer_info: OptimizerInfo | None = None,
         optimizer_state: OptimizationState | None = None,
+        backend: StorageBackend | None = None,
     ) -> NePSState:
         """Create a new NePSState in a directory or load the existing one
         if it already exists, depending on the argument.
@@ -550,10 +782,10 @@ class NePSState:
         !!! warning
 
             We check that the optimizer info in the NePSState on disk matches
-            the one that is passed. However we do not lock this check so it
-            is possible that if two processes try to create a NePSState at the
-            same time, both with different optimizer infos, that one will fail
-            to create the NePSState. This is a limitation of the current design.
+            the one that is passed. If two processes try to create a NePSState at
+            the same time, both with different optimizer infos, the one to create
+            it first wins and the other one fails. This is a limitation of the
+            current design.
 
             In principal, we could allow multiple optimizers to be run and share
             the same set of trials.
@@ -563,17 +795,21 @@ class NePSState:
             load_only: If True, only load the state and do not create a new one.
             optimizer_info: The optimizer info to use.
             optimizer_state: The optimizer state to use.
+            backend: The [storage backend][neps.state.storage] to create the state
+                with. When loading an existing state, the backend is detected from
+                what is on disk. Defaults to the `NEPS_STATE_STORAGE_BACKEND`
+                environment variable, which in turn defaults to `"filebased"`.
 
         Returns:
             The NePSState.
 
         Raises:
-            NePSError: If the optimizer info on disk does not match the one provided.
+            NePSError: If the optimizer info on disk does not match the one provided,
+                or the state on disk uses a different backend than the one provided.
         """
         path = path.absolute().resolve()
-        is_new = not path.exists()
         if load_only:
-            if is_new:
+            if not path.exists():
                 raise FileNotFoundError(f"No NePSState found at '{path}'.")
         else:
             assert optimizer_info is not None
@@ -583,70 +819,127 @@ class NePSState:
         config_dir = path / "configs"
         config_dir.mkdir(parents=True, exist_ok=True)
 
-        optimizer_info_path = path / "optimizer_info.yaml"
-        optimizer_state_path = path / "optimizer_state.pkl"
-        shared_errors_path = path / "shared_errors.jsonl"
-
-        # We have to do one bit of sanity checking to ensure that the optimzier
-        # info on disk manages the one we have recieved, otherwise we are unsure which
-        # optimizer is being used.
-        # NOTE: We assume that we do not have to worry about a race condition
-        # here where we have two different NePSState objects with two different optimizer
-        # infos trying to be created at the same time. This avoids the need to lock to
-        # check the optimizer info. If this assumption changes, then we would have
-        # to first lock before we do this check
-        if not is_new:
-            existing_info = _deserialize_optimizer_info(optimizer_info_path)
-            if not load_only and existing_info != optimizer_info:
-                raise NePSError(
-                    "The optimizer info on disk does not match the one provided."
-                    f"\nOn disk: {existing_info}\nProvided: {optimizer_info}"
-                    f"\n\nLoaded the one on disk from {path}."
+        # NOTE: Another worker may be creating the state at the same time, in which
+        # case its database or optimizer info may not be written yet. Hence, whether
+        # the state exists and which backend it uses is only decided while holding
+        # the creation lock, which the creating worker holds until it is done.
+        creation_lock = FileLocker(
+            lock_path=path / ".create.lock",
+            poll=STATE_FILELOCK_POLL,
+            timeout=STATE_FILELOCK_TIMEOUT,
+        )
+        with creation_lock.lock():
+            database_path = path / SQLiteDatabase.FILENAME
+            info_path = path / "optimizer_info.yaml"
+            is_new = not (database_path.exists() or info_path.exists())
+            if is_new and load_only:
+                raise FileNotFoundError(f"No NePSState found at '{path}'.")
+
+            if is_new:
+                backend = backend if backend is not None else STATE_STORAGE_BACKEND
+            else:
+                on_disk: StorageBackend = (
+                    "sqlite" if database_path.exists() else "filebased"
                 )
-            with optimizer_state_path.open("rb") as f:
-                optimizer_state = pickle.load(f)  # noqa: S301
+                if backend is not None and backend != on_disk:
+                    raise NePSError(
+                        f"The NePSState at '{path}' uses the '{on_disk}' storage"
+                        f" backend but '{backend}' was requested."
+                    )
+                backend = on_disk
 
-            optimizer_info = existing_info
-            error_dump = ReaderWriterErrDump.read(shared_errors_path)
-        else:
-            assert optimizer_info is not None
-            assert optimizer_state is not None
+            optimizer_lock = FileLocker(
+                lock_path=path / ".optimizer.lock",
+                poll=STATE_FILELOCK_POLL,
+                timeout=STATE_FILELOCK_TIMEOUT,
+            )
+            trial_lock: Locker
+            trial_repo: TrialStore
+            optimizer_repo: OptimizerStore
+            err_lock: Locker
+            err_repo: ErrStore
+            match backend:
+                case "filebased":
+                    trial_repo = TrialRepo(config_dir)
+                    trial_lock = FileLocker(
+                        lock_path=path / ".configs.lock",
+                        poll=TRIAL_FILELOCK_POLL,
+                        timeout=TRIAL_FILELOCK_TIMEOUT,
+                    )
+                    optimizer_repo = OptimizerRepo(
+                        info_path=info_path,
+                        state_path=path / "optimizer_state.pkl",
+                    )
+                    err_repo = ErrRepo(path / "shared_errors.jsonl")
+                    err_lock = FileLocker(
+                        lock_path=path / ".errors.lock",
+                        poll=GLOBAL_ERR_FILELOCK_POLL,
+                        timeout=GLOBAL_ERR_FILELOCK_TIMEOUT,
+                    )
+                case "sqlite":
+                    # Trials and errors live in the same database, so they share a lock
+                    database = SQLiteDatabase(
+                        database_path, timeout=TRIAL_FILELOCK_TIMEOUT
+                    )
+                    trial_repo = SQLiteTrialRepo(database, directory=config_dir)
+                    trial_lock = err_lock = SQLiteLocker(database)
+                    optimizer_repo = SQLiteOptimizerRepo(database)
+                    err_repo = SQLiteErrRepo(database)
+                case _:
+                    raise ValueError(
+                        f"Unknown storage backend '{backend}'."
+                        " Must be one of 'filebased' or 'sqlite'."
+                    )
 
-            serialize(optimizer_info, path=optimizer_info_path)
-            with optimizer_state_path.open("wb") as f:
-                pickle.dump(optimizer_state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # We have to do one bit of sanity checking to ensure that the optimzier
+            # info on disk manages the one we have recieved, otherwise we are unsure
+            # which optimizer is being used.
+            if not is_new:
+                existing_info = optimizer_repo.read_info()
+                if not load_only and existing_info != optimizer_info:
+                    raise NePSError(
+                        "The optimizer info on disk does not match the one provided."
+                        f"\nOn disk: {existing_info}\nProvided: {optimizer_info}"
+                        f"\n\nLoaded the one on disk from {path}."
+                    )
+                optimizer_state = optimizer_repo.read_state()
+                optimizer_info = existing_info
+                error_dump = err_repo.read()
+            else:
+                assert optimizer_info is not None
+                assert optimizer_state is not None
 
-            error_dump = ErrDump([])
+                optimizer_repo.write_info(optimizer_info)
+                optimizer_repo.write_state(optimizer_state)
+                error_dump = ErrDump([])
 
         return NePSState(
             path=path,
-            _trial_repo=TrialRepo(config_dir),
+            _trial_repo=trial_repo,
             # Locks,
-            _trial_lock=FileLocker(
-                lock_path=path / ".configs.lock",
-                poll=TRIAL_FILELOCK_POLL,
-                timeout=TRIAL_FILELOCK_TIMEOUT,
-            ),
-            _optimizer_lock=FileLocker(
-                lock_path=path / ".optimizer.lock",
-                poll=STATE_FILELOCK_POLL,
-                timeout=STATE_FILELOCK_TIMEOUT,
-            ),
-            _err_lock=FileLocker(
-                lock_path=path / ".errors.lock",
-                poll=GLOBAL_ERR_FILELOCK_POLL,
-                timeout=GLOBAL_ERR_FILELOCK_TIMEOUT,
-            ),
+            _trial_lock=trial_lock,
+            _optimizer_lock=optimizer_lock,
+            _err_lock=err_lock,
             # State
-            _optimizer_info_path=optimizer_info_path,
+            _optimizer_repo=optimizer_repo,
             _optimizer_info=optimizer_info,
-            _optimizer_state_path=optimizer_state_path,
-            _optimizer_state=optimizer_state,  # type: ignore
-            _shared_errors_path=shared_errors_path,
+            _optimizer_state=optimizer_state,
+            _err_repo=err_repo,
             _shared_errors=error_dump,
+            _trial_leases=TrialLeases(
+                path / ".leases",
+                duration=TRIAL_LEASE_DURATION,
+            ),
         )
 
 
+def _copy_for_update(trial: Trial) -> Trial:
+    # The trials in the index are handed to optimizers, which may read them outside
+    # the trial lock, e.g. when sampling in the background. Hence they are replaced
+    # by an updated copy rather than modified in place.
+    return replace(trial, metadata=replace(trial.metadata))
+
+
 def _deserialize_optimizer_info(path: Path) -> OptimizerInfo:
     from neps.optimizers import OptimizerInfo  # Fighting circular import
 
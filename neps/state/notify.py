@@ -0,0 +1,206 @@
+"""Wake up waiting workers when the state changes, rather than polling it.
+
+A [`Notifier`][neps.state.notify.Notifier] is an empty file which is touched
+whenever whatever it stands for happens, for example a lock being released or a
+trial being written. Anyone waiting on that to happen
+[`watch()`][neps.state.notify.Notifier.watch]es it:
+
+* `#!python "inotify"` - On Linux, the kernel wakes the waiter as soon as the file
+    is touched, without it having to look at the filesystem in the meantime.
+* `#!python "poll"` - Everywhere else, the waiter just sleeps for its usual poll
+    interval, as it did before notifications existed.
+
+The method is chosen with `NEPS_STATE_NOTIFY_METHOD`, where `#!python "auto"` uses
+inotify when it is available and falls back to polling otherwise.
+
+!!! warning
+
+    inotify only sees changes made by the machine it runs on. Waiters therefore
+    still check for themselves every `NEPS_STATE_NOTIFY_MAX_WAIT` seconds, which is
+    how long they may be late to notice a change made by a worker on another
+    machine sharing the filesystem. If that is how you run, consider setting
+    `NEPS_STATE_NOTIFY_METHOD=poll`.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Literal, Protocol, TypeAlias
+
+from neps.env import STATE_NOTIFY_MAX_WAIT, STATE_NOTIFY_METHOD
+
+logger = logging.getLogger(__name__)
+
+NotifyMethod: TypeAlias = Literal["auto", "inotify", "poll"]
+
+# From <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE
+
+
+class Watcher(Protocol):
+    """Something to wait on until a [`Notifier`][neps.state.notify.Notifier] fires."""
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait until notified, or for at most `timeout` seconds.
+
+        This may return early without having been notified, so callers should
+        always check for themselves whether what they are waiting on happened.
+
+        Args:
+            timeout: The longest to wait, or `None` to wait for as long as the
+                watcher deems reasonable before checking again.
+
+        Returns:
+            Whether a notification was seen.
+        """
+        ...
+
+
+@dataclass
+class _PollingWatcher:
+    path: Path
+    poll: float
+
+    def __post_init__(self) -> None:
+        self._last_seen = self._signature()
+
+    def _signature(self) -> tuple[int, int] | None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def wait(self, timeout: float | None = None) -> bool:
+        time.sleep(self.poll if timeout is None else max(0, min(self.poll, timeout)))
+        signature = self._signature()
+        notified = signature != self._last_seen
+        self._last_seen = signature
+        return notified
+
+
+@cache
+def _libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    except OSError:
+        return None
+
+    if not hasattr(libc, "inotify_init1"):
+        return None
+
+    return libc
+
+
+class _InotifyWatcher:
+    def __init__(self, path: Path, libc: ctypes.CDLL) -> None:
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        wd = libc.inotify_add_watch(fd, os.fsencode(path), _IN_WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, os.strerror(errno), str(path))
+
+        self._fd = fd
+
+    def wait(self, timeout: float | None = None) -> bool:
+        timeout = (
+            STATE_NOTIFY_MAX_WAIT
+            if timeout is None
+            else max(0, min(timeout, STATE_NOTIFY_MAX_WAIT))
+        )
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+
+        # We only care that something happened, not what, so drain all the events
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+        return True
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+@dataclass
+class Notifier:
+    """A file which is touched to wake up anyone watching it."""
+
+    path: Path
+
+    def notify(self) -> None:
+        """Wake up everyone watching."""
+        try:
+            os.utime(self.path)
+        except FileNotFoundError:
+            self.path.touch()
+
+    @contextmanager
+    def watch(
+        self,
+        *,
+        poll: float,
+        method: NotifyMethod = STATE_NOTIFY_METHOD,
+    ) -> Iterator[Watcher]:
+        """Watch for notifications for the duration of the context.
+
+        Notifications which happen after entering the context are not missed, even
+        if they happen while the caller is not waiting.
+
+        Args:
+            poll: How long to sleep between checks if polling.
+            method: How to wait for notifications, see the
+                [module docs][neps.state.notify].
+
+        Raises:
+            OSError: If `method` is `#!python "inotify"` and inotify can not be used.
+        """
+        libc = _libc() if method != "poll" else None
+        if libc is None:
+            if method == "inotify":
+                raise OSError("inotify is not available on this platform.")
+            yield _PollingWatcher(self.path, poll=poll)
+            return
+
+        # NOTE: Opening read-only does not count as a change to anyone watching
+        fd = os.open(self.path, os.O_RDONLY | os.O_CREAT, 0o644)
+        os.close(fd)
+        try:
+            watcher = _InotifyWatcher(self.path, libc)
+        except OSError as e:
+            # Most likely we ran into the limit of inotify instances per user
+            if method == "inotify":
+                raise
+            logger.debug("Could not watch %s, polling instead: %s", self.path, e)
+            yield _PollingWatcher(self.path, poll=poll)
+            return
+
+        try:
+            yield watcher
+        finally:
+            watcher.close()
@@ -40,9 +40,9 @@ class OptimizationState:
     For example, an optimizer may wish to store running totals here or various other
     bits of information that may be expensive to recompute.
 
-    Right now there's no support for tensors/arrays and almost no optimizer uses this
-    feature. Only cost-cooling uses information out of `.budget`.
-
-    Please reach out to @eddiebergman if you have a use case for this so we can make
-    it more robust.
+    Optimizers opt in by implementing the
+    [`SharesState`][neps.optimizers.optimizer.SharesState] protocol, for example,
+    [`BayesianOptimization`][neps.optimizers.bayesian_optimization.BayesianOptimization]
+    stores its fitted GP hyperparameters here to warm-start the next fit.
+    The state is pickled, so it may contain tensors.
     """
@@ -6,7 +6,7 @@ import inspect
 import logging
 import time
 import traceback
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, TypeAlias
@@ -372,6 +372,60 @@ class UserResult:
                 )
 
 
+def _crashed_report(
+    trial: Trial,
+    e: Exception,
+    *,
+    start: float,
+    default_report_values: DefaultReportValues,
+) -> Report:
+    duration = time.monotonic() - start
+    time_end = time.time()
+    logger.error(f"Error during evaluation of '{trial.id}': {trial.config}.")
+    logger.exception(e)
+    return trial.set_complete(
+        report_as="crashed",
+        objective_to_minimize=default_report_values.objective_value_on_error,
+        cost=default_report_values.cost_value_on_error,
+        learning_curve=default_report_values.learning_curve_on_error,
+        extra=None,
+        err=e,
+        tb=traceback.format_exc(),
+        time_end=time_end,
+        evaluation_duration=duration,
+    )
+
+
+def _success_report(
+    trial: Trial,
+    user_result: Any,
+    *,
+    start: float,
+    default_report_values: DefaultReportValues,
+) -> Report:
+    duration = time.monotonic() - start
+    time_end = time.time()
+    logger.info(f"Successful evaluation of '{trial.id}': {user_result}.")
+
+    result = UserResult.parse(
+        user_result,
+        default_cost_value=default_report_values.cost_if_not_provided,
+        default_objective_to_minimize_value=default_report_values.objective_value_on_error,
+        default_learning_curve=default_report_values.learning_curve_if_not_provided,
+    )
+    return trial.set_complete(
+        report_as="success",
+        objective_to_minimize=result.objective_to_minimize,
+        cost=result.cost,
+        learning_curve=result.learning_curve,
+        err=result.exception,
+        tb=None,
+        extra=result.extra,
+        time_end=time_end,
+        evaluation_duration=duration,
+    )
+
+
 def _eval_trial(
     *,
     trial: Trial,
@@ -383,55 +437,38 @@ def _eval_trial(
     try:
         user_result = fn(**kwargs, **trial.config)
     # Something went wrong in evaluation
-    except Exception as e:
-        duration = time.monotonic() - start
-        time_end = time.time()
-        logger.error(f"Error during evaluation of '{trial.id}': {trial.config}.")
-        logger.exception(e)
-        report = trial.set_complete(
-            report_as="crashed",
-            objective_to_minimize=default_report_values.objective_value_on_error,
-            cost=default_report_values.cost_value_on_error,
-            learning_curve=default_report_values.learning_curve_on_error,
-            extra=None,
-            err=e,
-            tb=traceback.format_exc(),
-            time_end=time_end,
-            evaluation_duration=duration,
-        )
-    else:
-        duration = time.monotonic() - start
-        time_end = time.time()
-        logger.info(f"Successful evaluation of '{trial.id}': {user_result}.")
-
-        result = UserResult.parse(
-            user_result,
-            default_cost_value=default_report_values.cost_if_not_provided,
-            default_objective_to_minimize_value=default_report_values.objective_value_on_error,
-            default_learning_curve=default_report_values.learning_curve_if_not_provided,
-        )
-        report = trial.set_complete(
-            report_as="success",
-            objective_to_minimize=result.objective_to_minimize,
-            cost=result.cost,
-            learning_curve=result.learning_curve,
-            err=result.exception,
-            tb=None,
-            extra=result.extra,
-            time_end=time_end,
-            evaluation_duration=duration,
+    except Exception as e:  # noqa: BLE001
+        return _crashed_report(
+            trial, e, start=start, default_report_values=default_report_values
         )
 
-    return report
+    return _success_report(
+        trial, user_result, start=start, default_report_values=default_report_values
+    )
 
 
-def evaluate_trial(
-    trial: Trial,
+async def _eval_trial_async(
     *,
-    evaluation_fn: Callable[..., Any],
+    trial: Trial,
     default_report_values: DefaultReportValues,
-) -> tuple[Trial, Report]:
-    """Evaluates a trial from a user and parses the results into a `Report`."""
+    fn: Callable[..., Awaitable[Any]],
+    **kwargs: Any,
+) -> Report:
+    start = time.monotonic()
+    try:
+        user_result = await fn(**kwargs, **trial.config)
+    # Something went wrong in evaluation
+    except Exception as e:  # noqa: BLE001
+        return _crashed_report(
+            trial, e, start=start, default_report_values=default_report_values
+        )
+
+    return _success_report(
+        trial, user_result, start=start, default_report_values=default_report_values
+    )
+
+
+def _injectable_params(trial: Trial, evaluation_fn: Callable[..., Any]) -> dict[str, Any]:
     trial_location = Path(trial.metadata.location)
     prev_trial_location = (
         Path(trial.metadata.previous_trial_location)
@@ -444,11 +481,38 @@ def evaluate_trial(
         "previous_pipeline_directory": prev_trial_location,
     }
     sigkeys = inspect.signature(evaluation_fn).parameters.keys()
-    injectable_params = {key: val for key, val in params.items() if key in sigkeys}
+    return {key: val for key, val in params.items() if key in sigkeys}
+
+
+def evaluate_trial(
+    trial: Trial,
+    *,
+    evaluation_fn: Callable[..., Any],
+    default_report_values: DefaultReportValues,
+) -> tuple[Trial, Report]:
+    """Evaluates a trial from a user and parses the results into a `Report`."""
     report = _eval_trial(
         trial=trial,
         fn=evaluation_fn,
         default_report_values=default_report_values,
-        **injectable_params,
+        **_injectable_params(trial, evaluation_fn),
+    )
+    return trial, report
+
+
+async def evaluate_trial_async(
+    trial: Trial,
+    *,
+    evaluation_fn: Callable[..., Awaitable[Any]],
+    default_report_values: DefaultReportValues,
+) -> tuple[Trial, Report]:
+    """Evaluates a trial with an `async def` evaluation function and parses the
+    results into a `Report`.
+    """
+    report = await _eval_trial_async(
+        trial=trial,
+        fn=evaluation_fn,
+        default_report_values=default_report_values,
+        **_injectable_params(trial, evaluation_fn),
     )
     return trial, report
@@ -174,3 +174,26 @@ class WorkerSettings:
     If `None`, there is no limit and this worker will continue to evaluate
     indefinitely or until another stopping criterion is met.
     """
+
+    # --------- Sampling ---------
+    prefetch_trials: int | None = None
+    """The number of pending trials to keep sampled ahead of time.
+
+    If set, a single worker is elected to sample in a background thread, keeping
+    this many pending trials available, such that workers finishing an evaluation
+    can immediately pick up the next one rather than waiting for a model to be fit.
+    Pending trials are taken into account by model based optimizers, such that the
+    trials in the queue are not all sampled in the same region.
+
+    If `None`, each worker samples a new trial when there is none pending.
+    """
+
+    # --------- Evaluation ---------
+    max_concurrent_evaluations: int = 1
+    """The number of evaluations a worker runs at once.
+
+    Only used by the [`AsyncWorker`][neps.runtime.AsyncWorker], as the number of
+    evaluations it keeps in flight on an event loop, and the
+    [`ProcessPoolWorker`][neps.runtime.ProcessPoolWorker], as the number of child
+    processes it evaluates in.
+    """
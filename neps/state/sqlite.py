@@ -0,0 +1,412 @@
+"""The SQLite storage backend of the [`NePSState`][neps.state.NePSState].
+
+Everything lives in a single `state.sqlite` database, by default in WAL mode such
+that readers do not block the writer and vice versa. Exclusion between workers is
+done with `BEGIN IMMEDIATE` transactions, which SQLite makes wait on one another,
+rather than polling lock files.
+
+```
+root_directory
+├── configs
+│   └── config_1            # Only created for the user's evaluation function
+├── state.sqlite            # Trials, optimizer state and errors
+└── .optimizer.lock
+```
+
+!!! warning
+
+    WAL mode relies on shared memory between the processes using the database, so
+    all workers have to run on the same machine. For workers spread over machines
+    which share a network filesystem, set `NEPS_SQLITE_JOURNAL_MODE=DELETE`,
+    keeping in mind that SQLite's file locking is only as reliable as that of
+    the filesystem.
+
+!!! note
+
+    The optimizer lock remains a [`FileLocker`][neps.state.filebased.FileLocker].
+    It is held for the entire time a worker samples from the optimizer and, as
+    SQLite only allows one writer at a time, holding a transaction open for that
+    long would block every other worker from reporting their results.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from neps.env import SQLITE_JOURNAL_MODE
+from neps.exceptions import NePSError, TrialAlreadyExistsError, TrialNotFoundError
+from neps.state.err_dump import ErrDump, SerializableTrialError
+from neps.state.notify import Notifier
+from neps.state.optimizer import OptimizationState
+from neps.state.trial import Trial
+
+if TYPE_CHECKING:
+    from neps.optimizers import OptimizerInfo
+    from neps.state.filebased import TrialWriteHint
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trials (
+    id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    time_sampled REAL NOT NULL,
+    trial BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trials_by_version ON trials (version);
+CREATE INDEX IF NOT EXISTS trials_by_state ON trials (state, time_sampled);
+CREATE TABLE IF NOT EXISTS errors (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    trial_id TEXT NOT NULL,
+    worker_id TEXT NOT NULL,
+    err_type TEXT NOT NULL,
+    err TEXT NOT NULL,
+    tb TEXT
+);
+CREATE TABLE IF NOT EXISTS optimizer (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL
+);
+"""
+
+
+@dataclass
+class SQLiteDatabase:
+    """A connection to the state database, shared by the objects of one process.
+
+    The connection is opened lazily and reopened if the process was forked.
+    """
+
+    FILENAME = "state.sqlite"
+
+    path: Path
+    timeout: float | None
+
+    _connection: sqlite3.Connection | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _pid: int | None = field(default=None, init=False, repr=False, compare=False)
+    _rlock: threading.RLock = field(
+        default_factory=threading.RLock, init=False, repr=False, compare=False
+    )
+    _depth: int = field(default=0, init=False, repr=False, compare=False)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The connection for this process."""
+        if self._connection is None or self._pid != os.getpid():
+            # NOTE: We manage transactions ourselves, hence `isolation_level=None`
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.timeout if self.timeout is not None else 2**31,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+            self._depth = 0
+
+        return self._connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the contained statements in a single write transaction.
+
+        Nested transactions are folded into the outermost one.
+        """
+        with self._rlock:
+            connection = self.connection
+            if self._depth > 0:
+                self._depth += 1
+                try:
+                    yield connection
+                finally:
+                    self._depth -= 1
+                return
+
+            connection.execute("BEGIN IMMEDIATE")
+            self._depth = 1
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            else:
+                connection.execute("COMMIT")
+            finally:
+                self._depth = 0
+
+    @contextmanager
+    def cursor(self) -> Iterator[sqlite3.Connection]:
+        """Run statements on the connection, inside a transaction if one is open."""
+        with self._rlock:
+            yield self.connection
+
+
+@dataclass
+class SQLiteLocker:
+    """Locker which holds a write transaction on the state database."""
+
+    database: SQLiteDatabase
+
+    @contextmanager
+    def lock(self, *, worker_id: str | None = None) -> Iterator[None]:
+        """Hold a write transaction for the duration of the context.
+
+        Args:
+            worker_id: The id of the worker trying to acquire the lock.
+
+                Used for debug messaging purposes.
+        """
+        try:
+            with self.database.transaction():
+                if worker_id is not None:
+                    logger.debug(
+                        "Worker %s began a transaction on %s",
+                        worker_id,
+                        self.database.path,
+                    )
+                yield
+        except sqlite3.OperationalError as e:
+            if "locked" not in str(e):
+                raise
+
+            raise NePSError(
+                f"Failed to begin a transaction after a timeout of"
+                f" {self.database.timeout} seconds."
+                f"\n\nDatabase path: {self.database.path}"
+            ) from e
+
+
+def _dumps(obj: Any) -> bytes:
+    return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@dataclass
+class SQLiteTrialRepo:
+    """A repository for trials stored as rows of the state database.
+
+    Every write to a trial stamps it with a new, increasing `version`, such that
+    readers can ask for only the trials that changed since their last read.
+
+    !!! warning
+
+        This class does not implement locking and it is up to the caller to hold
+        the [`SQLiteLocker`][neps.state.sqlite.SQLiteLocker].
+    """
+
+    database: SQLiteDatabase
+    directory: Path
+    changes: Notifier = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.changes = Notifier(self.directory / ".changed")
+
+    def list_trial_ids(self) -> list[str]:
+        """List all the trial ids in the database."""
+        with self.database.cursor() as con:
+            return [row[0] for row in con.execute("SELECT id FROM trials")]
+
+    def read_since(
+        self,
+        position: int | None,
+    ) -> tuple[dict[str, Trial] | None, list[Trial], int]:
+        """Read the trials that changed since `position`.
+
+        See [`TrialStore.read_since()`][neps.state.storage.TrialStore.read_since].
+        """
+        version = position if position is not None else 0
+        with self.database.cursor() as con:
+            rows = con.execute(
+                "SELECT version, trial FROM trials WHERE version > ? ORDER BY version",
+                (version,),
+            ).fetchall()
+
+        updates = [pickle.loads(trial) for _, trial in rows]  # noqa: S301
+        if rows:
+            version = rows[-1][0]
+
+        snapshot: dict[str, Trial] | None = {} if position is None else None
+        return snapshot, updates, version
+
+    def latest(self) -> dict[str, Trial]:
+        """Get all the latest trials from the database."""
+        _, updates, _ = self.read_since(None)
+        return {trial.id: trial for trial in updates}
+
+    def _write(self, con: sqlite3.Connection, trials: list[Trial]) -> None:
+        (version,) = con.execute(
+            "SELECT COALESCE(MAX(version), 0) FROM trials"
+        ).fetchone()
+        con.executemany(
+            "INSERT OR REPLACE INTO trials (id, version, state, time_sampled, trial)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    trial.id,
+                    version + i,
+                    trial.metadata.state.value,
+                    trial.metadata.time_sampled,
+                    _dumps(trial),
+                )
+                for i, trial in enumerate(trials, start=1)
+            ],
+        )
+
+    def store_new_trial(self, trial: Trial | list[Trial]) -> None:
+        """Write a new trial to the database.
+
+        Raises:
+            TrialAlreadyExistsError: If the trial already exists.
+        """
+        trials = [trial] if isinstance(trial, Trial) else trial
+        with self.database.transaction() as con:
+            for child_trial in trials:
+                exists = con.execute(
+                    "SELECT 1 FROM trials WHERE id = ?", (child_trial.id,)
+                ).fetchone()
+                if exists is not None:
+                    raise TrialAlreadyExistsError(child_trial.id, self.database.path)
+
+            self._write(con, trials)
+
+        # The user's evaluation function may want to write into its directory.
+        for child_trial in trials:
+            (self.directory / f"config_{child_trial.id}").mkdir(exist_ok=True)
+
+        self.changes.notify()
+
+    def update_trial(
+        self,
+        trial: Trial,
+        *,
+        hints: Iterable[TrialWriteHint] | TrialWriteHint | None = None,  # noqa: ARG002
+    ) -> None:
+        """Update a trial in the database.
+
+        Args:
+            trial: The trial to update.
+            hints: Unused, the trial is always written as a whole.
+        """
+        self.update_trials([trial])
+
+    def update_trials(
+        self,
+        trials: list[Trial],
+        *,
+        hints: Iterable[TrialWriteHint] | TrialWriteHint | None = None,  # noqa: ARG002
+    ) -> None:
+        """Update several trials in the database, in a single transaction.
+
+        Args:
+            trials: The trials to update.
+            hints: Unused, the trials are always written as a whole.
+        """
+        with self.database.transaction() as con:
+            self._write(con, trials)
+
+        self.changes.notify()
+
+    def load_trial_from_disk(self, trial_id: str) -> Trial:
+        """Load a trial from the database.
+
+        Raises:
+            TrialNotFoundError: If the trial is not in the database.
+        """
+        with self.database.cursor() as con:
+            row = con.execute(
+                "SELECT trial FROM trials WHERE id = ?", (trial_id,)
+            ).fetchone()
+
+        if row is None:
+            raise TrialNotFoundError(
+                f"Trial {trial_id} not found in database at {self.database.path}."
+            )
+
+        trial = pickle.loads(row[0])  # noqa: S301
+        assert isinstance(trial, Trial)
+        return trial
+
+
+@dataclass
+class SQLiteOptimizerRepo:
+    """The optimizer info and state, stored in the state database."""
+
+    database: SQLiteDatabase
+
+    def _read(self, key: str) -> Any:
+        with self.database.cursor() as con:
+            row = con.execute(
+                "SELECT value FROM optimizer WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            raise NePSError(f"No '{key}' found in database at {self.database.path}.")
+
+        return pickle.loads(row[0])  # noqa: S301
+
+    def _write(self, key: str, value: Any) -> None:
+        with self.database.transaction() as con:
+            con.execute(
+                "INSERT OR REPLACE INTO optimizer (key, value) VALUES (?, ?)",
+                (key, _dumps(value)),
+            )
+
+    def read_info(self) -> OptimizerInfo:
+        """Read the optimizer info."""
+        info = self._read("info")
+        assert isinstance(info, dict)
+        return cast("OptimizerInfo", info)
+
+    def write_info(self, info: OptimizerInfo) -> None:
+        """Write the optimizer info."""
+        self._write("info", dict(info))
+
+    def read_state(self) -> OptimizationState:
+        """Read the optimizer state."""
+        state = self._read("state")
+        assert isinstance(state, OptimizationState)
+        return state
+
+    def write_state(self, state: OptimizationState) -> None:
+        """Write the optimizer state."""
+        self._write("state", state)
+
+
+@dataclass
+class SQLiteErrRepo:
+    """The errors shared between workers, stored in the state database."""
+
+    database: SQLiteDatabase
+
+    def read(self) -> ErrDump:
+        """Read all the errors, in the order they were reported."""
+        with self.database.cursor() as con:
+            rows = con.execute(
+                "SELECT trial_id, worker_id, err_type, err, tb FROM errors ORDER BY seq"
+            ).fetchall()
+
+        return ErrDump([SerializableTrialError(*row) for row in rows])
+
+    def append(self, err: SerializableTrialError) -> None:
+        """Add an error."""
+        with self.database.transaction() as con:
+            con.execute(
+                "INSERT INTO errors (trial_id, worker_id, err_type, err, tb)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (err.trial_id, err.worker_id, err.err_type, err.err, err.tb),
+            )
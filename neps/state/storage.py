@@ -0,0 +1,168 @@
+"""The interface a storage backend of the [`NePSState`][neps.state.NePSState]
+has to implement.
+
+There are currently two backends:
+
+* `#!python "filebased"` - Every trial lives in its own `configs/config_<id>/`
+    directory, with the optimizer state and errors as files next to them, all
+    guarded by file locks. This is the default and lets users inspect and edit
+    the state by hand.
+* `#!python "sqlite"` - Trials, optimizer state and errors are rows of a single
+    SQLite database in WAL mode, guarded by its transactions. This avoids
+    creating thousands of tiny files per run, which on shared filesystems
+    tends to be the dominant I/O cost.
+
+The backend is chosen when the state is first created, see
+[`NePSState.create_or_load()`][neps.state.neps_state.NePSState.create_or_load],
+and detected from what is on disk when it is loaded.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeAlias
+
+if TYPE_CHECKING:
+    from neps.optimizers import OptimizerInfo
+    from neps.state.err_dump import ErrDump, SerializableTrialError
+    from neps.state.filebased import TrialWriteHint
+    from neps.state.notify import Notifier
+    from neps.state.optimizer import OptimizationState
+    from neps.state.trial import Trial
+
+StorageBackend: TypeAlias = Literal["filebased", "sqlite"]
+
+
+class Locker(Protocol):
+    """Mutual exclusion between workers, possibly in different processes."""
+
+    def lock(self, *, worker_id: str | None = None) -> AbstractContextManager[None]:
+        """Hold the lock for the duration of the context.
+
+        Args:
+            worker_id: The id of the worker trying to acquire the lock.
+
+                Used for debug messaging purposes.
+        """
+        ...
+
+
+class TrialStore(Protocol):
+    """Where trials are stored and shared between workers.
+
+    !!! warning
+
+        Implementations do not lock and it is up to the caller to hold the
+        trial [`Locker`][neps.state.storage.Locker] of the backend.
+    """
+
+    directory: Path
+    """The directory in which each trial gets its `config_<id>` directory."""
+
+    changes: Notifier
+    """Notified whenever a trial is written."""
+
+    def list_trial_ids(self) -> list[str]:
+        """List all the trial ids."""
+        ...
+
+    def read_since(
+        self,
+        position: Any | None,
+    ) -> tuple[dict[str, Trial] | None, list[Trial], Any]:
+        """Read the trial updates written since `position`.
+
+        Args:
+            position: What was returned by the previous call, or `None` to read
+                everything.
+
+        Returns:
+            A snapshot to start from, only if the reader has to discard what it has
+            seen so far, the trial updates to apply on top of that, in the order
+            they were written, and the position to pass in on the next read.
+        """
+        ...
+
+    def latest(self) -> dict[str, Trial]:
+        """Get all the latest trials."""
+        ...
+
+    def store_new_trial(self, trial: Trial | list[Trial]) -> None:
+        """Store a new trial, or a batch of them.
+
+        Raises:
+            TrialAlreadyExistsError: If the trial already exists.
+        """
+        ...
+
+    def update_trial(
+        self,
+        trial: Trial,
+        *,
+        hints: Iterable[TrialWriteHint] | TrialWriteHint | None = ...,
+    ) -> None:
+        """Update a trial."""
+        ...
+
+    def update_trials(
+        self,
+        trials: list[Trial],
+        *,
+        hints: Iterable[TrialWriteHint] | TrialWriteHint | None = ...,
+    ) -> None:
+        """Update several trials at once, such that they are committed together."""
+        ...
+
+    def load_trial_from_disk(self, trial_id: str) -> Trial:
+        """Load a single trial.
+
+        Raises:
+            TrialNotFoundError: If the trial does not exist.
+        """
+        ...
+
+
+class OptimizerStore(Protocol):
+    """Where the optimizer info and the shared optimizer state are stored.
+
+    !!! warning
+
+        Implementations do not lock and it is up to the caller to hold the
+        optimizer [`Locker`][neps.state.storage.Locker] of the backend.
+    """
+
+    def read_info(self) -> OptimizerInfo:
+        """Read the optimizer info."""
+        ...
+
+    def write_info(self, info: OptimizerInfo) -> None:
+        """Write the optimizer info."""
+        ...
+
+    def read_state(self) -> OptimizationState:
+        """Read the optimizer state."""
+        ...
+
+    def write_state(self, state: OptimizationState) -> None:
+        """Write the optimizer state."""
+        ...
+
+
+class ErrStore(Protocol):
+    """Where errors are shared between workers.
+
+    !!! warning
+
+        Implementations do not lock and it is up to the caller to hold the
+        error [`Locker`][neps.state.storage.Locker] of the backend.
+    """
+
+    def read(self) -> ErrDump:
+        """Read all the errors."""
+        ...
+
+    def append(self, err: SerializableTrialError) -> None:
+        """Add an error."""
+        ...
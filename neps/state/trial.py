@@ -146,6 +146,12 @@ class Trial:
         """Return the id of the trial."""
         return self.metadata.id  # type: ignore
 
+    def set_pending(self) -> None:
+        """Set the trial back to pending, undoing it being evaluated."""
+        self.metadata.time_started = None
+        self.metadata.evaluating_worker_id = None
+        self.metadata.state = State.PENDING
+
     def set_submitted(self, *, time_submitted: float) -> None:
         """Set the trial as submitted."""
         self.metadata.time_submitted = time_submitted
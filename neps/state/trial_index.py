@@ -0,0 +1,176 @@
+"""Secondary indexes and running aggregates over the trials a worker has seen.
+
+A [`TrialIndex`][neps.state.trial_index.TrialIndex] is updated one trial at a time
+as updates are read from the [`TrialStore`][neps.state.storage.TrialStore], such that
+questions the runtime asks on every iteration, such as "which is the oldest pending
+trial?" or "how much cost has been spent?", do not require going over every trial.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+from neps.state.trial import State, Trial
+
+_NOT_STARTED = (State.PENDING, State.SUBMITTED)
+
+
+@dataclass
+class TrialAggregates:
+    """Running totals over all trials."""
+
+    n_started: int = 0
+    """The number of trials which are no longer pending or submitted."""
+
+    n_reported: int = 0
+    """The number of trials which have a report."""
+
+    cost_total: float = 0.0
+    """The total cost reported by trials."""
+
+    evaluation_duration_total: float = 0.0
+    """The total evaluation duration reported by trials."""
+
+
+@dataclass(frozen=True)
+class _Contribution:
+    state: State
+    time_sampled: float
+    reported: bool
+    cost: float
+    evaluation_duration: float
+
+    @classmethod
+    def of(cls, trial: Trial) -> _Contribution:
+        report = trial.report
+        return cls(
+            state=trial.metadata.state,
+            time_sampled=trial.metadata.time_sampled,
+            reported=report is not None,
+            cost=_summable(report.cost if report is not None else None),
+            evaluation_duration=_summable(
+                report.evaluation_duration if report is not None else None
+            ),
+        )
+
+
+def _summable(value: float | None) -> float:
+    # NOTE: A nan would poison the running total for good, as it can't be subtracted
+    # back out once the trial gets updated.
+    if value is None or math.isnan(value):
+        return 0.0
+    return value
+
+
+@dataclass
+class TrialIndex:
+    """The trials, indexed by their state, with running aggregates.
+
+    !!! note
+
+        What a trial contributes to the index is recorded when it is
+        [`put()`][neps.state.trial_index.TrialIndex.put], so modifying a trial in
+        place does not corrupt the index. It will only be reflected once the
+        updated trial is put again.
+    """
+
+    trials: dict[str, Trial] = field(default_factory=dict)
+    """All the trials, by their id."""
+
+    aggregates: TrialAggregates = field(default_factory=TrialAggregates)
+    """Running totals over all trials."""
+
+    _by_state: dict[State, dict[str, Trial]] = field(
+        default_factory=lambda: {state: {} for state in State},
+        repr=False,
+    )
+    _contributions: dict[str, _Contribution] = field(default_factory=dict, repr=False)
+
+    # Min-heap of (time_sampled, tiebreak, trial_id) for pending trials. Entries
+    # are removed lazily, i.e. only once they reach the top and are no longer valid.
+    _pending_heap: list[tuple[float, int, str]] = field(default_factory=list, repr=False)
+    _tiebreak: itertools.count = field(default_factory=itertools.count, repr=False)
+
+    @classmethod
+    def from_trials(cls, trials: Mapping[str, Trial]) -> TrialIndex:
+        """Create an index over the given trials."""
+        index = cls()
+        index.put_many(trials.values())
+        return index
+
+    def put(self, trial: Trial) -> None:
+        """Add a trial to the index, replacing any previous version of it."""
+        previous = self._contributions.get(trial.id)
+        if previous is not None:
+            del self._by_state[previous.state][trial.id]
+            self._add_to_aggregates(previous, sign=-1)
+
+        contribution = _Contribution.of(trial)
+        self.trials[trial.id] = trial
+        self._by_state[contribution.state][trial.id] = trial
+        self._contributions[trial.id] = contribution
+        self._add_to_aggregates(contribution, sign=1)
+
+        if contribution.state == State.PENDING and (
+            previous is None
+            or previous.state != State.PENDING
+            or previous.time_sampled != contribution.time_sampled
+        ):
+            heapq.heappush(
+                self._pending_heap,
+                (contribution.time_sampled, next(self._tiebreak), trial.id),
+            )
+
+    def put_many(self, trials: Iterable[Trial]) -> None:
+        """Add trials to the index, in order."""
+        for trial in trials:
+            self.put(trial)
+
+    def with_state(self, state: State) -> list[Trial]:
+        """Get all the trials in a given state."""
+        return list(self._by_state[state].values())
+
+    def count(self, state: State) -> int:
+        """The number of trials in a given state."""
+        return len(self._by_state[state])
+
+    def oldest_pending(self) -> Trial | None:
+        """Get the pending trial that was sampled the earliest."""
+        pending = self._by_state[State.PENDING]
+        while self._pending_heap:
+            time_sampled, _, trial_id = self._pending_heap[0]
+            trial = pending.get(trial_id)
+            if (
+                trial is not None
+                and self._contributions[trial_id].time_sampled == time_sampled
+            ):
+                return trial
+
+            heapq.heappop(self._pending_heap)
+
+        return None
+
+    def oldest_pendings(self, n: int) -> list[Trial]:
+        """Get the `n` pending trials that were sampled the earliest."""
+        if n == 1:
+            trial = self.oldest_pending()
+            return [] if trial is None else [trial]
+
+        return heapq.nsmallest(
+            n,
+            self._by_state[State.PENDING].values(),
+            key=lambda t: self._contributions[t.id].time_sampled,
+        )
+
+    def _add_to_aggregates(self, contribution: _Contribution, *, sign: int) -> None:
+        aggregates = self.aggregates
+        if contribution.state not in _NOT_STARTED:
+            aggregates.n_started += sign
+        if contribution.reported:
+            aggregates.n_reported += sign
+        aggregates.cost_total += sign * contribution.cost
+        aggregates.evaluation_duration_total += sign * contribution.evaluation_duration
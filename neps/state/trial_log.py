@@ -0,0 +1,395 @@
+"""An append-only, segmented log of trial updates.
+
+Every write to a trial (a new trial being sampled, a trial being picked up for
+evaluation, a report coming in, ...) is appended as a pickled record to the
+currently active segment of the log. Once a segment grows past a size threshold,
+it is sealed by creating the next segment file, after which it is never written to
+again.
+
+```
+configs/.trial_log/
+├── manifest.json           # Which snapshot is current and what it covers
+├── snapshot_000004.pkl     # All trials as of the start of segment 4
+├── segment_000004.pkl      # Sealed, immutable
+├── segment_000005.pkl      # Sealed, immutable
+└── segment_000006.pkl      # Active, appended to
+```
+
+Readers only need to read the segments they have not seen yet, while sealed segments
+are periodically folded into a new snapshot by a single elected worker, in a
+background thread. The newly compacted snapshot is then installed by whichever
+worker next holds the trial lock, at which point the segments it covers are removed.
+
+!!! warning
+
+    This class does not implement the trial locking and it is up to the caller to
+    ensure that appends, reads and
+    [`install_compaction()`][neps.state.trial_log.TrialLog.install_compaction]
+    happen while holding it. Only the building of a compacted snapshot is safe
+    to do without it, as it only ever reads sealed segments.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import pickle
+import threading
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import portalocker as pl
+
+from neps.env import TRIAL_LOG_COMPACT_AFTER_SEGMENTS, TRIAL_LOG_SEGMENT_MAX_BYTES
+from neps.state.trial import Trial
+from neps.utils.files import atomic_write
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TrialLogManifest:
+    """Pointer to the current snapshot of the log."""
+
+    snapshot: str | None
+    """The filename of the snapshot, if there is one."""
+
+    next_segment: int
+    """The first segment whose records are **not** included in the snapshot."""
+
+
+@dataclass(frozen=True)
+class TrialLogPosition:
+    """A position in the log, up to which a reader has consumed records."""
+
+    segment: int
+    """The segment the reader is in."""
+
+    offset: int
+    """The number of bytes of the segment that have been consumed."""
+
+
+def _replace_atomically(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with atomic_write(tmp_path, "wb") as f:
+        f.write(data)
+    tmp_path.replace(path)
+
+
+def _read_records(data: bytes) -> tuple[list[Trial], int]:
+    """Read all complete records from a chunk of a segment.
+
+    Returns:
+        The trials in the order they were written and the number of bytes that
+        made up complete records. Anything past this is a partially written record.
+    """
+    buffer = io.BytesIO(data)
+    trials: list[Trial] = []
+    consumed = 0
+    while consumed < len(data):
+        try:
+            datum = pickle.load(buffer)  # noqa: S301
+        except (EOFError, pickle.UnpicklingError):
+            # A writer is either mid-append or crashed during one, either way
+            # we can only trust what came before.
+            break
+
+        if isinstance(datum, list):
+            trials.extend(datum)
+        else:
+            assert isinstance(datum, Trial), "Not a trial."
+            trials.append(datum)
+
+        consumed = buffer.tell()
+
+    return trials, consumed
+
+
+@dataclass
+class TrialLog:
+    """An append-only log of trial updates, split into segments.
+
+    See the [module docstring][neps.state.trial_log] for the layout on disk.
+    """
+
+    MANIFEST_FILENAME = "manifest.json"
+    COMPACTED_FILENAME = "compacted.json"
+    COMPACTION_LOCK_FILENAME = ".compaction.lock"
+
+    directory: Path
+    segment_max_bytes: int = TRIAL_LOG_SEGMENT_MAX_BYTES
+    compact_after_segments: int = TRIAL_LOG_COMPACT_AFTER_SEGMENTS
+
+    _active_segment: int = field(default=0, init=False, repr=False)
+    _compaction_thread: threading.Thread | None = field(
+        default=None, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def manifest_path(self) -> Path:
+        """The path to the manifest."""
+        return self.directory / self.MANIFEST_FILENAME
+
+    def segment_path(self, index: int) -> Path:
+        """The path to the segment with the given index."""
+        return self.directory / f"segment_{index:06d}.pkl"
+
+    def snapshot_path(self, next_segment: int) -> Path:
+        """The path to the snapshot which covers every segment before `next_segment`."""
+        return self.directory / f"snapshot_{next_segment:06d}.pkl"
+
+    def exists(self) -> bool:
+        """Whether the log has been initialized."""
+        return self.manifest_path.exists()
+
+    def initialize(self, trials: dict[str, Trial] | None = None) -> None:
+        """Create the log, optionally starting from an existing set of trials."""
+        if trials:
+            snapshot_path = self.snapshot_path(0)
+            pickle_bytes = pickle.dumps(trials, protocol=pickle.HIGHEST_PROTOCOL)
+            _replace_atomically(snapshot_path, pickle_bytes)
+            manifest = TrialLogManifest(snapshot=snapshot_path.name, next_segment=0)
+        else:
+            manifest = TrialLogManifest(snapshot=None, next_segment=0)
+
+        self._write_manifest(manifest, self.manifest_path)
+        self._active_segment = 0
+
+    def read_manifest(self) -> TrialLogManifest:
+        """Read the manifest of the log."""
+        with self.manifest_path.open("r") as f:
+            return TrialLogManifest(**json.load(f))
+
+    def read_snapshot(self, manifest: TrialLogManifest) -> dict[str, Trial]:
+        """Read the trials in the snapshot pointed to by the manifest."""
+        if manifest.snapshot is None:
+            return {}
+
+        with (self.directory / manifest.snapshot).open("rb") as f:
+            trials = pickle.load(f)  # noqa: S301
+
+        assert isinstance(trials, dict), "Snapshot is not a dict of trials."
+        return trials
+
+    def is_sealed(self, index: int) -> bool:
+        """Whether a segment is sealed, i.e. it will not be written to again."""
+        return self.segment_path(index + 1).exists()
+
+    def read_segment(
+        self,
+        index: int,
+        offset: int = 0,
+        *,
+        missing_ok: bool = True,
+    ) -> tuple[list[Trial], int]:
+        """Read the records of a segment, starting at `offset` bytes.
+
+        Args:
+            index: The index of the segment.
+            offset: The number of bytes of the segment already consumed.
+            missing_ok: Whether a segment that does not exist (yet) is read as
+                empty. If `False`, a `FileNotFoundError` is raised instead.
+
+        Returns:
+            The trials in the order they were written and the offset up to which
+            the segment has been consumed.
+        """
+        try:
+            with self.segment_path(index).open("rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            if not missing_ok:
+                raise
+            return [], offset
+
+        trials, consumed = _read_records(data)
+        return trials, offset + consumed
+
+    def read_since(
+        self,
+        position: TrialLogPosition | None,
+    ) -> tuple[dict[str, Trial] | None, list[Trial], TrialLogPosition]:
+        """Read everything written to the log since `position`.
+
+        Args:
+            position: Where the reader last stopped, or `None` to read the log
+                from the start.
+
+        Returns:
+            A snapshot to start from, only if the reader has to discard what it has
+            seen so far, the trial updates to apply on top of that, in the order
+            they were written, and the position to pass in on the next read.
+        """
+        manifest = self.read_manifest()
+        snapshot: dict[str, Trial] | None = None
+        if position is None or position.segment < manifest.next_segment:
+            # Either our first read, or the segments we would need to read next have
+            # been compacted away, in which case we start from the snapshot.
+            snapshot = self.read_snapshot(manifest)
+            position = TrialLogPosition(segment=manifest.next_segment, offset=0)
+
+        updates: list[Trial] = []
+        segment, offset = position.segment, position.offset
+        while True:
+            # NOTE: We need to check if it's sealed before reading, otherwise
+            # a record could be appended in between and we would skip it.
+            sealed = self.is_sealed(segment)
+            segment_updates, offset = self.read_segment(segment, offset)
+            updates.extend(segment_updates)
+            if not sealed:
+                break
+
+            segment, offset = segment + 1, 0
+
+        return snapshot, updates, TrialLogPosition(segment=segment, offset=offset)
+
+    def append(self, trial: Trial | Iterable[Trial]) -> None:
+        """Append a trial update, or a batch of them, to the active segment."""
+        if not isinstance(trial, Trial):
+            trial = list(trial)
+
+        # Some other worker may have sealed the segment we last wrote to, or it may
+        # have been compacted away entirely.
+        manifest = self.read_manifest()
+        self._active_segment = max(self._active_segment, manifest.next_segment)
+        while self.is_sealed(self._active_segment):
+            self._active_segment += 1
+
+        segment_path = self.segment_path(self._active_segment)
+        bytes_ = pickle.dumps(trial, protocol=pickle.HIGHEST_PROTOCOL)
+        with atomic_write(segment_path, "ab") as f:
+            f.write(bytes_)
+            size = f.tell()
+
+        if size >= self.segment_max_bytes:
+            self.segment_path(self._active_segment + 1).touch()
+            self._active_segment += 1
+            logger.debug("Sealed trial log segment %s.", segment_path.name)
+
+            n_sealed = self._active_segment - manifest.next_segment
+            if n_sealed >= self.compact_after_segments:
+                self.compact_in_background()
+
+    def compact(self) -> TrialLogManifest | None:
+        """Fold the sealed segments into a new snapshot.
+
+        This only writes the new snapshot and proposes it to be installed,
+        see [`install_compaction()`][neps.state.trial_log.TrialLog.install_compaction].
+        As it only reads sealed segments, this does not require the trial lock.
+
+        Returns:
+            The manifest proposed for installation, if there was anything to compact.
+        """
+        manifest = self.read_manifest()
+
+        next_segment = manifest.next_segment
+        while self.is_sealed(next_segment):
+            next_segment += 1
+
+        if next_segment == manifest.next_segment:
+            return None
+
+        new_snapshot_path = self.snapshot_path(next_segment)
+        if not new_snapshot_path.exists():
+            try:
+                trials = self.read_snapshot(manifest)
+                for index in range(manifest.next_segment, next_segment):
+                    updates, _ = self.read_segment(index, missing_ok=False)
+                    trials.update({t.id: t for t in updates})
+            except FileNotFoundError:
+                # Someone else compacted and installed past us already, removing
+                # what we were reading. Going on would drop the updates it held.
+                return None
+
+            pickle_bytes = pickle.dumps(trials, protocol=pickle.HIGHEST_PROTOCOL)
+            _replace_atomically(new_snapshot_path, pickle_bytes)
+
+        proposed = TrialLogManifest(
+            snapshot=new_snapshot_path.name,
+            next_segment=next_segment,
+        )
+        self._write_manifest(proposed, self.directory / self.COMPACTED_FILENAME)
+        logger.debug(
+            "Compacted trial log segments [%s, %s) into %s.",
+            manifest.next_segment,
+            next_segment,
+            new_snapshot_path.name,
+        )
+        return proposed
+
+    def compact_in_background(self) -> None:
+        """Compact the log in a background thread, if this worker is elected to.
+
+        Election is done through a non-blocking file lock, such that only one
+        worker is compacting at any given time.
+        """
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+
+        def _compact() -> None:
+            try:
+                with pl.Lock(
+                    self.directory / self.COMPACTION_LOCK_FILENAME,
+                    timeout=0,
+                    fail_when_locked=True,
+                    flags=pl.LOCK_EX | pl.LOCK_NB,
+                ):
+                    self.compact()
+            except pl.exceptions.LockException:
+                logger.debug("Another worker is compacting the trial log.")
+            except Exception:
+                logger.debug("Failed to compact the trial log.", exc_info=True)
+
+        self._compaction_thread = threading.Thread(
+            target=_compact,
+            name="neps-trial-log-compaction",
+            daemon=True,
+        )
+        self._compaction_thread.start()
+
+    def install_compaction(self) -> TrialLogManifest | None:
+        """Install a compacted snapshot, if one was proposed, and remove the
+        segments it covers.
+
+        !!! warning
+
+            Requires the trial lock to be held, as readers may otherwise be reading
+            segments as they are removed.
+
+        Returns:
+            The newly installed manifest, if one was installed.
+        """
+        compacted_path = self.directory / self.COMPACTED_FILENAME
+        if not compacted_path.exists():
+            return None
+
+        current = self.read_manifest()
+        with compacted_path.open("r") as f:
+            proposed = TrialLogManifest(**json.load(f))
+
+        if proposed.next_segment <= current.next_segment:
+            # Stale, a later compaction was already installed
+            compacted_path.unlink(missing_ok=True)
+            if proposed.snapshot is not None and proposed.snapshot != current.snapshot:
+                (self.directory / proposed.snapshot).unlink(missing_ok=True)
+            return None
+
+        compacted_path.replace(self.manifest_path)
+        for index in range(current.next_segment, proposed.next_segment):
+            self.segment_path(index).unlink(missing_ok=True)
+
+        if current.snapshot is not None:
+            (self.directory / current.snapshot).unlink(missing_ok=True)
+
+        logger.debug("Installed compacted trial log snapshot %s.", proposed.snapshot)
+        return proposed
+
+    def _write_manifest(self, manifest: TrialLogManifest, path: Path) -> None:
+        _replace_atomically(path, json.dumps(asdict(manifest)).encode())
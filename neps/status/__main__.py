@@ -2,7 +2,7 @@
 
 Usage:
     python -m neps.status [-h] [--best_objective_to_minimizees] [--best_configs]
-        [--all_configs] working_directory
+        [--all_configs] [--reference_point VALUE ...] working_directory
 
 Positional arguments:
     working_directory  The working directory given to neps.run
@@ -15,6 +15,8 @@ Optional arguments:
         objective_to_minimizees
                      across evaluations
     --all_configs      Show all configs and their objective_to_minimizees
+    --reference_point  The reference point for the hypervolume of
+        multiobjective runs, one value per objective
 
 Note:
     We have to use the __main__.py construct due to the issues explained in
@@ -37,7 +39,10 @@ parser = argparse.ArgumentParser(
 )
 parser.add_argument("root_directory", type=Path,
                     help="The working directory given to neps.run")
+parser.add_argument("--reference_point", type=float, nargs="+", default=None,
+                    help="The reference point for the hypervolume of multiobjective"
+                    " runs, one value per objective")
 args = parser.parse_args()
 
 logging.basicConfig(level=logging.WARN)
-status(args.root_directory, print_summary=True)
+status(args.root_directory, print_summary=True, reference_point=args.reference_point)
@@ -4,28 +4,144 @@
 from __future__ import annotations
 
 import itertools
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+from neps.optimizers.utils.multiobjective.pareto import ParetoArchive, hypervolume
 from neps.runtime import get_workers_neps_state
 from neps.state.neps_state import FileLocker, NePSState
 from neps.state.trial import State, Trial
 
+REFERENCE_POINT_OFFSET = 0.1
+"""How far past the worst seen value of each objective the default reference point
+for the hypervolume is, as a fraction of the range of seen values."""
+
+
+@dataclass
+class ParetoFrontTracker:
+    """The Pareto front of the reported trials of a multi-objective run.
+
+    Trials are added as they get reported, such that each update only looks at the
+    trials which were not seen before. Alongside the front, the best and worst seen
+    value of each objective are kept, from which the default reference point for the
+    hypervolume follows directly.
+    """
+
+    trial_ids: set[str] = field(default_factory=set)
+    """The ids of the trials that were added."""
+
+    archive: ParetoArchive | None = None
+    """The Pareto front of the added trials, keyed by trial id."""
+
+    ideal: np.ndarray | None = None
+    """The best seen value of each objective."""
+
+    nadir: np.ndarray | None = None
+    """The worst seen value of each objective."""
+
+    _hypervolumes: dict[tuple[float, ...], float] = field(
+        default_factory=dict, repr=False
+    )
+
+    def update(self, trials: Mapping[str, Trial]) -> None:
+        """Add the multi-objective reports of the trials not seen before.
+
+        If any trial that was seen before is gone, the tracker starts over.
+        """
+        if not self.trial_ids <= trials.keys():
+            self.trial_ids.clear()
+            self.archive = self.ideal = self.nadir = None
+            self._hypervolumes.clear()
+
+        for trial_id in trials.keys() - self.trial_ids:
+            trial = trials[trial_id]
+            if trial.report is None:
+                continue
+
+            self.trial_ids.add(trial_id)
+            objectives = trial.report.objective_to_minimize
+            if not isinstance(objectives, Sequence):
+                continue
+
+            costs = np.asarray(objectives, dtype=np.float64)
+            if not np.isfinite(costs).all():
+                continue
+
+            if self.archive is None or self.ideal is None or self.nadir is None:
+                self.archive = ParetoArchive(n_objectives=len(costs))
+                self.ideal = costs.copy()
+                self.nadir = costs.copy()
+            else:
+                self.ideal = np.minimum(self.ideal, costs)
+                self.nadir = np.maximum(self.nadir, costs)
+
+            if self.archive.add(trial_id, costs):
+                self._hypervolumes.clear()
+
+    @property
+    def front(self) -> list[str]:
+        """The ids of the trials on the Pareto front."""
+        return [] if self.archive is None else [str(k) for k in self.archive.keys]
+
+    def reference_point(self) -> np.ndarray | None:
+        """The default reference point, just past the worst seen objective values."""
+        if self.ideal is None or self.nadir is None:
+            return None
+
+        span = self.nadir - self.ideal
+        span[span == 0] = 1
+        return self.nadir + REFERENCE_POINT_OFFSET * span
+
+    def hypervolume(self, reference_point: Sequence[float] | None = None) -> float | None:
+        """The hypervolume of the Pareto front.
+
+        Args:
+            reference_point: The reference point to use. If `None`, the
+                [`reference_point()`][neps.status.status.ParetoFrontTracker.reference_point]
+                is used, which moves as worse objective values are seen. Give a fixed
+                one to compare hypervolumes over the course of a run.
+
+        Returns:
+            The hypervolume, or `None` if there are no multi-objective reports yet.
+        """
+        ref = self.reference_point() if reference_point is None else reference_point
+        if self.archive is None or ref is None:
+            return None
+
+        key = tuple(float(r) for r in ref)
+        if key not in self._hypervolumes:
+            self._hypervolumes[key] = hypervolume(self.archive.costs, np.asarray(key))
+        return self._hypervolumes[key]
+
+
+_PARETO_FRONT_TRACKERS: dict[Path, ParetoFrontTracker] = {}
+"""The Pareto fronts of the runs summarized in this process, keyed by root directory,
+such that repeated summaries only need to add the newly reported trials."""
+
 
 @dataclass
 class Summary:
     """Summary of the current state of a neps run."""
 
     by_state: dict[State, list[Trial]]
-    # No support for multiobjective yet
+    # For multiobjective runs, see the pareto front instead
     best: tuple[Trial, float] | None
     is_multiobjective: bool
     running: list[Trial] = field(init=False)
 
+    pareto_front: list[Trial] = field(default_factory=list)
+    """The trials on the Pareto front, for multiobjective runs."""
+
+    hypervolume: float | None = None
+    """The hypervolume of the Pareto front, for multiobjective runs."""
+
+    reference_point: list[float] | None = None
+    """The reference point used for the `hypervolume`."""
+
     def __post_init__(self) -> None:
         if self.is_multiobjective:
             assert self.best is None
@@ -109,7 +225,7 @@ class Summary:
 
         if self.best is None:
             if self.is_multiobjective:
-                best_summary = "Multiobjective summary not supported yet for best yet."
+                best_summary = self._formatted_pareto_front()
             else:
                 best_summary = "No best found yet."
         else:
@@ -129,9 +245,41 @@ class Summary:
 
         return f"# Configs: {self.num_evaluated}\n\n{state_summary}\n\n{best_summary}"
 
+    def _formatted_pareto_front(self) -> str:
+        if not self.pareto_front:
+            return "No pareto front found yet."
+
+        front_summary = "\n".join(
+            f"    config {trial.metadata.id}: {trial.report.objective_to_minimize}"
+            for trial in self.pareto_front
+            if trial.report is not None
+        )
+        return (
+            f"# Pareto Front ({len(self.pareto_front)} configs):"
+            "\n"
+            f"\n    hypervolume: {self.hypervolume}"
+            f"\n    reference_point: {self.reference_point}"
+            "\n"
+            f"\n{front_summary}"
+        )
+
     @classmethod
-    def from_directory(cls, root_directory: str | Path) -> Summary:
-        """Create a summary from a neps run directory."""
+    def from_directory(
+        cls,
+        root_directory: str | Path,
+        *,
+        reference_point: Sequence[float] | None = None,
+    ) -> Summary:
+        """Create a summary from a neps run directory.
+
+        Args:
+            root_directory: The root directory given to neps.run.
+            reference_point: The reference point for the hypervolume of multiobjective
+                runs. If `None`, one just past the worst seen objective values is used.
+
+        Returns:
+            The summary.
+        """
         root_directory = Path(root_directory)
 
         is_multiobjective: bool = False
@@ -165,25 +313,51 @@ class Summary:
                     case _:
                         raise RuntimeError("Unexpected type for objective_to_minimize")
 
-        return cls(by_state=by_state, best=best, is_multiobjective=is_multiobjective)
+        if not is_multiobjective:
+            return cls(by_state=by_state, best=best, is_multiobjective=False)
+
+        tracker = _PARETO_FRONT_TRACKERS.setdefault(
+            root_directory.absolute().resolve(), ParetoFrontTracker()
+        )
+        tracker.update(trials)
+        if reference_point is None:
+            ref = tracker.reference_point()
+            reference_point = None if ref is None else ref.tolist()
+
+        return cls(
+            by_state=by_state,
+            best=None,
+            is_multiobjective=True,
+            pareto_front=sorted(
+                (trials[trial_id] for trial_id in tracker.front),
+                key=lambda t: t.report.objective_to_minimize,  # type: ignore
+            ),
+            hypervolume=tracker.hypervolume(reference_point),
+            reference_point=None if reference_point is None else list(reference_point),
+        )
 
 
 def status(
     root_directory: str | Path,
     *,
     print_summary: bool = False,
+    reference_point: Sequence[float] | None = None,
 ) -> tuple[pd.DataFrame, pd.Series]:
     """Print status information of a neps run and return results.
 
     Args:
         root_directory: The root directory given to neps.run.
         print_summary: If true, print a summary of the current run state
+        reference_point: The reference point for the hypervolume of multiobjective
+            runs. If `None`, one just past the worst seen objective values is used,
+            which moves as worse values are seen. Give a fixed one to monitor the
+            hypervolume over the course of a run.
 
     Returns:
         Dataframe of full results and short summary series.
     """
     root_directory = Path(root_directory)
-    summary = Summary.from_directory(root_directory)
+    summary = Summary.from_directory(root_directory, reference_point=reference_point)
 
     if print_summary:
         print(summary.formatted())
@@ -203,8 +377,21 @@ def status(
     short.index = short.index.astype(str)
     assert isinstance(short, pd.Series)
 
-    # Not implemented for hypervolume -_-
     if summary.is_multiobjective:
+        front_ids = [trial.metadata.id for trial in summary.pareto_front]
+        df["on_pareto_front"] = df.index.isin(front_ids)
+        pareto_short = pd.Series(
+            {
+                "pareto_front_size": len(front_ids),
+                "hypervolume": summary.hypervolume,
+                "reference_point": summary.reference_point,
+                "pareto_front_config_ids": front_ids,
+            },
+            dtype=object,
+        )
+        short = pd.concat([short, pareto_short])
+        short.name = "value"
+        short.index.name = "summary"
         return df, short
 
     idx_min = df["objective_to_minimize"].idxmin()
@@ -12,9 +12,10 @@ from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import torch
+if TYPE_CHECKING:
+    import torch
 
 
 def extract_keyword_defaults(f: Callable) -> dict[str, Any]:
@@ -51,6 +52,8 @@ def load_checkpoint(
         A dictionary containing the checkpoint values, or None if the checkpoint file
         does not exist hence no checkpointing was previously done.
     """
+    import torch
+
     from neps.runtime import get_in_progress_trial
 
     if directory is None:
@@ -93,6 +96,8 @@ def save_checkpoint(
         optimizer: The optimizer to save.
         checkpoint_name: The name of the checkpoint file.
     """
+    import torch
+
     from neps.runtime import get_in_progress_trial
 
     if directory is None:
@@ -133,6 +138,8 @@ def load_lightning_checkpoint(
         A tuple containing the checkpoint path (str) and the loaded checkpoint data (dict)
         or (None, None) if no checkpoint files are found in the directory.
     """
+    import torch
+
     from neps.runtime import get_in_progress_trial
 
     if previous_pipeline_directory is None:
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from neps.optimizers import load_optimizer
+from neps.optimizers.bracket_optimizer import TrialTableCache, trials_to_table
+from neps.space import Float, Integer, SearchSpace
+from neps.state import Trial
+from neps.state.trial import Report
+
+
+def _report(trial: Trial, rng: np.random.Generator) -> None:
+    trial.report = Report(
+        objective_to_minimize=float(rng.random()),
+        cost=None,
+        learning_curve=None,
+        extra={},
+        err=None,
+        tb=None,
+        reported_as="success",
+        evaluation_duration=None,
+    )
+    trial.metadata.state = Trial.State.SUCCESS
+
+
+def _run(optimizer, trials: dict[str, Trial], n: int, rng: np.random.Generator) -> None:
+    for trial in trials.values():
+        if trial.report is None:
+            _report(trial, rng)
+
+    for i in range(n):
+        sampled = optimizer(trials, None)
+        trial = Trial.new(
+            trial_id=sampled.id,
+            config=sampled.config,
+            location="",
+            previous_trial=sampled.previous_config_id,
+            previous_trial_location=None,
+            time_sampled=0,
+            worker_id="",
+        )
+        trials[sampled.id] = trial
+        # Leave the last few pending
+        if i < n - 3:
+            _report(trial, rng)
+
+
+@pytest.mark.parametrize("optimizer", ["successive_halving", "hyperband", "asha"])
+def test_trials_to_table_with_cache_matches_without(optimizer: str) -> None:
+    space = SearchSpace({"a": Float(0, 1), "epochs": Integer(1, 27, is_fidelity=True)})
+    opt, _ = load_optimizer(optimizer, space)
+    rng = np.random.default_rng(0)
+
+    trials: dict[str, Trial] = {}
+    cache = TrialTableCache()
+    for _ in range(4):
+        _run(opt, trials, 30, rng)
+        pd.testing.assert_frame_equal(
+            trials_to_table(trials, cache=cache), trials_to_table(trials)
+        )
+
+    # Completely different trials should not reuse any of the cached rows
+    other = dict(list(trials.items())[:10])
+    pd.testing.assert_frame_equal(
+        trials_to_table(other, cache=cache), trials_to_table(other)
+    )
+
+
+@pytest.mark.parametrize("optimizer", ["successive_halving", "hyperband"])
+def test_finished_brackets_are_not_created(optimizer: str) -> None:
+    space = SearchSpace({"a": Float(0, 1), "epochs": Integer(1, 27, is_fidelity=True)})
+    opt, _ = load_optimizer(optimizer, space)
+    rng = np.random.default_rng(0)
+
+    trials: dict[str, Trial] = {}
+    _run(opt, trials, 300, rng)
+
+    brackets = opt.create_brackets(trials_to_table(trials))
+    assert isinstance(brackets, list)
+    assert 0 < len(brackets) <= 2
+    assert all(bracket.next() != "done" for bracket in brackets)
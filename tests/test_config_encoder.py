@@ -3,6 +3,7 @@ from __future__ import annotations
 import torch
 
 from neps.space import Categorical, ConfigEncoder, Float, Integer
+from neps.space.encoding import EncodedConfigCache
 
 
 def test_config_encoder_pdist_calculation() -> None:
@@ -73,3 +74,24 @@ def test_config_encoder_pdist_squareform() -> None:
 
     # Should be symmetric
     torch.testing.assert_close(dist_sq, dist_sq.T)
+
+
+def test_encoded_config_cache_only_encodes_new_configs() -> None:
+    parameters = {"a": Categorical(["cat", "mouse", "dog"]), "b": Float(1, 10)}
+    encoder = ConfigEncoder.from_parameters(parameters)
+    cache = EncodedConfigCache(encoder)
+    configs = {
+        str(i): {"a": ["cat", "mouse", "dog"][i % 3], "b": float(i + 1)}
+        for i in range(10)
+    }
+
+    x = cache.encode({k: configs[k] for k in ["0", "1"]})
+    assert torch.equal(x, encoder.encode([configs["0"], configs["1"]]))
+
+    # A different config under a known id is not re-encoded
+    x = cache.encode({"1": configs["5"], "0": configs["0"]})
+    assert torch.equal(x, encoder.encode([configs["1"], configs["0"]]))
+
+    x = cache.encode(configs)
+    assert len(cache) == 10
+    assert torch.equal(x, encoder.encode(list(configs.values())))
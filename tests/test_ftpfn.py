@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import torch
+from ifbo.download import FILENAME, WEIGHTS_FINAL_NAME
+
+from neps.optimizers.models import ftpfn as ftpfn_module
+from neps.optimizers.models.ftpfn import (
+    FTPFN_DTYPE,
+    FTPFNSurrogate,
+    acquire_next_from_ftpfn,
+)
+from neps.sampling import Sampler
+from neps.space import Domain, Float, SearchSpace
+from neps.space.encoding import ConfigEncoder
+
+
+@pytest.mark.parametrize("batch_size", [None, 100])
+def test_acquire_next_from_ftpfn_scores_each_round_at_once(
+    batch_size: int | None,
+) -> None:
+    encoder = ConfigEncoder.from_parameters(
+        SearchSpace({"a": Float(0, 1), "b": Float(0, 1)}).searchables
+    )
+    budget_domain = Domain.floating(0.1, 1)
+    # Two evaluated configs, of which the second is fully evaluated
+    continuation_samples = torch.tensor(
+        [[1, 0.1, 0.2, 0.2], [1, 0.5, 0.2, 0.2], [2, 1.0, 0.3, 0.3]],
+        dtype=FTPFN_DTYPE,
+    )
+
+    calls: list[int] = []
+
+    def acq_function(X: torch.Tensor) -> torch.Tensor:
+        calls.append(len(X))
+        return -(X[:, 2:] - 0.3).pow(2).sum(dim=1)
+
+    best_row = acquire_next_from_ftpfn(
+        ftpfn=SimpleNamespace(device=None),  # type: ignore
+        continuation_samples=continuation_samples,
+        encoder=encoder,
+        budget_domain=budget_domain,
+        acq_function=acq_function,
+        initial_samplers=[
+            (Sampler.uniform(ndim=encoder.ndim), 200),
+            (Sampler.uniform(ndim=encoder.ndim), 100),
+        ],
+        local_search_sample_size=50,
+        batch_size=batch_size,
+    )
+
+    # Only the config that is not fully evaluated is scored for continuation
+    n_round_1 = 1 + 200 + 100
+    n_round_2 = 2 * 50
+    if batch_size is None:
+        assert calls == [n_round_1, n_round_2]
+    else:
+        assert sum(calls) == n_round_1 + n_round_2
+        assert max(calls) <= batch_size
+    assert best_row.shape == (2 + encoder.ndim,)
+
+
+def test_ftpfn_surrogate_loads_memory_mapped_weights_lazily(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(ftpfn_module, "_CACHED_FTPFN_MODEL", {})
+    model_dir = tmp_path / ".model"
+    model_dir.mkdir()
+    (model_dir / FILENAME("0.0.1")).touch()
+    weights_path = model_dir / WEIGHTS_FINAL_NAME("0.0.1")
+    original = torch.nn.Linear(4, 2)
+    # Stored in the legacy format, which can not be memory-mapped directly
+    torch.save(original, weights_path, _use_new_zipfile_serialization=False)
+
+    surrogate = FTPFNSurrogate(target_path=tmp_path)
+    assert not weights_path.with_suffix(".mmap.pt").exists()
+
+    model = surrogate.model
+    assert weights_path.with_suffix(".mmap.pt").exists()
+    assert torch.equal(model.weight, original.weight)  # type: ignore
+    maps = Path("/proc/self/maps")
+    if maps.exists():
+        assert str(weights_path.with_suffix(".mmap.pt")) in maps.read_text()
+
+    # Other surrogates of the same model share it
+    assert FTPFNSurrogate(target_path=tmp_path).model is model
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pytest
+import torch
+from botorch.acquisition import qLogNoisyExpectedImprovement
+
+from neps.optimizers.models import gp as gp_module
+from neps.optimizers.models.gp import make_default_single_obj_gp, optimize_acq
+from neps.space import Categorical, Float, SearchSpace
+from neps.space.encoding import ConfigEncoder
+
+
+@pytest.mark.parametrize("mixed", [False, True])
+@pytest.mark.parametrize("n_candidates", [1, 2])
+def test_optimize_acq_in_parallel(mixed: bool, n_candidates: int) -> None:
+    parameters = {"a": Float(0, 1), "b": Float(0, 1)}
+    if mixed:
+        parameters["c"] = Categorical(["x", "y", "z"])
+    encoder = ConfigEncoder.from_parameters(SearchSpace(parameters).searchables)
+
+    torch.manual_seed(0)
+    x = torch.rand(10, encoder.ndim, dtype=torch.float64)
+    if mixed:
+        x[:, encoder.index_of["c"]] = torch.randint(0, 3, (10,), dtype=torch.float64)
+    y = (x[:, 0] - x[:, 1]).unsqueeze(-1)
+    gp = make_default_single_obj_gp(x, y, encoder)
+    acq = qLogNoisyExpectedImprovement(gp, X_baseline=x)
+
+    candidates, acq_value = optimize_acq(
+        acq,
+        encoder,
+        n_candidates_required=n_candidates,
+        num_restarts=4,
+        n_intial_start_points=64,
+        n_workers=2,
+        hide_warnings=True,
+    )
+    assert candidates.shape == (n_candidates, encoder.ndim)
+    assert acq_value.numel() == 1
+    assert ((candidates >= 0) & (candidates <= 2)).all()
+    if mixed:
+        cats = candidates[:, encoder.index_of["c"]]
+        assert torch.equal(cats, cats.round())
+
+
+def test_optimize_acq_reuses_its_pool() -> None:
+    encoder = ConfigEncoder.from_parameters(
+        SearchSpace({"a": Float(0, 1), "b": Float(0, 1)}).searchables
+    )
+    torch.manual_seed(0)
+    x = torch.rand(10, encoder.ndim, dtype=torch.float64)
+    y = (x[:, 0] - x[:, 1]).unsqueeze(-1)
+    gp = make_default_single_obj_gp(x, y, encoder)
+
+    pools = []
+    for _ in range(2):
+        # A new acquisition function each time, as for each sample of an optimizer
+        acq = qLogNoisyExpectedImprovement(gp, X_baseline=x)
+        optimize_acq(
+            acq,
+            encoder,
+            num_restarts=4,
+            n_intial_start_points=64,
+            n_workers=2,
+            hide_warnings=True,
+        )
+        assert gp_module._acq_pool is not None
+        pools.append(gp_module._acq_pool[2])
+
+    assert pools[0] is pools[1]
+
+
+@pytest.mark.parametrize("n_candidates", [1, 2])
+def test_optimize_acq_searches_locally_over_many_categoricals(n_candidates: int) -> None:
+    parameters = {"a": Float(0, 1), "b": Float(0, 1)}
+    parameters.update({f"c{i}": Categorical(["x", "y", "z"]) for i in range(4)})
+    encoder = ConfigEncoder.from_parameters(SearchSpace(parameters).searchables)
+    cat_cols = [encoder.index_of[f"c{i}"] for i in range(4)]
+
+    torch.manual_seed(0)
+    x = torch.rand(20, encoder.ndim, dtype=torch.float64)
+    x[:, cat_cols] = torch.randint(0, 3, (20, 4), dtype=torch.float64)
+    y = (x[:, encoder.index_of["a"]] + (x[:, cat_cols[0]] == 1)).unsqueeze(-1)
+    gp = make_default_single_obj_gp(x, y.double(), encoder)
+    acq = qLogNoisyExpectedImprovement(gp, X_baseline=x)
+
+    candidates, acq_value = optimize_acq(
+        acq,
+        encoder,
+        n_candidates_required=n_candidates,
+        num_restarts=4,
+        n_intial_start_points=64,
+        fixed_features={"c3": "z"},
+        maximum_allowed_categorical_combinations=10,
+        n_workers=1,
+        hide_warnings=True,
+    )
+    assert candidates.shape == (n_candidates, encoder.ndim)
+    assert acq_value.numel() == 1
+    assert torch.equal(candidates[:, cat_cols], candidates[:, cat_cols].round())
+    assert (candidates[:, encoder.index_of["c3"]] == 2).all()
@@ -0,0 +1,87 @@
+"""Checks that the heavy dependencies are only imported by the parts that need them.
+
+Run this file directly to benchmark the import time of each of the entry points:
+
+    python tests/test_import_time.py
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = (
+    "botorch",
+    "gpytorch",
+    "ifbo",
+    "matplotlib",
+    "pandas",
+    "scipy",
+    "tensorboard",
+    "torch",
+)
+
+SPACE = (
+    "from neps.space import Float, Integer, SearchSpace;"
+    " space = SearchSpace({'a': Float(0, 1), 'e': Integer(1, 9, is_fidelity=True)})"
+)
+
+# The statement to run, and the heavy modules it may import
+ENTRY_POINTS: dict[str, tuple[str, set[str]]] = {
+    "import neps": ("import neps", set()),
+    "neps.status": ("import neps.status.status", {"pandas"}),
+    "neps.runtime": ("import neps.runtime", set()),
+    "neps.run": ("from neps import run", {"torch"}),
+    "random_search": (
+        f"{SPACE}; import neps;"
+        " neps.algorithms.random_search(space, ignore_fidelity=True)",
+        {"torch"},
+    ),
+    "asha": (f"{SPACE}; import neps; neps.algorithms.asha(space)", {"torch", "pandas"}),
+    "bayesian_optimization": (
+        f"{SPACE}; import neps;"
+        " neps.algorithms.bayesian_optimization(space, ignore_fidelity=True)",
+        set(HEAVY_MODULES) - {"ifbo", "matplotlib", "pandas", "tensorboard"},
+    ),
+}
+
+
+def _run(statement: str) -> tuple[float, set[str]]:
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "duration = time.perf_counter() - start\n"
+        "print(json.dumps([duration, sorted(sys.modules)]))\n"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    duration, modules = json.loads(result.stdout.splitlines()[-1])
+    return duration, {m.split(".")[0] for m in modules}
+
+
+@pytest.mark.parametrize("entry_point", list(ENTRY_POINTS))
+def test_entry_point_only_imports_what_it_needs(entry_point: str) -> None:
+    statement, allowed = ENTRY_POINTS[entry_point]
+    _, imported = _run(statement)
+    unexpected = (imported & set(HEAVY_MODULES)) - allowed
+    assert not unexpected, f"`{entry_point}` imported {sorted(unexpected)}"
+
+
+def test_lazy_attributes_are_not_hidden_by_subpackages() -> None:
+    # `neps.status` and `neps.plot` are also subpackages, imported here before the
+    # functions of the same name are first accessed
+    _run(
+        "import neps.status.status, neps.plot.plot, neps;"
+        " assert callable(neps.status) and callable(neps.plot)"
+    )
+
+
+if __name__ == "__main__":
+    for name, (statement, _) in ENTRY_POINTS.items():
+        durations = sorted(_run(statement)[0] for _ in range(3))
+        print(f"{name:<25} {durations[1]:6.2f}s")  # noqa: T201
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import neps
+from neps import AskAndTell, algorithms
+from neps.optimizers.utils.brackets import Rung
+from neps.optimizers.utils.multiobjective.epsnet import compute_epsilon_net
+from neps.optimizers.utils.multiobjective.nsga2 import (
+    crowding_distance,
+    nondominated_sort,
+)
+from neps.optimizers.utils.multiobjective.pareto import (
+    ParetoArchive,
+    hypervolume,
+    nondominated_fronts,
+    pareto_efficient,
+)
+from neps.space import Float, Integer, SearchSpace
+from neps.state import Trial
+from neps.status.status import ParetoFrontTracker
+
+
+def _brute_force_pareto_efficient(X: np.ndarray) -> np.ndarray:
+    return np.array(
+        [
+            not any((y <= x).all() and (y < x).any() for y in X)  # type: ignore
+            for x in X
+        ],
+        dtype=bool,
+    )
+
+
+def _costs(n: int, d: int, *, discrete: bool) -> np.ndarray:
+    rng = np.random.default_rng(n * 10 + d)
+    if discrete:
+        # Lots of ties and duplicates
+        return rng.integers(0, 5, size=(n, d)).astype(np.float64)
+    return rng.random((n, d))
+
+
+@pytest.mark.parametrize("d", [1, 2, 3, 4])
+@pytest.mark.parametrize("n", [0, 1, 50, 300])
+@pytest.mark.parametrize("discrete", [False, True])
+def test_pareto_efficient_matches_brute_force(n: int, d: int, discrete: bool) -> None:
+    X = _costs(n, d, discrete=discrete)
+    np.testing.assert_array_equal(pareto_efficient(X), _brute_force_pareto_efficient(X))
+
+
+@pytest.mark.parametrize("d", [2, 3])
+@pytest.mark.parametrize("discrete", [False, True])
+def test_nondominated_fronts_peel_off_pareto_fronts(d: int, discrete: bool) -> None:
+    X = _costs(300, d, discrete=discrete)
+    remaining = np.arange(len(X))
+    expected = []
+    while remaining.size > 0:
+        mask = _brute_force_pareto_efficient(X[remaining])
+        expected.append(remaining[mask])
+        remaining = remaining[~mask]
+
+    fronts = nondominated_fronts(X)
+    assert len(fronts) == len(expected)
+    for front, expected_front in zip(fronts, expected, strict=True):
+        np.testing.assert_array_equal(front, expected_front)
+
+    # Only the fronts needed to reach `max_items` need to be there
+    some_fronts = nondominated_fronts(X, max_items=len(expected[0]) + 1)
+    assert len(some_fronts) >= 2
+    for front, expected_front in zip(some_fronts, expected, strict=False):
+        np.testing.assert_array_equal(front, expected_front)
+
+
+@pytest.mark.parametrize("d", [2, 3])
+@pytest.mark.parametrize("discrete", [False, True])
+def test_pareto_archive_keeps_front_of_all_added_points(d: int, discrete: bool) -> None:
+    X = _costs(300, d, discrete=discrete)
+    archive = ParetoArchive(n_objectives=d)
+    for i, x in enumerate(X):
+        on_front = archive.add(i, x)
+        assert on_front == bool(pareto_efficient(X[: i + 1])[-1])
+
+    expected = np.flatnonzero(pareto_efficient(X))
+    assert sorted(archive.keys) == expected.tolist()  # type: ignore
+    np.testing.assert_array_equal(archive.costs[np.argsort(archive.keys)], X[expected])
+
+
+def test_crowding_distance_matches_naive() -> None:
+    X = _costs(30, 3, discrete=False)
+    expected = np.zeros(len(X))
+    for j in range(X.shape[1]):
+        order = np.argsort(X[:, j])
+        span = X[order[-1], j] - X[order[0], j]
+        expected[order[[0, -1]]] = np.inf
+        for before, i, after in zip(order, order[1:], order[2:], strict=False):
+            expected[i] += (X[after, j] - X[before, j]) / span
+
+    np.testing.assert_allclose(crowding_distance(X), expected)
+
+
+def test_nsga2_sort_orders_by_front_then_crowding_distance() -> None:
+    X = _costs(200, 2, discrete=False)
+    fronts = nondominated_fronts(X)
+
+    indices = nondominated_sort(X, max_items=len(fronts[0]) + 3, flatten=False)
+    assert len(indices) == 2
+    assert sorted(indices[0]) == fronts[0].tolist()
+    assert len(indices[1]) == 3
+    assert set(indices[1]) <= set(fronts[1].tolist())
+
+    distances = crowding_distance(X[fronts[0]])
+    by_index = dict(zip(fronts[0].tolist(), distances, strict=True))
+    ordered = [by_index[i] for i in indices[0]]
+    assert ordered == sorted(ordered, reverse=True)
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("dim", [None, 0])
+def test_epsilon_net_orders_non_finite_items_last(dim: int | None) -> None:
+    X = np.array([[np.inf, np.inf], [0.1, 0.9], [np.inf, np.inf], [0.9, 0.1]])
+    ranks = compute_epsilon_net(X, dim=dim)
+    assert sorted(ranks[[1, 3]]) == [0, 1]
+    assert ranks[[0, 2]].tolist() == [2, 3]
+    if dim == 0:
+        assert ranks[1] == 0
+
+    assert compute_epsilon_net(X[[0, 2]], dim=dim).tolist() == [0, 1]
+
+
+def _mo_rung() -> Rung:
+    perfs = [np.array([0.1, 0.9]), np.nan, np.array([0.9, 0.1]), np.inf]
+    perfs += [np.array([0.5, 0.5]), np.array([0.6, 0.6])]
+    table = pd.DataFrame(
+        {"config": [{"a": i} for i in range(len(perfs))], "perf": perfs},
+        index=pd.MultiIndex.from_tuples(
+            [(i, 0) for i in range(len(perfs))], names=["id", "rung"]
+        ),
+    )
+    return Rung(value=0, table=table, capacity=None)
+
+
+@pytest.mark.parametrize("selector", ["epsnet", "nsga2"])
+def test_mo_selector_leaves_out_pending_and_sorts_failed_last(selector: str) -> None:
+    selected = _mo_rung().mo_selector(selector=selector, k=10)
+    ids = selected.index.get_level_values("id").tolist()
+    assert sorted(ids[:3]) == [0, 2, 4]
+    assert ids[3:] == [5, 3]
+
+
+@pytest.mark.parametrize("optimizer", ["moasha", "mo_hyperband"])
+def test_mo_bracket_optimizers_with_nsga2(optimizer: str) -> None:
+    space = SearchSpace({"a": Float(0, 1), "epochs": Integer(1, 9, is_fidelity=True)})
+    ask_and_tell = AskAndTell(getattr(algorithms, optimizer)(space, mo_selector="nsga2"))
+    for _ in range(30):
+        trial = ask_and_tell.ask()
+        a = trial.config["a"]
+        ask_and_tell.tell(trial, [a, (1 - a) / trial.config["epochs"]])
+
+    promoted = [t for t in ask_and_tell.trials.values() if t.metadata.previous_trial_id]
+    assert promoted
+
+
+def test_hypervolume() -> None:
+    ref = np.array([1.0, 1.0])
+    assert hypervolume(np.array([[0.5, 0.5]]), ref) == pytest.approx(0.25)
+    # The dominated point and the one past the reference point add nothing
+    X = np.array([[0.0, 0.5], [0.5, 0.0], [0.6, 0.6], [2.0, 0.0]])
+    assert hypervolume(X, ref) == pytest.approx(0.75)
+    assert hypervolume(X[2:], np.array([0.5, 0.5])) == 0.0
+
+    # Two boxes of 0.5 * 1 * 1 overlapping in a box of 0.5 * 0.5 * 1
+    X = np.array([[0.5, 0.0, 0.0], [0.0, 0.5, 0.0]])
+    assert hypervolume(X, np.ones(3)) == pytest.approx(0.75)
+
+
+def _mo_trial(trial_id: str, objectives: list[float] | None) -> Trial:
+    trial = Trial.new(
+        trial_id=trial_id,
+        config={},
+        location="",
+        previous_trial=None,
+        previous_trial_location=None,
+        time_sampled=0,
+        worker_id="",
+    )
+    if objectives is not None:
+        trial.report = trial.set_complete(
+            report_as="success",
+            objective_to_minimize=objectives,
+            cost=None,
+            learning_curve=None,
+            err=None,
+            tb=None,
+            extra=None,
+            time_end=0,
+            evaluation_duration=None,
+        )
+    return trial
+
+
+def test_pareto_front_tracker_only_adds_new_trials() -> None:
+    trials = {"1": _mo_trial("1", [0.5, 0.5]), "2": _mo_trial("2", None)}
+    tracker = ParetoFrontTracker()
+    tracker.update(trials)
+    assert tracker.front == ["1"]
+    assert tracker.trial_ids == {"1"}
+
+    trials["2"] = _mo_trial("2", [0.0, 1.0])
+    trials["3"] = _mo_trial("3", [0.6, 0.6])
+    trials["4"] = _mo_trial("4", [0.4, 0.4])
+    tracker.update(trials)
+    assert sorted(tracker.front) == ["2", "4"]
+    np.testing.assert_allclose(tracker.reference_point(), [0.66, 1.06])  # type: ignore
+    assert tracker.hypervolume([1.0, 1.0]) == pytest.approx(0.36)
+
+    # Different trials, the tracker starts over
+    tracker.update({"3": trials["3"]})
+    assert tracker.front == ["3"]
+
+
+def test_status_of_multiobjective_run(tmp_path: Path) -> None:
+    def evaluate_pipeline(a: float) -> list[float]:
+        return [a, 1 - a]
+
+    root_directory = tmp_path / "run"
+    neps.run(
+        evaluate_pipeline,
+        pipeline_space=SearchSpace({"a": Float(0, 1)}),
+        root_directory=root_directory,
+        max_evaluations_total=5,
+        optimizer="random_search",
+    )
+
+    # Every config is on the front
+    df, short = neps.status(root_directory, reference_point=[1.0, 1.0])
+    assert df["on_pareto_front"].all()
+    assert short["pareto_front_size"] == 5
+    a = np.sort(df["config.a"].to_numpy(dtype=float))
+    widths = np.diff(np.append(a, 1.0))
+    assert short["hypervolume"] == pytest.approx((widths * a).sum())
+
+    short_csv = pd.read_csv(root_directory / "summary" / "short.csv", index_col=0)
+    assert int(short_csv.loc["pareto_front_size", "value"]) == 5
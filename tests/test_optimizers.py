@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+import torch
+
+from neps.optimizers import AskFunction, OptimizerInfo, algorithms, load_optimizer
+from neps.optimizers.ask_and_tell import AskAndTell
+from neps.optimizers.models import gp as gp_module
+from neps.optimizers.models.ftpfn import FTPFNSurrogate
+from neps.space import Categorical, Float, Integer, SearchSpace
+from neps.state import NePSState, OptimizationState, SeedSnapshot
+
+
+def test_bayesian_optimization_warm_starts_gp_from_shared_state(tmp_path: Path) -> None:
+    search_space = SearchSpace({"a": Float(0, 1), "b": Float(0, 1)})
+    neps_state = NePSState.create_or_load(
+        path=tmp_path / "neps_state",
+        optimizer_info=OptimizerInfo(name="bayesian_optimization", info={}),
+        optimizer_state=OptimizationState(
+            budget=None,
+            seed_snapshot=SeedSnapshot.new_capture(),
+            shared_state={"a": "b"},
+        ),
+    )
+
+    def sample_and_report(optimizer: AskFunction) -> None:
+        trial = neps_state.lock_and_sample_trial(optimizer=optimizer, worker_id="1")
+        report = trial.set_complete(
+            report_as="success",
+            objective_to_minimize=trial.config["a"] + trial.config["b"],
+            cost=None,
+            learning_curve=None,
+            err=None,
+            tb=None,
+            extra=None,
+            time_end=time.time(),
+            evaluation_duration=1,
+        )
+        neps_state.lock_and_report_trial_evaluation(trial, report, worker_id="1")
+
+    opt, _ = load_optimizer(
+        ("bayesian_optimization", {"initial_design_size": 2, "refit_gp_every": 3}),
+        search_space,
+    )
+    for _ in range(3):
+        sample_and_report(opt)
+
+    shared_state = neps_state.lock_and_get_optimizer_state().shared_state
+    assert shared_state is not None
+    assert shared_state["a"] == "b"
+    fit_state = shared_state["gp_fit_state"]
+    assert fit_state.n_observations == 2
+
+    # A fresh optimizer, as if in another worker, picks up the fitted state and
+    # reuses it until enough new observations arrived.
+    opt, _ = load_optimizer(
+        ("bayesian_optimization", {"initial_design_size": 2, "refit_gp_every": 3}),
+        search_space,
+    )
+    for _ in range(2):
+        sample_and_report(opt)
+
+    shared_state = neps_state.lock_and_get_optimizer_state().shared_state
+    assert shared_state is not None
+    reused = shared_state["gp_fit_state"]
+    assert reused.n_observations == 2
+    for name, value in fit_state.hyperparameters.items():
+        assert torch.equal(reused.hyperparameters[name], value)
+
+    sample_and_report(opt)
+    shared_state = neps_state.lock_and_get_optimizer_state().shared_state
+    assert shared_state is not None
+    assert shared_state["gp_fit_state"].n_observations == 5
+
+
+def test_bayesian_optimization_updates_gp_incrementally() -> None:
+    search_space = SearchSpace({"a": Float(0, 1), "b": Float(0, 1)})
+    opt, _ = load_optimizer(
+        ("bayesian_optimization", {"initial_design_size": 2, "refit_gp_every": 10}),
+        search_space,
+    )
+    ask_and_tell = AskAndTell(opt)
+    for _ in range(6):
+        trial = ask_and_tell.ask()
+        ask_and_tell.tell(trial, trial.config["a"] + trial.config["b"])
+
+    incremental = opt._incremental_gp  # type: ignore
+    assert incremental is not None
+    assert incremental.fit_state.n_observations == 2
+
+    # The GP fitted on the first 2 observations was conditioned on the others
+    # as they arrived, rather than being rebuilt.
+    assert len(incremental.trial_ids) == 5
+    assert incremental.gp.train_inputs[0].shape[-2] == 5
+
+
+@pytest.mark.parametrize("multi_objective", [False, True])
+def test_bayesian_optimization_with_variational_surrogate(multi_objective: bool) -> None:
+    search_space = SearchSpace({"a": Float(0, 1), "b": Categorical(["x", "y"])})
+    opt, _ = load_optimizer(
+        ("bayesian_optimization", {"initial_design_size": 3, "surrogate": "variational"}),
+        search_space,
+    )
+    ask_and_tell = AskAndTell(opt)
+    for _ in range(5):
+        trial = ask_and_tell.ask()
+        a = trial.config["a"]
+        ask_and_tell.tell(trial, [a, 1 - a] if multi_objective else a)
+
+    assert opt.shared_state is not None  # type: ignore
+    fit_state = opt.shared_state["gp_fit_state"]  # type: ignore
+    assert any("inducing_points" in name for name in fit_state.hyperparameters)
+
+
+def test_bayesian_optimization_acquires_in_acquisition_workers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(gp_module, "_acq_pool", None)
+    search_space = SearchSpace({"a": Float(0, 1), "b": Categorical(["x", "y"])})
+    opt, _ = load_optimizer(
+        ("bayesian_optimization", {"initial_design_size": 2, "acquisition_workers": 2}),
+        search_space,
+    )
+    ask_and_tell = AskAndTell(opt)
+    for _ in range(4):
+        trial = ask_and_tell.ask()
+        ask_and_tell.tell(trial, trial.config["a"])
+
+    assert gp_module._acq_pool is not None
+    _, n_workers, pool = gp_module._acq_pool
+    assert n_workers == 2
+    pool.shutdown()
+
+
+@pytest.mark.parametrize(
+    "key", ["successive_halving", "hyperband", "asha", "priorband", "grid_search"]
+)
+def test_optimizers_sample_distinct_batches(key: str) -> None:
+    search_space = SearchSpace(
+        {
+            "a": Float(0, 1, prior=None if key == "grid_search" else 0.5),
+            "b": Categorical(["x", "y"]),
+            "epochs": Integer(1, 9, is_fidelity=True),
+        }
+    )
+    opt, _ = load_optimizer(key, search_space)
+
+    batch = opt({}, None, n=5)
+    assert isinstance(batch, list)
+    assert len(batch) == 5
+    assert len({config.id for config in batch}) == 5
+
+    # A single sample afterwards accounts for the batch, continuing where it left off
+    ask_and_tell = AskAndTell(opt)
+    trials = [ask_and_tell.ask() for _ in range(5)]
+    assert [t.metadata.id for t in trials] == [config.id for config in batch]
+
+
+class _ContinuingFTPFN(FTPFNSurrogate):
+    """Stands in for the FTPFN model, which would need downloading, and always
+    prefers continuing an evaluated config over starting a new one.
+    """
+
+    def get_mean_performance(
+        self,
+        train_x: torch.Tensor,  # noqa: ARG002
+        train_y: torch.Tensor,  # noqa: ARG002
+        test_x: torch.Tensor,
+    ) -> torch.Tensor:
+        return torch.full((len(test_x),), 0.5, dtype=test_x.dtype)
+
+    def get_pi(
+        self,
+        train_x: torch.Tensor,  # noqa: ARG002
+        train_y: torch.Tensor,  # noqa: ARG002
+        test_x: torch.Tensor,
+        y_best: torch.Tensor | float,  # noqa: ARG002
+    ) -> torch.Tensor:
+        # New configs have the id 0
+        return (test_x[:, 0] > 0).to(test_x.dtype) + 0.01 * torch.rand(len(test_x))
+
+
+def test_ifbo_batch_does_not_continue_a_pending_config() -> None:
+    search_space = SearchSpace(
+        {"a": Float(0, 1), "epochs": Integer(1, 9, is_fidelity=True)}
+    )
+    opt = algorithms.ifbo(search_space, initial_design_size=1)
+    opt.ftpfn = _ContinuingFTPFN()
+    ask_and_tell = AskAndTell(opt)
+    trial = ask_and_tell.ask()
+    ask_and_tell.tell(trial, 0.5)
+
+    batch = opt(ask_and_tell.trials, None, n=3)
+    assert isinstance(batch, list)
+
+    # Once its continuation is pending, the evaluated config can not be continued
+    # again, leaving only new configs for the rest of the batch
+    assert batch[0].id == "1_1"
+    assert batch[0].previous_config_id == "1_0"
+    assert [config.id for config in batch[1:]] == ["2_0", "3_0"]
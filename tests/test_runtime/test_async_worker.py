@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from pytest_cases import fixture
+
+import neps
+from neps.optimizers.algorithms import random_search
+from neps.optimizers.optimizer import OptimizerInfo
+from neps.runtime import AsyncWorker, get_in_progress_trial
+from neps.space import Float, SearchSpace
+from neps.state import (
+    DefaultReportValues,
+    NePSState,
+    OnErrorPossibilities,
+    OptimizationState,
+    SeedSnapshot,
+    Trial,
+    WorkerSettings,
+)
+
+
+@fixture
+def neps_state(tmp_path: Path) -> NePSState:
+    return NePSState.create_or_load(
+        path=tmp_path / "neps_state",
+        optimizer_info=OptimizerInfo(name="blah", info={"nothing": "here"}),
+        optimizer_state=OptimizationState(
+            budget=None,
+            seed_snapshot=SeedSnapshot.new_capture(),
+            shared_state=None,
+        ),
+    )
+
+
+def _settings(
+    *,
+    max_evaluations_total: int,
+    max_concurrent_evaluations: int,
+    on_error: OnErrorPossibilities = OnErrorPossibilities.IGNORE,
+) -> WorkerSettings:
+    return WorkerSettings(
+        on_error=on_error,
+        default_report_values=DefaultReportValues(),
+        max_evaluations_total=max_evaluations_total,
+        include_in_progress_evaluations_towards_maximum=True,
+        max_cost_total=None,
+        max_evaluations_for_worker=None,
+        max_evaluation_time_total_seconds=None,
+        max_wallclock_time_for_worker_seconds=None,
+        max_evaluation_time_for_worker_seconds=None,
+        max_cost_for_worker=None,
+        batch_size=None,
+        max_concurrent_evaluations=max_concurrent_evaluations,
+    )
+
+
+def test_async_worker_runs_evaluations_concurrently(neps_state: NePSState) -> None:
+    optimizer = random_search(pipeline_space=SearchSpace({"a": Float(0, 1)}))
+    n_running = 0
+    max_running = 0
+
+    async def evaluation_fn(a: float) -> float:
+        nonlocal n_running, max_running
+        n_running += 1
+        max_running = max(max_running, n_running)
+        assert get_in_progress_trial().config == {"a": a}
+        await asyncio.sleep(0.2)
+        n_running -= 1
+        return a
+
+    worker = AsyncWorker.new(
+        state=neps_state,
+        optimizer=optimizer,
+        evaluation_fn=evaluation_fn,
+        settings=_settings(max_evaluations_total=6, max_concurrent_evaluations=3),
+    )
+    worker.run()
+
+    assert max_running == 3
+    assert worker.worker_cumulative_eval_count == 6
+
+    trials = neps_state.lock_and_read_trials()
+    assert len(trials) == 6
+    for trial in trials.values():
+        assert trial.metadata.state == Trial.State.SUCCESS
+        assert trial.report is not None
+        assert trial.report.objective_to_minimize == trial.config["a"]
+
+
+def test_async_worker_reports_crashed_evaluations(neps_state: NePSState) -> None:
+    optimizer = random_search(pipeline_space=SearchSpace({"a": Float(0, 1)}))
+
+    async def evaluation_fn(a: float) -> float:
+        raise ValueError("broken")
+
+    worker = AsyncWorker.new(
+        state=neps_state,
+        optimizer=optimizer,
+        evaluation_fn=evaluation_fn,
+        settings=_settings(max_evaluations_total=4, max_concurrent_evaluations=2),
+    )
+    worker.run()
+
+    trials = neps_state.lock_and_read_trials()
+    assert len(trials) == 4
+    assert all(t.metadata.state == Trial.State.CRASHED for t in trials.values())
+    assert len(neps_state.lock_and_get_errors()) == 4
+
+
+@pytest.mark.parametrize(
+    "arg", ["max_concurrent_evaluations", "n_workers", "prefetch_trials"]
+)
+def test_run_rejects_fewer_than_one_concurrent_evaluation(
+    tmp_path: Path, arg: str
+) -> None:
+    async def evaluate(a: float) -> float:
+        return a
+
+    with pytest.raises(ValueError, match=arg):
+        neps.run(
+            evaluate,
+            pipeline_space=SearchSpace({"a": Float(0, 1)}),
+            root_directory=tmp_path / "results",
+            max_evaluations_total=1,
+            **{arg: 0},
+        )
+
+    assert not (tmp_path / "results").exists()
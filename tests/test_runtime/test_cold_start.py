@@ -0,0 +1,305 @@
+"""Benchmarks how long a worker takes from `neps.run()` to its first evaluation.
+
+Each worker is started in a fresh interpreter, on a copy of a synthetic NePS state
+with a given number of finished trials, and times the phases of its cold start:
+
+* `import`: importing `neps.run`.
+* `optimizer`: building the optimizer in `load_optimizer()`.
+* `create_or_load`: creating or loading the NePS state, with retries.
+* `portalocker`: setting the function `portalocker` locks files with.
+* `first_read`: the first read of the trials by the worker.
+* `sample`: sampling the trial to evaluate.
+
+Everything else between starting the worker and its first evaluation is reported as
+`other`, and `process` is the wall time of the whole process, including the start of
+the interpreter. Run this file directly to benchmark, for example with 0, 1k, 10k and
+50k trials:
+
+    python tests/test_runtime/test_cold_start.py --trials 0 1000 10000 50000
+
+The synthetic states are kept in `--directory` and reused between runs. Pass
+`--profile <directory>` to also write a cProfile of the cold start of each worker.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from functools import wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+import pytest
+
+if TYPE_CHECKING:
+    from neps.space import SearchSpace
+
+PHASES: dict[str, tuple[str, str]] = {
+    "optimizer": ("neps.api", "load_optimizer"),
+    "create_or_load": ("neps.runtime", "_create_or_load_state"),
+    "portalocker": ("neps.runtime", "_set_portalocker_locker"),
+    "first_read": ("neps.state.neps_state", "NePSState._latest_trial_index"),
+    "sample": ("neps.state.neps_state", "NePSState._sample_trial"),
+}
+"""The phases timed after importing `neps.run`, and the function that each one is."""
+
+COLUMNS = ("import", *PHASES, "other", "time_to_first_evaluation", "process")
+
+
+def _space() -> SearchSpace:
+    from neps.space import Float, Integer, SearchSpace
+
+    return SearchSpace({"a": Float(0, 1), "b": Integer(1, 10)})
+
+
+def make_state(
+    directory: Path,
+    n_trials: int,
+    *,
+    optimizer: str,
+    backend: Literal["filebased", "sqlite"],
+) -> None:
+    """Create a NePS state with `n_trials` finished trials, as `neps.run()` with
+    `optimizer` would have.
+    """
+    import numpy as np
+
+    from neps.optimizers import load_optimizer
+    from neps.state import NePSState, OptimizationState, SeedSnapshot, Trial
+
+    _, optimizer_info = load_optimizer(optimizer, _space())
+    state = NePSState.create_or_load(
+        directory,
+        optimizer_info=optimizer_info,
+        optimizer_state=OptimizationState(
+            seed_snapshot=SeedSnapshot.new_capture(),
+            budget=None,
+            shared_state=None,
+        ),
+        backend=backend,
+    )
+    if n_trials == 0:
+        return
+
+    rng = np.random.default_rng(n_trials)
+    trials = []
+    for i, (a, b) in enumerate(
+        zip(rng.random(n_trials), rng.integers(1, 11, n_trials), strict=True)
+    ):
+        trial = Trial.new(
+            trial_id=str(i + 1),
+            config={"a": float(a), "b": int(b)},
+            location=str(directory / "configs" / f"config_{i + 1}"),
+            previous_trial=None,
+            previous_trial_location=None,
+            time_sampled=i,
+            worker_id="benchmark",
+        )
+        trial.set_evaluating(time_started=i, worker_id="benchmark")
+        trials.append(trial)
+
+    state._trial_repo.store_new_trial(trials)
+    for trial in trials:
+        trial.report = trial.set_complete(
+            report_as="success",
+            objective_to_minimize=trial.config["a"],
+            cost=None,
+            learning_curve=None,
+            err=None,
+            tb=None,
+            extra=None,
+            time_end=trial.metadata.time_started + 1,
+            evaluation_duration=1,
+        )
+    state._trial_repo.update_trials(trials, hints=["report", "metadata"])
+
+
+def _time_first_call(
+    durations: dict[str, float], phase: str, fn: Callable[..., Any]
+) -> Callable[..., Any]:
+    @wraps(fn)
+    def timed(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            durations.setdefault(phase, time.perf_counter() - start)
+
+    return timed
+
+
+def _worker(
+    directory: Path,
+    *,
+    optimizer: str,
+    result_path: Path,
+    profile_path: Path | None,
+) -> None:
+    start = time.perf_counter()
+    profiler = cProfile.Profile() if profile_path is not None else None
+    if profiler is not None:
+        profiler.enable()
+
+    from neps import run
+
+    durations = {"import": time.perf_counter() - start}
+
+    from importlib import import_module
+
+    for phase, (module_name, name) in PHASES.items():
+        owner: Any = import_module(module_name)
+        *owners, attribute = name.split(".")
+        for owner_name in owners:
+            owner = getattr(owner, owner_name)
+        setattr(
+            owner,
+            attribute,
+            _time_first_call(durations, phase, getattr(owner, attribute)),
+        )
+
+    def evaluate_pipeline(a: float, b: int) -> float:
+        durations["time_to_first_evaluation"] = time.perf_counter() - start
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+
+        result_path.write_text(json.dumps(durations))
+
+        # Only the cold start is of interest, so stop the worker right away
+        os._exit(0)
+
+    run(
+        evaluate_pipeline,
+        pipeline_space=_space(),
+        root_directory=directory,
+        optimizer=optimizer,
+        max_evaluations_total=sys.maxsize,
+    )
+
+
+def benchmark(
+    n_trials: int,
+    *,
+    directory: Path,
+    repeats: int = 1,
+    optimizer: str = "random_search",
+    backend: Literal["filebased", "sqlite"] = "filebased",
+    profile: Path | None = None,
+) -> list[dict[str, float]]:
+    """Time the cold start of `repeats` workers, each on a fresh copy of a state with
+    `n_trials` finished trials.
+
+    Returns:
+        For each worker, the duration of each of the `COLUMNS` in seconds.
+    """
+    template = directory / f"{backend}_{optimizer}_{n_trials}"
+    if not template.exists():
+        tmp = template.with_name(f"{template.name}_tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        make_state(tmp, n_trials, optimizer=optimizer, backend=backend)
+        tmp.rename(template)
+
+    results = []
+    for repeat in range(repeats):
+        root_directory = directory / "run"
+        shutil.rmtree(root_directory, ignore_errors=True)
+        shutil.copytree(template, root_directory)
+
+        result_path = directory / "result.json"
+        cmd = [
+            sys.executable,
+            __file__,
+            "--worker",
+            str(root_directory),
+            "--optimizer",
+            optimizer,
+            "--result",
+            str(result_path),
+        ]
+        if profile is not None:
+            profile.mkdir(parents=True, exist_ok=True)
+            profile_path = profile / f"{template.name}_{repeat}.prof"
+            cmd += ["--profile", str(profile_path)]
+
+        start = time.perf_counter()
+        subprocess.run(cmd, check=True)  # noqa: S603
+        process = time.perf_counter() - start
+
+        durations = json.loads(result_path.read_text())
+        durations["other"] = durations["time_to_first_evaluation"] - sum(
+            v for k, v in durations.items() if k != "time_to_first_evaluation"
+        )
+        durations["process"] = process
+        results.append(durations)
+
+    return results
+
+
+@pytest.mark.parametrize("backend", ["filebased", "sqlite"])
+def test_cold_start_is_timed_by_phase(
+    tmp_path: Path, backend: Literal["filebased", "sqlite"]
+) -> None:
+    (durations,) = benchmark(
+        20, directory=tmp_path, backend=backend, profile=tmp_path / "profile"
+    )
+    assert set(durations) == set(COLUMNS)
+    assert all(durations[phase] >= 0 for phase in COLUMNS)
+    assert durations["process"] >= durations["time_to_first_evaluation"]
+
+    # The worker loaded the synthetic trials rather than starting a new state
+    assert (tmp_path / "run" / "configs" / "config_21").is_dir()
+    assert (tmp_path / "profile" / f"{backend}_random_search_20_0.prof").is_file()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, nargs="+", default=[0, 1000, 10000, 50000])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--optimizer", default="random_search")
+    parser.add_argument("--backend", choices=["filebased", "sqlite"], default="filebased")
+    parser.add_argument(
+        "--directory",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "neps_cold_start_benchmark",
+    )
+    parser.add_argument("--profile", type=Path, default=None)
+    parser.add_argument("--worker", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--result", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        _worker(
+            args.worker,
+            optimizer=args.optimizer,
+            result_path=args.result,
+            profile_path=args.profile,
+        )
+        return
+
+    # Median of the repeats, in seconds
+    print(f"{'trials':>8}" + "".join(f"{c:>{len(c) + 2}}" for c in COLUMNS))  # noqa: T201
+    for n_trials in args.trials:
+        results = benchmark(
+            n_trials,
+            directory=args.directory,
+            repeats=args.repeats,
+            optimizer=args.optimizer,
+            backend=args.backend,
+            profile=args.profile,
+        )
+        medians = {c: statistics.median(r[c] for r in results) for c in COLUMNS}
+        row = "".join(f"{m:>{len(c) + 2}.3f}" for c, m in medians.items())
+        print(f"{n_trials:>8}{row}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
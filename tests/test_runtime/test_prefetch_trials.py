@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+from pytest_cases import fixture
+
+from neps.optimizers.algorithms import random_search
+from neps.optimizers.optimizer import OptimizerInfo
+from neps.runtime import DefaultWorker
+from neps.space import Float, SearchSpace
+from neps.state import (
+    DefaultReportValues,
+    NePSState,
+    OnErrorPossibilities,
+    OptimizationState,
+    SeedSnapshot,
+    Trial,
+    WorkerSettings,
+)
+
+
+@fixture
+def neps_state(tmp_path: Path) -> NePSState:
+    return NePSState.create_or_load(
+        path=tmp_path / "neps_state",
+        optimizer_info=OptimizerInfo(name="blah", info={"nothing": "here"}),
+        optimizer_state=OptimizationState(
+            budget=None,
+            seed_snapshot=SeedSnapshot.new_capture(),
+            shared_state=None,
+        ),
+    )
+
+
+def _settings(
+    *, max_evaluations_total: int | None, prefetch_trials: int
+) -> WorkerSettings:
+    return WorkerSettings(
+        on_error=OnErrorPossibilities.IGNORE,
+        default_report_values=DefaultReportValues(),
+        max_evaluations_total=max_evaluations_total,
+        include_in_progress_evaluations_towards_maximum=False,
+        max_cost_total=None,
+        max_evaluations_for_worker=None,
+        max_evaluation_time_total_seconds=None,
+        max_wallclock_time_for_worker_seconds=None,
+        max_evaluation_time_for_worker_seconds=None,
+        max_cost_for_worker=None,
+        batch_size=None,
+        prefetch_trials=prefetch_trials,
+    )
+
+
+def test_top_up_fills_pending_trials(neps_state: NePSState) -> None:
+    optimizer = random_search(pipeline_space=SearchSpace({"a": Float(0, 1)}))
+    worker = DefaultWorker.new(
+        state=neps_state,
+        optimizer=optimizer,
+        evaluation_fn=lambda a: a,
+        settings=_settings(max_evaluations_total=None, prefetch_trials=3),
+    )
+
+    while worker._top_up_pending_trials():
+        pass
+
+    trials = neps_state.lock_and_read_trials()
+    assert len(trials) == 3
+    assert all(t.metadata.state == Trial.State.PENDING for t in trials.values())
+
+
+def test_top_up_respects_max_evaluations_total(neps_state: NePSState) -> None:
+    optimizer = random_search(pipeline_space=SearchSpace({"a": Float(0, 1)}))
+    worker = DefaultWorker.new(
+        state=neps_state,
+        optimizer=optimizer,
+        evaluation_fn=lambda a: a,
+        settings=_settings(max_evaluations_total=2, prefetch_trials=5),
+    )
+
+    while worker._top_up_pending_trials():
+        pass
+
+    assert len(neps_state.lock_and_read_trials()) == 2
+
+
+def test_top_up_leaves_global_rng_and_index_alone(
+    neps_state: NePSState, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    optimizer = random_search(pipeline_space=SearchSpace({"a": Float(0, 1)}))
+    worker = DefaultWorker.new(
+        state=neps_state,
+        optimizer=optimizer,
+        evaluation_fn=lambda a: a,
+        settings=_settings(max_evaluations_total=None, prefetch_trials=2),
+    )
+    assert worker._top_up_pending_trials()
+
+    sampled_from = []
+    _sample_trial = neps_state._sample_trial
+
+    def sample_trial(*args, **kwargs):  # type: ignore[no-untyped-def]
+        sampled_from.append(kwargs["trials"])
+        return _sample_trial(*args, **kwargs)
+
+    monkeypatch.setattr(neps_state, "_sample_trial", sample_trial)
+
+    # As an evaluation would, running while the worker samples in the background
+    random.random()
+    rng_state = random.getstate()
+    assert worker._top_up_pending_trials()
+
+    assert random.getstate() == rng_state
+    assert sampled_from[0] is not neps_state._trial_index.trials
+
+    # Sampling in the foreground afterwards does not repeat the trials
+    trial = neps_state.lock_and_sample_trial(optimizer, worker_id="other")
+    configs = [t.config for t in neps_state.lock_and_read_trials().values()]
+    assert len(configs) == 3
+    assert configs.count(trial.config) == 1
+
+
+def test_worker_with_prefetching_evaluates_prefetched_trials(
+    neps_state: NePSState,
+) -> None:
+    optimizer = random_search(pipeline_space=SearchSpace({"a": Float(0, 1)}))
+    worker = DefaultWorker.new(
+        state=neps_state,
+        optimizer=optimizer,
+        evaluation_fn=lambda a: a,
+        settings=_settings(max_evaluations_total=5, prefetch_trials=2),
+    )
+    worker.run()
+
+    trials = neps_state.lock_and_read_trials()
+    assert len(trials) == 5
+    assert all(t.metadata.state == Trial.State.SUCCESS for t in trials.values())
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from pytest_cases import fixture
+
+import neps.runtime
+from neps.optimizers.algorithms import random_search
+from neps.optimizers.optimizer import OptimizerInfo
+from neps.runtime import ProcessPoolWorker
+from neps.space import Float, SearchSpace
+from neps.state import (
+    DefaultReportValues,
+    NePSState,
+    OnErrorPossibilities,
+    OptimizationState,
+    SeedSnapshot,
+    Trial,
+    WorkerSettings,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Relies on forking the evaluation function"
+)
+
+
+@pytest.fixture(autouse=True)
+def _fork(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(neps.runtime, "LOCAL_WORKERS_START_METHOD", "fork")
+
+
+@fixture
+def neps_state(tmp_path: Path) -> NePSState:
+    return NePSState.create_or_load(
+        path=tmp_path / "neps_state",
+        optimizer_info=OptimizerInfo(name="blah", info={"nothing": "here"}),
+        optimizer_state=OptimizationState(
+            budget=None,
+            seed_snapshot=SeedSnapshot.new_capture(),
+            shared_state=None,
+        ),
+    )
+
+
+def _settings(
+    *, max_evaluations_total: int, n_workers: int, prefetch_trials: int | None = None
+) -> WorkerSettings:
+    return WorkerSettings(
+        on_error=OnErrorPossibilities.IGNORE,
+        default_report_values=DefaultReportValues(),
+        max_evaluations_total=max_evaluations_total,
+        include_in_progress_evaluations_towards_maximum=True,
+        max_cost_total=None,
+        max_evaluations_for_worker=None,
+        max_evaluation_time_total_seconds=None,
+        max_wallclock_time_for_worker_seconds=None,
+        max_evaluation_time_for_worker_seconds=None,
+        max_cost_for_worker=None,
+        batch_size=None,
+        max_concurrent_evaluations=n_workers,
+        prefetch_trials=prefetch_trials,
+    )
+
+
+def _evaluate(a: float) -> dict:
+    return {"objective_to_minimize": a, "info_dict": {"pid": os.getpid()}}
+
+
+def test_process_pool_worker_evaluates_in_child_processes(
+    neps_state: NePSState,
+) -> None:
+    optimizer = random_search(pipeline_space=SearchSpace({"a": Float(0, 1)}))
+    parent = os.getpid()
+
+    def evaluation_fn(a: float) -> dict:
+        return {"objective_to_minimize": a, "info_dict": {"pid": os.getpid()}}
+
+    worker = ProcessPoolWorker.new(
+        state=neps_state,
+        optimizer=optimizer,
+        evaluation_fn=evaluation_fn,
+        settings=_settings(max_evaluations_total=6, n_workers=2),
+    )
+    worker.run()
+
+    trials = neps_state.lock_and_read_trials()
+    assert len(trials) == 6
+    for trial in trials.values():
+        assert trial.metadata.state == Trial.State.SUCCESS
+        assert trial.metadata.evaluating_worker_id == worker.worker_id
+        assert trial.report is not None
+        assert trial.report.extra["pid"] != parent
+
+
+def test_process_pool_worker_returns_trial_of_dead_child_to_pending(
+    neps_state: NePSState, tmp_path: Path
+) -> None:
+    optimizer = random_search(pipeline_space=SearchSpace({"a": Float(0, 1)}))
+    marker = tmp_path / "died"
+
+    def evaluation_fn(a: float) -> float:
+        if not marker.exists():
+            marker.touch()
+            os._exit(1)
+        return a
+
+    worker = ProcessPoolWorker.new(
+        state=neps_state,
+        optimizer=optimizer,
+        evaluation_fn=evaluation_fn,
+        settings=_settings(max_evaluations_total=3, n_workers=2),
+    )
+    worker.run()
+
+    trials = neps_state.lock_and_read_trials()
+    assert len(trials) == 3
+    assert all(t.metadata.state == Trial.State.SUCCESS for t in trials.values())
+
+
+def test_process_pool_worker_does_not_fork_while_prefetching(
+    neps_state: NePSState, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(neps.runtime, "LOCAL_WORKERS_START_METHOD", None)
+    optimizer = random_search(pipeline_space=SearchSpace({"a": Float(0, 1)}))
+    worker = ProcessPoolWorker.new(
+        state=neps_state,
+        optimizer=optimizer,
+        evaluation_fn=_evaluate,
+        settings=_settings(max_evaluations_total=4, n_workers=2, prefetch_trials=2),
+    )
+    assert worker._start_method() in ("forkserver", "spawn")
+    worker.run()
+
+    trials = neps_state.lock_and_read_trials()
+    assert len(trials) == 4
+    assert all(t.metadata.state == Trial.State.SUCCESS for t in trials.values())
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+from pytest_cases import fixture
+
+from neps.optimizers.algorithms import random_search
+from neps.optimizers.optimizer import OptimizerInfo
+from neps.runtime import DefaultWorker
+from neps.space import Float, SearchSpace
+from neps.state import (
+    DefaultReportValues,
+    NePSState,
+    OnErrorPossibilities,
+    OptimizationState,
+    SeedSnapshot,
+    Trial,
+    WorkerSettings,
+)
+
+
+@fixture
+def neps_state(tmp_path: Path) -> NePSState:
+    return NePSState.create_or_load(
+        path=tmp_path / "neps_state",
+        optimizer_info=OptimizerInfo(name="blah", info={"nothing": "here"}),
+        optimizer_state=OptimizationState(
+            budget=None,
+            seed_snapshot=SeedSnapshot.new_capture(),
+            shared_state=None,
+        ),
+    )
+
+
+def _settings() -> WorkerSettings:
+    return WorkerSettings(
+        on_error=OnErrorPossibilities.IGNORE,
+        default_report_values=DefaultReportValues(),
+        max_evaluations_total=1,
+        include_in_progress_evaluations_towards_maximum=False,
+        max_cost_total=None,
+        max_evaluations_for_worker=1,
+        max_evaluation_time_total_seconds=None,
+        max_wallclock_time_for_worker_seconds=None,
+        max_evaluation_time_for_worker_seconds=None,
+        max_cost_for_worker=None,
+        batch_size=None,
+    )
+
+
+def _strand_trial(neps_state: NePSState, optimizer) -> Trial:
+    # A worker which claims a trial and then dies without ever reporting it
+    neps_state.lock_and_sample_trial(optimizer, worker_id="dead")
+    with neps_state._trial_lock.lock():
+        index = neps_state._latest_trial_index()
+        trial = neps_state._claim_next_pending_trial(index, worker_id="dead")
+
+    assert trial is not None
+    return trial
+
+
+def test_expired_lease_returns_trial_to_pending(neps_state: NePSState) -> None:
+    optimizer = random_search(pipeline_space=SearchSpace({"a": Float(0, 1)}))
+    stranded = _strand_trial(neps_state, optimizer)
+
+    neps_state._trial_leases.duration = 0.01
+    time.sleep(0.05)
+
+    worker = DefaultWorker.new(
+        state=neps_state,
+        optimizer=optimizer,
+        evaluation_fn=lambda a: a,
+        settings=_settings(),
+    )
+    worker.run()
+
+    trials = neps_state.lock_and_read_trials()
+    assert list(trials) == [stranded.id]
+    assert trials[stranded.id].metadata.state == Trial.State.SUCCESS
+    assert trials[stranded.id].metadata.evaluating_worker_id == worker.worker_id
+    assert not neps_state._trial_leases.path(stranded.id).exists()
+
+
+def test_held_lease_is_not_reclaimed(neps_state: NePSState) -> None:
+    optimizer = random_search(pipeline_space=SearchSpace({"a": Float(0, 1)}))
+    stranded = _strand_trial(neps_state, optimizer)
+
+    worker = DefaultWorker.new(
+        state=neps_state,
+        optimizer=optimizer,
+        evaluation_fn=lambda a: a,
+        settings=_settings(),
+    )
+    worker.run()
+
+    trials = neps_state.lock_and_read_trials()
+    assert len(trials) == 2
+    assert trials[stranded.id].metadata.state == Trial.State.EVALUATING
+    assert trials[stranded.id].metadata.evaluating_worker_id == "dead"
+
+
+def test_failed_claim_releases_lease(neps_state: NePSState, monkeypatch) -> None:
+    optimizer = random_search(pipeline_space=SearchSpace({"a": Float(0, 1)}))
+    pending = neps_state.lock_and_sample_trial(optimizer, worker_id="1")
+
+    def _broken_update(*args, **kwargs) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(neps_state._trial_repo, "update_trial", _broken_update)
+    with neps_state._trial_lock.lock():
+        index = neps_state._latest_trial_index()
+        with pytest.raises(OSError, match="disk full"):
+            neps_state._claim_next_pending_trial(index, worker_id="1")
+
+    assert not neps_state._trial_leases.path(pending.id).exists()
+    assert index.oldest_pending() is not None
+
+
+def test_expired_lease_on_pending_trial_is_released(neps_state: NePSState) -> None:
+    optimizer = random_search(pipeline_space=SearchSpace({"a": Float(0, 1)}))
+    # A worker which claims a trial and dies before setting it to be evaluated
+    pending = neps_state.lock_and_sample_trial(optimizer, worker_id="dead")
+    assert neps_state._trial_leases.claim(pending.id, worker_id="dead")
+
+    neps_state._trial_leases.duration = 0.01
+    time.sleep(0.05)
+
+    worker = DefaultWorker.new(
+        state=neps_state,
+        optimizer=optimizer,
+        evaluation_fn=lambda a: a,
+        settings=_settings(),
+    )
+    worker.run()
+
+    trials = neps_state.lock_and_read_trials()
+    assert list(trials) == [pending.id]
+    assert trials[pending.id].metadata.state == Trial.State.SUCCESS
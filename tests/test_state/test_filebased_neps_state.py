@@ -8,15 +8,19 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import portalocker.portalocker as portalocker_lock_module
 import pytest
 from pytest_cases import fixture, parametrize
 
 from neps.exceptions import NePSError, TrialNotFoundError
 from neps.optimizers import OptimizerInfo
+from neps.optimizers.optimizer import SampledConfig
 from neps.state.err_dump import ErrDump
+from neps.state.filebased import FileLocker, ReaderWriterErrDump
 from neps.state.neps_state import NePSState
 from neps.state.optimizer import BudgetInfo, OptimizationState
 from neps.state.seed_snapshot import SeedSnapshot
+from neps.state.trial import Trial
 
 
 @fixture
@@ -127,3 +131,192 @@ def test_new_or_load_on_existing_neps_state_with_different_optimizer_info(
             optimizer_info=OptimizerInfo(name="randomlll", info={"e": "f"}),
             optimizer_state=optimizer_state,
         )
+
+
+def test_filebased_neps_state_reads_trials_written_by_another_state(
+    tmp_path: Path,
+    optimizer_info: OptimizerInfo,
+    optimizer_state: OptimizationState,
+) -> None:
+    new_path = tmp_path / "neps_state"
+    writer = NePSState.create_or_load(
+        path=new_path,
+        optimizer_info=optimizer_info,
+        optimizer_state=optimizer_state,
+    )
+    reader = NePSState.create_or_load(path=new_path, load_only=True)
+
+    def _sample(*, trials: Any, budget_info: Any, n: Any) -> SampledConfig:
+        return SampledConfig(id=str(len(trials) + 1), config={"a": 1})
+
+    first = writer.lock_and_sample_trial(_sample, worker_id="1")
+    assert reader.lock_and_read_trials() == {first.id: first}
+
+    second = writer.lock_and_sample_trial(_sample, worker_id="1")
+    first.set_evaluating(time_started=0, worker_id="1")
+    writer.put_updated_trial(first, hints="metadata")
+
+    trials = reader.lock_and_read_trials()
+    assert trials == {first.id: first, second.id: second}
+    assert trials[first.id].metadata.state == Trial.State.EVALUATING
+    assert reader.lock_and_get_next_pending_trial() == second
+    assert reader.lock_and_get_current_evaluating_trials() == [first]
+
+    # The trials handed out are not the dict the reader keeps updating
+    trials.clear()
+    assert reader.lock_and_read_trials().keys() == {first.id, second.id}
+
+
+def test_filebased_neps_state_reports_evaluations_together(
+    tmp_path: Path,
+    optimizer_info: OptimizerInfo,
+    optimizer_state: OptimizationState,
+) -> None:
+    new_path = tmp_path / "neps_state"
+    state = NePSState.create_or_load(
+        path=new_path,
+        optimizer_info=optimizer_info,
+        optimizer_state=optimizer_state,
+    )
+
+    def _sample(*, trials: Any, budget_info: Any, n: Any) -> SampledConfig:
+        return SampledConfig(id=str(len(trials) + 1), config={"a": 1})
+
+    trials = [state.lock_and_sample_trial(_sample, worker_id="1") for _ in range(3)]
+    evaluated = []
+    for trial in trials:
+        trial.set_evaluating(time_started=0, worker_id="1")
+        report = trial.set_complete(
+            report_as="crashed" if trial.id == "2" else "success",
+            objective_to_minimize=1.0,
+            cost=None if trial.id == "2" else float(trial.id),
+            learning_curve=None,
+            err=ValueError("broken") if trial.id == "2" else None,
+            tb=None,
+            extra=None,
+            time_end=1,
+            evaluation_duration=1,
+        )
+        evaluated.append((trial, report))
+
+    with state._trial_lock.lock():
+        state._report_trial_evaluations(evaluated, worker_id="1")
+
+    reader = NePSState.create_or_load(path=new_path, load_only=True)
+    read = reader.lock_and_read_trials()
+    assert [read[t.id].report for t in trials] == [report for _, report in evaluated]
+    assert [err.trial_id for err in reader.lock_and_get_errors().errs] == ["2"]
+
+    # The optimizer is told the cost spent so far, as kept by the trial index
+    budgets = []
+
+    def _sample_with_budget(*, trials: Any, budget_info: Any, n: Any) -> SampledConfig:
+        budgets.append(budget_info)
+        return _sample(trials=trials, budget_info=budget_info, n=n)
+
+    reader.lock_and_sample_trial(_sample_with_budget, worker_id="2")
+    if optimizer_state.budget is not None:
+        assert budgets[0].used_cost_budget == 4.0
+        assert budgets[0].used_evaluations == 3
+
+
+def test_filebased_errors_are_appended(tmp_path: Path) -> None:
+    path = tmp_path / "shared_errors.jsonl"
+    errs = [
+        ErrDump.SerializableTrialError(
+            trial_id=str(i), worker_id="1", err_type="ValueError", err="broken", tb=None
+        )
+        for i in range(3)
+    ]
+    # As written by older versions, without a trailing newline
+    ReaderWriterErrDump.write(ErrDump(errs[:1]), path)
+    path.write_text(path.read_text().rstrip("\n"))
+
+    ReaderWriterErrDump.append(errs[1:2], path)
+    ReaderWriterErrDump.append(errs[2:], path)
+    assert ReaderWriterErrDump.read(path) == ErrDump(errs)
+
+
+def test_file_locker_can_be_taken_again_by_its_thread(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # `lockf()`, which `neps.run()` may have set, never conflicts within a process
+    fcntl = pytest.importorskip("fcntl")
+    monkeypatch.setattr(portalocker_lock_module, "LOCKER", fcntl.flock)
+
+    locker = FileLocker(tmp_path / ".lock", poll=0.01, timeout=1)
+    other = FileLocker(tmp_path / ".lock", poll=0.01, timeout=0.1)
+    with locker.lock():
+        with locker.lock():
+            pass
+
+        # Leaving the inner level does not release the file
+        assert not other._try_acquire()
+
+    assert other._try_acquire()
+    other._lock.release()
+
+
+def test_filebased_neps_state_reports_a_crashed_trial(
+    tmp_path: Path,
+    optimizer_info: OptimizerInfo,
+    optimizer_state: OptimizationState,
+) -> None:
+    state = NePSState.create_or_load(
+        path=tmp_path / "neps_state",
+        optimizer_info=optimizer_info,
+        optimizer_state=optimizer_state,
+        backend="filebased",
+    )
+
+    def _sample(*, trials: Any, budget_info: Any, n: Any) -> SampledConfig:
+        return SampledConfig(id="1", config={"a": 1})
+
+    trial = state.lock_and_sample_trial(_sample, worker_id="1")
+    trial.set_evaluating(time_started=0, worker_id="1")
+    report = trial.set_complete(
+        report_as="crashed",
+        objective_to_minimize=None,
+        cost=None,
+        learning_curve=None,
+        err=ValueError("broken"),
+        tb=None,
+        extra=None,
+        time_end=1,
+        evaluation_duration=1,
+    )
+    state.lock_and_report_trial_evaluation(trial, report, worker_id="1")
+
+    assert state.lock_and_read_trials()["1"].report == report
+    assert [err.trial_id for err in state.lock_and_get_errors().errs] == ["1"]
+
+
+def test_claim_skips_the_leased_oldest_pending_trial_by_id(
+    tmp_path: Path,
+    optimizer_info: OptimizerInfo,
+    optimizer_state: OptimizationState,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    state = NePSState.create_or_load(
+        path=tmp_path / "neps_state",
+        optimizer_info=optimizer_info,
+        optimizer_state=optimizer_state,
+    )
+
+    def _sample(*, trials: Any, budget_info: Any, n: Any) -> list[SampledConfig]:
+        return [SampledConfig(id=str(i), config={"a": i}) for i in range(1, n + 1)]
+
+    state.lock_and_sample_trial(_sample, worker_id="1", n=2)
+    index = state._latest_trial_index()
+    oldest = index.oldest_pending()
+    assert oldest is not None
+    assert state._trial_leases.claim(oldest.id, worker_id="crashed")
+
+    # On a tie in the time sampled, the oldest one need not come first here
+    pendings = index.oldest_pendings(2)
+    monkeypatch.setattr(index, "oldest_pendings", lambda n: pendings[::-1][:n])
+
+    trial = state._claim_next_pending_trial(index, worker_id="1")
+    assert trial is not None
+    assert trial.id != oldest.id
+    assert trial.metadata.evaluating_worker_id == "1"
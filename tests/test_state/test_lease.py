@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from neps.state.lease import TrialLeases
+
+
+def test_lease_claim_is_exclusive(tmp_path: Path) -> None:
+    leases = TrialLeases(tmp_path / "leases", duration=10)
+
+    assert leases.claim("1", worker_id="a")
+    assert not leases.claim("1", worker_id="b")
+    assert leases.path("1").read_text() == "a"
+
+    assert leases.claim("1", worker_id="b", force=True)
+    assert leases.path("1").read_text() == "b"
+
+    leases.release("1")
+    assert not leases.path("1").exists()
+    assert not leases.renew("1")
+    assert leases.claim("1", worker_id="c")
+
+
+def test_lease_expires_unless_renewed(tmp_path: Path) -> None:
+    leases = TrialLeases(tmp_path / "leases", duration=10)
+    assert not leases.is_expired("1")
+
+    leases.claim("1", worker_id="a")
+    assert not leases.is_expired("1")
+
+    a_while_ago = time.time() - 20
+    os.utime(leases.path("1"), (a_while_ago, a_while_ago))
+    assert leases.is_expired("1")
+
+    assert leases.renew("1")
+    assert not leases.is_expired("1")
+
+    never_expiring = TrialLeases(tmp_path / "leases", duration=None)
+    os.utime(leases.path("1"), (a_while_ago, a_while_ago))
+    assert not never_expiring.is_expired("1")
+
+
+def test_lease_heartbeat_renews(tmp_path: Path) -> None:
+    leases = TrialLeases(tmp_path / "leases", duration=0.2)
+    leases.claim("1", worker_id="a")
+
+    with leases.heartbeat("1"):
+        time.sleep(0.5)
+        assert not leases.is_expired("1")
+
+    time.sleep(0.3)
+    assert leases.is_expired("1")
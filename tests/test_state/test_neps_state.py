@@ -174,6 +174,21 @@ def case_neps_state_filebased(
     )
 
 
+@parametrize("optimizer_info", [OptimizerInfo(name="blah", info={"a": "b"})])
+def case_neps_state_sqlite(tmp_path: Path, optimizer_info: OptimizerInfo) -> NePSState:
+    new_path = tmp_path / "neps_state"
+    return NePSState.create_or_load(
+        path=new_path,
+        optimizer_info=optimizer_info,
+        optimizer_state=OptimizationState(
+            budget=BudgetInfo(max_cost_total=10, used_cost_budget=0),
+            seed_snapshot=SeedSnapshot.new_capture(),
+            shared_state={},
+        ),
+        backend="sqlite",
+    )
+
+
 @parametrize_with_cases("neps_state", cases=".", prefix="case_neps_state")
 def test_sample_trial(
     neps_state: NePSState,
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from neps.state.notify import Notifier, _libc
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "poll",
+        pytest.param(
+            "inotify",
+            marks=pytest.mark.skipif(_libc() is None, reason="inotify not available"),
+        ),
+    ],
+)
+def test_watcher_sees_notifications(tmp_path: Path, method) -> None:
+    notifier = Notifier(tmp_path / ".changed")
+    with notifier.watch(poll=0.01, method=method) as watcher:
+        assert not watcher.wait(0.05)
+
+        notifier.notify()
+        assert watcher.wait(1)
+
+        # It was consumed by the previous wait
+        assert not watcher.wait(0.05)
+
+
+@pytest.mark.skipif(_libc() is None, reason="inotify not available")
+def test_inotify_watcher_wakes_up_early(tmp_path: Path) -> None:
+    notifier = Notifier(tmp_path / ".changed")
+    with notifier.watch(poll=10, method="inotify") as watcher:
+        timer = threading.Timer(0.05, notifier.notify)
+        timer.start()
+
+        start = time.monotonic()
+        assert watcher.wait(5)
+        assert time.monotonic() - start < 0.9
+        timer.join()
+
+
+def test_inotify_raises_if_unavailable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("neps.state.notify._libc", lambda: None)
+    notifier = Notifier(tmp_path / ".changed")
+    with (
+        pytest.raises(OSError, match="inotify"),
+        notifier.watch(poll=0.01, method="inotify"),
+    ):
+        pass
+
+    # Unless asked for specifically, it falls back to polling
+    with notifier.watch(poll=0.01, method="auto") as watcher:
+        notifier.notify()
+        assert watcher.wait(1)
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from neps.exceptions import NePSError, TrialAlreadyExistsError, TrialNotFoundError
+from neps.optimizers import OptimizerInfo
+from neps.optimizers.optimizer import SampledConfig
+from neps.runtime import _set_portalocker_locker
+from neps.state.err_dump import ErrDump
+from neps.state.neps_state import NePSState
+from neps.state.optimizer import BudgetInfo, OptimizationState
+from neps.state.seed_snapshot import SeedSnapshot
+from neps.state.sqlite import SQLiteDatabase
+from neps.state.trial import Trial
+
+
+@pytest.fixture
+def optimizer_info() -> OptimizerInfo:
+    return OptimizerInfo(name="blah", info={"a": "b"})
+
+
+@pytest.fixture
+def optimizer_state() -> OptimizationState:
+    return OptimizationState(
+        budget=BudgetInfo(max_cost_total=10, used_cost_budget=0),
+        seed_snapshot=SeedSnapshot.new_capture(),
+        shared_state={"a": "b"},
+    )
+
+
+def _sample(*, trials: Any, budget_info: Any, n: Any) -> SampledConfig:
+    return SampledConfig(id=str(len(trials) + 1), config={"a": 1})
+
+
+def test_create_and_load_sqlite_neps_state(
+    tmp_path: Path,
+    optimizer_info: OptimizerInfo,
+    optimizer_state: OptimizationState,
+) -> None:
+    new_path = tmp_path / "neps_state"
+    neps_state = NePSState.create_or_load(
+        path=new_path,
+        optimizer_info=optimizer_info,
+        optimizer_state=optimizer_state,
+        backend="sqlite",
+    )
+    assert (new_path / SQLiteDatabase.FILENAME).exists()
+    assert not (new_path / "optimizer_state.pkl").exists()
+
+    assert neps_state.lock_and_get_optimizer_info() == optimizer_info
+    assert neps_state.lock_and_get_optimizer_state() == optimizer_state
+    assert neps_state.lock_and_read_trials() == {}
+    assert neps_state.lock_and_get_errors() == ErrDump(errs=[])
+    assert neps_state.lock_and_get_next_pending_trial() is None
+    with pytest.raises(TrialNotFoundError):
+        neps_state.lock_and_get_trial_by_id("1")
+
+    # The backend is detected from what is on disk
+    neps_state2 = NePSState.create_or_load(path=new_path, load_only=True)
+    assert neps_state == neps_state2
+
+    with pytest.raises(NePSError):
+        NePSState.create_or_load(
+            path=new_path,
+            optimizer_info=optimizer_info,
+            optimizer_state=optimizer_state,
+            backend="filebased",
+        )
+
+
+def test_sqlite_neps_state_shares_trials_and_errors(
+    tmp_path: Path,
+    optimizer_info: OptimizerInfo,
+    optimizer_state: OptimizationState,
+) -> None:
+    new_path = tmp_path / "neps_state"
+    writer = NePSState.create_or_load(
+        path=new_path,
+        optimizer_info=optimizer_info,
+        optimizer_state=optimizer_state,
+        backend="sqlite",
+    )
+    reader = NePSState.create_or_load(path=new_path, load_only=True)
+
+    first = writer.lock_and_sample_trial(_sample, worker_id="1")
+    assert Path(first.metadata.location).is_dir()
+    assert reader.lock_and_read_trials() == {first.id: first}
+
+    second = writer.lock_and_sample_trial(_sample, worker_id="1")
+    first.set_evaluating(time_started=0, worker_id="1")
+    writer.put_updated_trial(first)
+
+    assert reader.lock_and_read_trials() == {first.id: first, second.id: second}
+    assert reader.lock_and_get_next_pending_trial() == second
+    assert reader.lock_and_get_current_evaluating_trials() == [first]
+    assert reader.lock_and_get_trial_by_id(first.id) == first
+    assert sorted(reader.all_trial_ids()) == [first.id, second.id]
+
+    with pytest.raises(TrialAlreadyExistsError):
+        writer._trial_repo.store_new_trial(second)
+
+    report = first.set_complete(
+        report_as="crashed",
+        objective_to_minimize=None,
+        cost=None,
+        learning_curve=None,
+        err=ValueError("bad"),
+        tb="traceback",
+        extra=None,
+        time_end=1,
+        evaluation_duration=1,
+    )
+    writer.lock_and_report_trial_evaluation(first, report, worker_id="1")
+
+    errs = reader.lock_and_get_errors()
+    assert len(errs) == 1
+    assert errs.errs[0].trial_id == first.id
+    assert errs.errs[0].err_type == "ValueError"
+    assert reader.lock_and_read_trials()[first.id].metadata.state == Trial.State.CRASHED
+
+
+_CREATOR = """
+import sys, time
+from pathlib import Path
+from neps.runtime import _set_portalocker_locker
+from neps.state.filebased import FileLocker
+from neps.state.optimizer import OptimizationState
+from neps.state.seed_snapshot import SeedSnapshot
+from neps.state.sqlite import SQLiteDatabase, SQLiteOptimizerRepo
+
+_set_portalocker_locker()
+path = Path(sys.argv[1])
+path.mkdir()
+lock = FileLocker(lock_path=path / ".create.lock", poll=0.01, timeout=None)
+with lock.lock():
+    database = SQLiteDatabase(path / SQLiteDatabase.FILENAME, timeout=None)
+    time.sleep(1)
+    repo = SQLiteOptimizerRepo(database)
+    repo.write_info({"name": "blah", "info": {"a": "b"}})
+    repo.write_state(
+        OptimizationState(
+            budget=None, seed_snapshot=SeedSnapshot.new_capture(), shared_state=None
+        )
+    )
+"""
+
+
+def test_sqlite_neps_state_is_loaded_once_created(
+    tmp_path: Path,
+    optimizer_info: OptimizerInfo,
+    optimizer_state: OptimizationState,
+) -> None:
+    # Lock files the same way as the creator does, as workers do
+    _set_portalocker_locker()
+
+    # Another worker is creating the state, its database exists but is still empty
+    new_path = tmp_path / "neps_state"
+    creator = subprocess.Popen([sys.executable, "-c", _CREATOR, str(new_path)])  # noqa: S603
+    try:
+        while not (new_path / SQLiteDatabase.FILENAME).exists():
+            time.sleep(0.01)
+
+        neps_state = NePSState.create_or_load(
+            path=new_path,
+            optimizer_info=optimizer_info,
+            optimizer_state=optimizer_state,
+        )
+    finally:
+        creator.wait()
+
+    assert creator.returncode == 0
+    assert neps_state.lock_and_get_optimizer_info() == optimizer_info
+    assert neps_state.lock_and_get_optimizer_state().budget is None
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+
+from neps.state.trial import Trial
+from neps.state.trial_index import TrialIndex
+
+
+def _new_trial(trial_id: str, time_sampled: float) -> Trial:
+    return Trial.new(
+        trial_id=trial_id,
+        config={"a": 1},
+        location="",
+        previous_trial=None,
+        previous_trial_location=None,
+        time_sampled=time_sampled,
+        worker_id="1",
+    )
+
+
+def _complete(trial: Trial, *, cost: float | None, duration: float) -> None:
+    trial.report = trial.set_complete(
+        report_as="success",
+        objective_to_minimize=1.0,
+        cost=cost,
+        learning_curve=None,
+        err=None,
+        tb=None,
+        extra=None,
+        time_end=trial.metadata.time_sampled + duration,
+        evaluation_duration=duration,
+    )
+
+
+def test_trial_index_oldest_pending() -> None:
+    trials = [_new_trial(str(i), time_sampled=t) for i, t in enumerate([3, 1, 2])]
+    index = TrialIndex.from_trials({t.id: t for t in trials})
+
+    assert index.oldest_pending() == trials[1]
+    assert index.oldest_pendings(2) == [trials[1], trials[2]]
+    assert index.count(Trial.State.PENDING) == 3
+
+    trials[1].set_evaluating(time_started=4, worker_id="1")
+    # Modifying in place does not change the index until it is put again
+    assert index.oldest_pending() is trials[1]
+
+    index.put(trials[1])
+    assert index.oldest_pending() == trials[2]
+    assert index.oldest_pendings(10) == [trials[2], trials[0]]
+    assert index.with_state(Trial.State.EVALUATING) == [trials[1]]
+
+    trials[2].set_evaluating(time_started=5, worker_id="1")
+    trials[0].set_evaluating(time_started=5, worker_id="1")
+    index.put_many([trials[2], trials[0]])
+    assert index.oldest_pending() is None
+    assert index.oldest_pendings(10) == []
+
+
+def test_trial_index_aggregates_are_updated_on_put() -> None:
+    a = _new_trial("a", time_sampled=0)
+    b = _new_trial("b", time_sampled=1)
+    index = TrialIndex.from_trials({"a": a, "b": b})
+    assert index.aggregates.n_started == 0
+    assert index.aggregates.n_reported == 0
+
+    a.set_evaluating(time_started=1, worker_id="1")
+    index.put(a)
+    assert index.aggregates.n_started == 1
+    assert index.aggregates.n_reported == 0
+
+    _complete(a, cost=2.0, duration=3.0)
+    index.put(a)
+    b.set_evaluating(time_started=1, worker_id="1")
+    _complete(b, cost=float("nan"), duration=1.0)
+    index.put(b)
+    assert index.aggregates.n_started == 2
+    assert index.aggregates.n_reported == 2
+    assert index.aggregates.cost_total == pytest.approx(2.0)
+    assert index.aggregates.evaluation_duration_total == pytest.approx(4.0)
+
+    # Putting the same trial again must not count it twice
+    index.put(a)
+    assert index.aggregates.n_reported == 2
+    assert index.aggregates.cost_total == pytest.approx(2.0)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+from neps.state.neps_state import TrialRepo
+from neps.state.trial import Trial
+from neps.state.trial_log import TrialLog
+
+
+def _new_trial(trial_id: str) -> Trial:
+    return Trial.new(
+        trial_id=trial_id,
+        config={"a": int(trial_id)},
+        location="",
+        previous_trial=None,
+        previous_trial_location=None,
+        time_sampled=float(trial_id),
+        worker_id="1",
+    )
+
+
+def _small_segment_repo(directory: Path) -> TrialRepo:
+    repo = TrialRepo(directory)
+    # Seal a segment after every couple of records, never compact on its own
+    repo.log.segment_max_bytes = 1
+    repo.log.compact_after_segments = 10_000
+    return repo
+
+
+def test_trial_log_rolls_segments_and_is_shared(tmp_path: Path) -> None:
+    writer = _small_segment_repo(tmp_path / "configs")
+    reader = _small_segment_repo(tmp_path / "configs")
+
+    trials = [_new_trial(str(i)) for i in range(5)]
+    for trial in trials:
+        writer.store_new_trial(trial)
+
+    assert len(list(writer.log.directory.glob("segment_*.pkl"))) > 1
+    assert reader.latest() == {t.id: t for t in trials}
+
+    trials[0].set_evaluating(time_started=1.0, worker_id="2")
+    writer.update_trial(trials[0], hints="metadata")
+
+    latest = reader.latest()
+    assert latest[trials[0].id].metadata.state == Trial.State.EVALUATING
+    assert latest == writer.latest()
+
+
+def test_trial_log_read_since_only_returns_new_updates(tmp_path: Path) -> None:
+    writer = _small_segment_repo(tmp_path / "configs")
+    reader = _small_segment_repo(tmp_path / "configs")
+
+    trials = [_new_trial(str(i)) for i in range(3)]
+    writer.store_new_trial(trials[:2])
+
+    snapshot, updates, position = reader.read_since(None)
+    assert snapshot == {}
+    assert updates == trials[:2]
+
+    snapshot, updates, position = reader.read_since(position)
+    assert snapshot is None
+    assert updates == []
+
+    writer.store_new_trial(trials[2])
+    trials[0].set_evaluating(time_started=1.0, worker_id="2")
+    writer.update_trial(trials[0], hints="metadata")
+
+    snapshot, updates, _ = reader.read_since(position)
+    assert snapshot is None
+    assert updates == [trials[2], trials[0]]
+
+
+def test_trial_log_compaction_removes_segments(tmp_path: Path) -> None:
+    writer = _small_segment_repo(tmp_path / "configs")
+    stale_reader = _small_segment_repo(tmp_path / "configs")
+
+    trials = [_new_trial(str(i)) for i in range(3)]
+    for trial in trials:
+        writer.store_new_trial(trial)
+
+    _, updates, position = stale_reader.read_since(None)
+    assert updates == trials
+
+    more_trials = [_new_trial(str(i)) for i in range(3, 6)]
+    for trial in more_trials:
+        writer.store_new_trial(trial)
+
+    proposed = writer.log.compact()
+    assert proposed is not None
+    assert writer.log.install_compaction() == proposed
+
+    manifest = writer.log.read_manifest()
+    assert manifest.next_segment == proposed.next_segment
+    assert not writer.log.segment_path(0).exists()
+
+    # The reader had only seen segments that are now compacted away
+    expected = {t.id: t for t in [*trials, *more_trials]}
+    snapshot, updates, _ = stale_reader.read_since(position)
+    assert snapshot is not None
+    assert {**snapshot, **{t.id: t for t in updates}} == expected
+
+    # A fresh reader starts directly from the snapshot
+    assert TrialRepo(tmp_path / "configs").latest() == expected
+
+
+def test_trial_log_compaction_aborts_if_segment_disappears(tmp_path: Path) -> None:
+    writer = _small_segment_repo(tmp_path / "configs")
+    for i in range(4):
+        writer.store_new_trial(_new_trial(str(i)))
+
+    # Another worker installs its compaction right before we read a segment
+    read_segment = writer.log.read_segment
+
+    def remove_then_read_segment(index: int, *args, **kwargs):  # type: ignore
+        writer.log.segment_path(index).unlink(missing_ok=True)
+        return read_segment(index, *args, **kwargs)
+
+    writer.log.read_segment = remove_then_read_segment  # type: ignore
+    assert writer.log.compact() is None
+    assert not (writer.log.directory / TrialLog.COMPACTED_FILENAME).exists()
+
+
+def test_trial_log_rebuilt_from_config_directories(tmp_path: Path) -> None:
+    repo = TrialRepo(tmp_path / "configs")
+    trials = [_new_trial(str(i)) for i in range(3)]
+    repo.store_new_trial(trials)
+
+    # Simulate a user deleting the log to edit trials by hand
+    shutil.rmtree(repo.log.directory)
+
+    assert TrialRepo(tmp_path / "configs").latest() == {t.id: t for t in trials}
+
+
+def test_trial_log_ignores_partially_written_record(tmp_path: Path) -> None:
+    log = TrialLog(tmp_path / "log")
+    log.initialize()
+
+    trial = _new_trial("1")
+    log.append(trial)
+    with log.segment_path(0).open("ab") as f:
+        f.write(b"\x80\x05\x95")  # The start of a pickle record that never finished
+
+    trials, offset = log.read_segment(0)
+    assert trials == [trial]
+    assert offset < log.segment_path(0).stat().st_size